@@ -4,6 +4,7 @@
 import sys
 import os
 import json
+import numpy as np
 from datetime import datetime
 
 # Add project path
@@ -106,6 +107,14 @@ def run_sensitivity_analysis():
         params['wind_speed'] = wind
         result = forecaster.predict(**params)
         print(f"  Wind = {wind:2d} m/s → Probability = {result['probability']:.1%}")
+    
+    # Local gradients of all nine inputs from one analytic pass
+    print("\nLocal Gradients (∂Probability/∂parameter):")
+    print("-"*20)
+    values = np.array([[base_params[name] for name in RSICalculator.INPUT_FIELDS]], dtype=float)
+    sensitivity = forecaster.predict_sensitivity(values)
+    for name, gradient in zip(sensitivity['parameters'], sensitivity['probability_gradient'][0]):
+        print(f"  {name:12s}: {gradient:+.4f} per unit")
 
 def run_batch_forecast():
     """Run batch forecast for multiple scenarios"""
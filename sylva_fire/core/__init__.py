@@ -10,10 +10,14 @@ from sylva_fire.core.rothermel import RothermelModel
 from sylva_fire.core.byram import ByramIntensity
 from sylva_fire.core.van_wagner import VanWagnerCrownFire
 from sylva_fire.core.thermodynamics import ThermodynamicContinuum
+from sylva_fire.core.elliptical_spread import EllipticalSpread
+from sylva_fire.core.crown_indices import CrownFireIndexSolver
 
 __all__ = [
     "RothermelModel",
     "ByramIntensity",
     "VanWagnerCrownFire",
     "ThermodynamicContinuum",
+    "EllipticalSpread",
+    "CrownFireIndexSolver",
 ]
@@ -3,6 +3,11 @@
 From SYLVA research paper Section 2.3
 """
 
+import numpy as np
+
+from sylva_fire.utils.classification import ThresholdClassifier
+
+
 class ByramIntensity:
     """
     Byram's fireline intensity (kW/m)
@@ -10,6 +15,11 @@ class ByramIntensity:
     I = H × w × R
     """
     
+    FIRE_BEHAVIOR_CLASSES = ThresholdClassifier(
+        edges=[500, 2000, 4000, 10000, 25000],
+        labels=["Low", "Moderate", "High", "Very High", "Extreme", "Catastrophic"]
+    )
+    
     def __init__(self):
         pass
     
@@ -26,21 +36,14 @@ class ByramIntensity:
     
     def get_fire_behavior_class(self, intensity: float) -> dict:
         """Classify fire behavior based on Byram intensity."""
-        if intensity < 500:
-            class_name = "Low"
-        elif intensity < 2000:
-            class_name = "Moderate"
-        elif intensity < 4000:
-            class_name = "High"
-        elif intensity < 10000:
-            class_name = "Very High"
-        elif intensity < 25000:
-            class_name = "Extreme"
-        else:
-            class_name = "Catastrophic"
+        class_name = self.FIRE_BEHAVIOR_CLASSES.label(intensity)
         
         return {
             "intensity_kW_m": intensity,
             "class": class_name,
             "flame_length_m": self.flame_length_from_intensity(intensity)
         }
+    
+    def get_fire_behavior_codes(self, intensity: np.ndarray) -> np.ndarray:
+        """Fire behavior class codes (uint8); labels: FIRE_BEHAVIOR_CLASSES.labels."""
+        return self.FIRE_BEHAVIOR_CLASSES.classify(intensity)
@@ -0,0 +1,122 @@
+"""Torching and crowning indices (Scott & Reinhardt 2001)
+
+Open wind speeds at which a surface fire starts torching (Van Wagner's
+critical intensity I₀) or sustains an active crown fire (R₀ = 3/CBD).
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+from sylva_fire.core.byram import ByramIntensity
+from sylva_fire.core.rothermel import RothermelModel
+from sylva_fire.core.van_wagner import VanWagnerCrownFire
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY
+
+
+class CrownFireIndexSolver:
+    """
+    Torching index (TI) and crowning index (CI) for whole grids.
+
+    TI: open wind U with I(ROS(WAF·U)) = I₀
+    CI: open wind U with 3.34 · ROS(WAF·U) = R₀
+
+    Both are found by bisection on U over all cells at once. Cells that
+    already meet the criterion in calm air get 0; cells that cannot reach
+    it below MAX_WIND_SPEED get inf.
+    """
+
+    CROWN_ROS_RATIO = 3.34          # Rothermel (1991) crown / surface ROS
+    WIND_ADJUSTMENT_FACTOR = 0.4    # open (20 ft) wind -> mid-flame wind
+    MAX_WIND_SPEED = 100.0          # m/s, upper end of the bracket
+    TOLERANCE = 0.01                # m/s
+
+    def __init__(self,
+                 rothermel: Optional[RothermelModel] = None,
+                 wind_adjustment_factor: float = WIND_ADJUSTMENT_FACTOR):
+        self.rothermel = rothermel if rothermel is not None else RothermelModel(engine="physical")
+        self.wind_adjustment_factor = wind_adjustment_factor
+        self.byram = ByramIntensity()
+        self.van_wagner = VanWagnerCrownFire()
+
+    def _fuel_energy(self, fuel_ids: Optional[np.ndarray]) -> np.ndarray:
+        """Heat content × fuel load (kJ/m²) per cell."""
+        if fuel_ids is None:
+            fuel_ids = FUEL_REGISTRY.resolve_id(self.rothermel.fuel_type)
+        else:
+            fuel_ids = FUEL_REGISTRY.clip_ids(fuel_ids)
+        terms = FUEL_REGISTRY.ROTHERMEL_TERMS
+        heat = FUEL_REGISTRY.rothermel[:, terms.index("heat_content")][fuel_ids]
+        load = FUEL_REGISTRY.rothermel[:, terms.index("net_fuel_load")][fuel_ids]
+        return heat * load
+
+    def _surface_ros(self, wind_speed, fuel_moisture, slope, fuel_ids) -> np.ndarray:
+        """Surface ROS (m/min) at open wind speed wind_speed (m/s)."""
+        return self.rothermel.calculate_rate_of_spread_array(
+            fuel_moisture, self.wind_adjustment_factor * wind_speed, slope, fuel_ids
+        )
+
+    def solve_wind_speed(self,
+                         target_ros: np.ndarray,
+                         fuel_moisture: np.ndarray,
+                         slope: np.ndarray = 0.0,
+                         fuel_ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """Open wind speed (m/s) at which surface ROS reaches target_ros (m/min)."""
+        target_ros, fuel_moisture, slope = np.broadcast_arrays(
+            np.asarray(target_ros, dtype=float),
+            np.asarray(fuel_moisture, dtype=float),
+            np.asarray(slope, dtype=float),
+        )
+        if fuel_ids is not None:
+            fuel_ids = np.broadcast_to(fuel_ids, target_ros.shape)
+
+        low = np.zeros(target_ros.shape)
+        high = np.full(target_ros.shape, self.MAX_WIND_SPEED)
+        calm = self._surface_ros(low, fuel_moisture, slope, fuel_ids) >= target_ros
+        reachable = self._surface_ros(high, fuel_moisture, slope, fuel_ids) >= target_ros
+
+        # ROS is non-decreasing in wind, so a fixed number of halvings
+        # brings every bracket below the tolerance
+        iterations = int(np.ceil(np.log2(self.MAX_WIND_SPEED / self.TOLERANCE)))
+        for _ in range(iterations):
+            mid = 0.5 * (low + high)
+            above = self._surface_ros(mid, fuel_moisture, slope, fuel_ids) >= target_ros
+            high = np.where(above, mid, high)
+            low = np.where(above, low, mid)
+
+        wind = np.where(reachable, high, np.inf)
+        return np.where(calm, 0.0, wind)
+
+    def calculate_indices(self,
+                          fuel_moisture: np.ndarray,
+                          canopy_base_height: np.ndarray,
+                          foliar_moisture: np.ndarray,
+                          canopy_bulk_density: np.ndarray,
+                          slope: np.ndarray = 0.0,
+                          fuel_ids: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Torching and crowning index (open wind, m/s) per cell.
+
+        fuel_moisture is dead fuel moisture (%), foliar_moisture in %,
+        canopy_base_height in m, canopy_bulk_density in kg/m³, slope in degrees.
+        """
+        energy = self._fuel_energy(fuel_ids)
+        critical_intensity = self.van_wagner.calculate_critical_intensity(
+            np.asarray(canopy_base_height, dtype=float),
+            np.asarray(foliar_moisture, dtype=float)
+        )
+        # I = H · w · R with R in m/s, so the torching ROS is I₀ / (H · w) · 60
+        torching_ros = 60.0 * critical_intensity / self.byram.calculate_intensity(energy, 1.0, 1.0)
+
+        cbd = np.asarray(canopy_bulk_density, dtype=float)
+        with np.errstate(divide="ignore"):
+            critical_active_ros = np.where(
+                cbd > 0, self.van_wagner.CRITICAL_MASS_FLOW_RATE / cbd, np.inf
+            )
+        crowning_ros = critical_active_ros / self.CROWN_ROS_RATIO
+
+        return {
+            "torching_index_m_s": self.solve_wind_speed(torching_ros, fuel_moisture, slope, fuel_ids),
+            "crowning_index_m_s": self.solve_wind_speed(crowning_ros, fuel_moisture, slope, fuel_ids),
+            "critical_intensity_kW_m": critical_intensity,
+            "critical_active_ros_m_min": critical_active_ros
+        }
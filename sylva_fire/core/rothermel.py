@@ -4,8 +4,11 @@ From SYLVA research paper Section 2.2 and Appendix B
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import Dict, Optional
 
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY, FuelRegistry
+
 
 class RothermelModel:
     """
@@ -14,68 +17,47 @@ class RothermelModel:
     ROS = (I_R · ξ · (1 + φ_w + φ_s)) / (ρ_b · Q_ig)
     """
     
-    def __init__(self, fuel_type: str = "pinus_halepensis"):
+    FUEL_TYPES = FUEL_REGISTRY.fuel_types
+    
+    # Rows follow FUEL_TYPES; the extra last row holds the fallback formula
+    _ROS_TABLE = np.vstack([FUEL_REGISTRY.ros_linear, FUEL_REGISTRY.ros_fallback])
+    
+    ENGINES = ("empirical", "physical")
+    
+    # Rothermel (1972) is formulated in English units
+    _KG_M2_TO_LB_FT2 = 0.204816
+    _PER_M_TO_PER_FT = 0.3048
+    _M_TO_FT = 3.28084
+    _KJ_KG_TO_BTU_LB = 0.429923
+    _KG_M3_TO_LB_FT3 = 0.0624280
+    _M_S_TO_FT_MIN = 196.850
+    _FT_TO_M = 0.3048
+    
+    TOTAL_MINERAL_CONTENT = 0.0555
+    EFFECTIVE_MINERAL_CONTENT = 0.010
+    
+    def __init__(self, fuel_type: str = "pinus_halepensis", engine: str = "empirical"):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {self.ENGINES}")
         self.fuel_type = fuel_type
+        self.engine = engine
         self._load_fuel_parameters()
+        self._fuel_terms = self._precompute_fuel_terms() if engine == "physical" else None
     
     def _load_fuel_parameters(self):
         """Load fuel-specific parameters."""
-        self.params = {
-            "pinus_halepensis": {
-                "net_fuel_load": 2.5,
-                "surface_area_volume": 3500.0,
-                "fuel_bed_depth": 0.6,
-                "moisture_of_extinction": 0.25,
-                "heat_content": 18600.0,
-                "ovendry_density": 512.0,
-                "particle_density": 1540.0,
-                "optimum_packing_ratio": 0.02
-            },
-            "quercus_ilex": {
-                "net_fuel_load": 3.2,
-                "surface_area_volume": 2800.0,
-                "fuel_bed_depth": 1.2,
-                "moisture_of_extinction": 0.30,
-                "heat_content": 18400.0,
-                "ovendry_density": 580.0,
-                "particle_density": 1540.0,
-                "optimum_packing_ratio": 0.018
-            },
-            "mediterranean_maquis": {
-                "net_fuel_load": 4.0,
-                "surface_area_volume": 4000.0,
-                "fuel_bed_depth": 1.5,
-                "moisture_of_extinction": 0.20,
-                "heat_content": 18800.0,
-                "ovendry_density": 490.0,
-                "particle_density": 1540.0,
-                "optimum_packing_ratio": 0.025
-            },
-            "dry_grassland": {
-                "net_fuel_load": 0.8,
-                "surface_area_volume": 4500.0,
-                "fuel_bed_depth": 0.4,
-                "moisture_of_extinction": 0.15,
-                "heat_content": 17200.0,
-                "ovendry_density": 320.0,
-                "particle_density": 1540.0,
-                "optimum_packing_ratio": 0.015
-            },
-            "pinus_pinaster": {
-                "net_fuel_load": 3.0,
-                "surface_area_volume": 3200.0,
-                "fuel_bed_depth": 0.7,
-                "moisture_of_extinction": 0.22,
-                "heat_content": 18500.0,
-                "ovendry_density": 540.0,
-                "particle_density": 1540.0,
-                "optimum_packing_ratio": 0.019
-            }
-        }
-        
-        if self.fuel_type not in self.params:
+        if self.fuel_type not in FUEL_REGISTRY:
             self.fuel_type = "pinus_halepensis"
-        self.fuel_params = self.params[self.fuel_type]
+        self.fuel_params = FUEL_REGISTRY.rothermel_params(self.fuel_type)
+    
+    @property
+    def params(self) -> Dict[str, Dict[str, float]]:
+        """Rothermel parameters of every registered fuel type."""
+        return {name: FUEL_REGISTRY.rothermel_params(name) for name in self.FUEL_TYPES}
+    
+    def _precompute_fuel_terms(self) -> Dict[str, np.ndarray]:
+        """Fuel-only Rothermel terms for every registered fuel type."""
+        return _physical_fuel_terms(FUEL_REGISTRY)
     
     def calculate_rate_of_spread(self, 
                                 fuel_moisture: float,
@@ -87,21 +69,150 @@ class RothermelModel:
         """
         if fuel_type is None:
             fuel_type = self.fuel_type
+        
+        if self.engine == "physical":
+            return float(self._physical_rate_of_spread(
+                fuel_moisture, wind_speed, slope, self._physical_fuel_id(fuel_type)
+            ))
             
         # Base ROS by fuel type (Mediterranean calibration)
-        ros_base = {
-            "pinus_halepensis": 5.0 + (wind_speed * 2.2) - (fuel_moisture * 0.15),
-            "quercus_ilex": 4.0 + (wind_speed * 1.8) - (fuel_moisture * 0.12),
-            "mediterranean_maquis": 6.0 + (wind_speed * 2.5) - (fuel_moisture * 0.18),
-            "dry_grassland": 8.0 + (wind_speed * 3.0) - (fuel_moisture * 0.20),
-            "pinus_pinaster": 5.5 + (wind_speed * 2.4) - (fuel_moisture * 0.16)
-        }
+        base, wind_coeff, moisture_coeff = FUEL_REGISTRY.ros_coefficients(fuel_type)
         
-        ros = ros_base.get(fuel_type, 5.0 + (wind_speed * 2.0) - (fuel_moisture * 0.1))
+        ros = base + (wind_speed * wind_coeff) - (fuel_moisture * moisture_coeff)
         ros = ros * (1 + slope * 0.05)  # Slope effect
         
         return max(1.0, ros)
     
+    def calculate_rate_of_spread_array(self,
+                                       fuel_moisture: np.ndarray,
+                                       wind_speed: np.ndarray,
+                                       slope: np.ndarray = 0.0,
+                                       fuel_ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate surface fire rate of spread (m/min) for whole grids.
+        
+        Inputs broadcast against each other. fuel_ids holds per-cell indices
+        into FUEL_TYPES; codes outside that range use the fallback formula
+        (the empirical engine) or pinus_halepensis (the physical engine).
+        Without fuel_ids every cell uses the model's fuel type.
+        """
+        fuel_moisture = np.asarray(fuel_moisture, dtype=float)
+        wind_speed = np.asarray(wind_speed, dtype=float)
+        slope = np.asarray(slope, dtype=float)
+        
+        if self.engine == "physical":
+            if fuel_ids is None:
+                fuel_ids = self._physical_fuel_id(self.fuel_type)
+            else:
+                fuel_ids = FUEL_REGISTRY.clip_ids(fuel_ids)
+            return self._physical_rate_of_spread(fuel_moisture, wind_speed, slope, fuel_ids)
+        
+        if fuel_ids is None:
+            coeffs = self._ROS_TABLE[self.fuel_id(self.fuel_type)]
+        else:
+            fuel_ids = np.asarray(fuel_ids)
+            n_fuels = len(self.FUEL_TYPES)
+            fuel_ids = np.where((fuel_ids >= 0) & (fuel_ids < n_fuels), fuel_ids, n_fuels)
+            coeffs = self._ROS_TABLE[fuel_ids]
+        
+        ros = coeffs[..., 0] + (wind_speed * coeffs[..., 1]) - (fuel_moisture * coeffs[..., 2])
+        ros = ros * (1 + slope * 0.05)  # Slope effect
+        
+        # fmax keeps the scalar max(1.0, ros) behaviour for NaN input
+        return np.fmax(1.0, ros)
+    
+    def _physical_rate_of_spread(self, fuel_moisture, wind_speed, slope, fuel_ids):
+        """
+        Rothermel (1972) rate of spread (m/min).
+        
+        fuel_moisture in percent, mid-flame wind_speed in m/s, slope in degrees.
+        """
+        terms = self._fuel_terms
+        moisture = np.asarray(fuel_moisture, dtype=float) / 100.0
+        
+        # Moisture damping coefficient ηM
+        rm = np.clip(moisture / terms["moisture_of_extinction"][fuel_ids], 0.0, 1.0)
+        eta_m = 1.0 - 2.59 * rm + 5.11 * rm ** 2 - 3.52 * rm ** 3
+        eta_m = np.where(rm >= 1.0, 0.0, eta_m)  # no spread above extinction
+        reaction_intensity = terms["dry_reaction_intensity"][fuel_ids] * eta_m
+        
+        # Wind factor, limited to U <= 0.9 · I_R (ft/min)
+        wind = np.maximum(np.asarray(wind_speed, dtype=float), 0.0) * self._M_S_TO_FT_MIN
+        wind = np.minimum(wind, 0.9 * reaction_intensity)
+        phi_w = terms["wind_coefficient"][fuel_ids] * wind ** terms["wind_exponent"][fuel_ids]
+        
+        phi_s = terms["slope_coefficient"][fuel_ids] * np.tan(np.radians(slope)) ** 2
+        
+        # Heat of pre-ignition Q_ig (BTU/lb)
+        q_ig = 250.0 + 1116.0 * moisture
+        
+        ros = (reaction_intensity * terms["propagating_flux"][fuel_ids] * (1.0 + phi_w + phi_s)
+               / (terms["dry_heat_sink"][fuel_ids] * q_ig))
+        return ros * self._FT_TO_M
+    
+    def _physical_fuel_id(self, fuel_type: str) -> int:
+        """Fuel code for the physical engine; unknown fuels use pinus_halepensis."""
+        return FUEL_REGISTRY.resolve_id(fuel_type)
+    
+    @classmethod
+    def fuel_id(cls, fuel_type: str) -> int:
+        """Return the integer fuel code used by the array API (-1 if unknown)."""
+        return FUEL_REGISTRY.fuel_id(fuel_type)
+    
     def calculate_flame_length(self, fireline_intensity: float) -> float:
         """Calculate flame length from Byram intensity (m)."""
         return 0.0775 * (fireline_intensity ** 0.46)
+
+
+@lru_cache(maxsize=None)
+def _physical_fuel_terms(registry: FuelRegistry) -> Dict[str, np.ndarray]:
+    """
+    Evaluate the fuel-only Rothermel terms once for every fuel type.
+    
+    Arrays are indexed by fuel id, so the per-call work reduces to the
+    moisture damping, wind and slope factors and the heat of ignition.
+    """
+    model = RothermelModel
+    
+    def column(key):
+        return registry.rothermel[:, registry.ROTHERMEL_TERMS.index(key)]
+    
+    sigma = column("surface_area_volume") * model._PER_M_TO_PER_FT
+    w0 = column("net_fuel_load") * model._KG_M2_TO_LB_FT2
+    depth = column("fuel_bed_depth") * model._M_TO_FT
+    heat = column("heat_content") * model._KJ_KG_TO_BTU_LB
+    rho_p = column("ovendry_density") * model._KG_M3_TO_LB_FT3
+    
+    # Packing ratio and optimum packing ratio
+    rho_b = w0 / depth
+    beta = rho_b / rho_p
+    beta_op = column("optimum_packing_ratio")
+    beta_op = np.where(np.isnan(beta_op), 3.348 * sigma ** -0.8189, beta_op)
+    beta_ratio = beta / beta_op
+    
+    # Optimum reaction velocity (1/min)
+    gamma_max = sigma ** 1.5 / (495.0 + 0.0594 * sigma ** 1.5)
+    a = 133.0 * sigma ** -0.7913
+    gamma = gamma_max * beta_ratio ** a * np.exp(a * (1.0 - beta_ratio))
+    
+    # Dry reaction intensity; the moisture damping is applied per call
+    net_load = w0 * (1.0 - model.TOTAL_MINERAL_CONTENT)
+    eta_s = min(1.0, 0.174 * model.EFFECTIVE_MINERAL_CONTENT ** -0.19)
+    
+    # Propagating flux ratio
+    xi = np.exp((0.792 + 0.681 * sigma ** 0.5) * (beta + 0.1)) / (192.0 + 0.2595 * sigma)
+    
+    # Wind factor φw = C · U^B · (β/βop)^-E
+    c = 7.47 * np.exp(-0.133 * sigma ** 0.55)
+    b = 0.02526 * sigma ** 0.54
+    e = 0.715 * np.exp(-3.59e-4 * sigma)
+    
+    return {
+        "dry_reaction_intensity": gamma * net_load * heat * eta_s,
+        "propagating_flux": xi,
+        "wind_coefficient": c * beta_ratio ** -e,
+        "wind_exponent": b,
+        "slope_coefficient": 5.275 * beta ** -0.3,
+        "dry_heat_sink": rho_b * np.exp(-138.0 / sigma),
+        "moisture_of_extinction": column("moisture_of_extinction"),
+    }
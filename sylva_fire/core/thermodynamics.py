@@ -1,10 +1,19 @@
 """Thermodynamic continuum model - Section 2.1"""
 
+import numpy as np
+from typing import Dict
+
+
 class ThermodynamicContinuum:
     """
     Thermodynamic formulation: Fuel complex as heat-moisture continuum
     """
     
+    # Heat sinks (kJ/kg); preheat = base + coefficient × moisture fraction
+    PREHEAT_BASE = 250.0
+    PREHEAT_MOISTURE_COEFFICIENT = 1116.0
+    PYROLYSIS_HEAT = 1500.0
+    
     def __init__(self):
         self.LATENT_HEAT_VAPORIZATION = 2260.0
     
@@ -12,9 +21,9 @@ class ThermodynamicContinuum:
                                 flame_heat_release: float,
                                 fuel_moisture: float = 10.0) -> dict:
         """Calculate simplified energy balance."""
-        Q_preheat = 250.0 + 1116.0 * (fuel_moisture / 100.0)
+        Q_preheat = self.PREHEAT_BASE + self.PREHEAT_MOISTURE_COEFFICIENT * (fuel_moisture / 100.0)
         Q_vaporization = self.LATENT_HEAT_VAPORIZATION * (fuel_moisture / 100.0)
-        Q_pyrolysis = 1500.0
+        Q_pyrolysis = self.PYROLYSIS_HEAT
         
         total_sink = Q_preheat + Q_pyrolysis + Q_vaporization
         
@@ -23,3 +32,54 @@ class ThermodynamicContinuum:
             "total_heat_sink_kJ_kg": total_sink,
             "energy_balance_ratio": flame_heat_release / total_sink if total_sink > 0 else 0
         }
+    
+    def calculate_energy_balance_series(self,
+                                        flame_heat_release: np.ndarray,
+                                        fuel_moisture: np.ndarray,
+                                        threshold: float = 1.0,
+                                        timestep_hours: float = 1.0) -> Dict[str, np.ndarray]:
+        """
+        Energy balance over hourly series shaped (time, cells...).
+        
+        Both inputs broadcast to a common (time, ...) shape. Exceedance
+        metrics count the steps where the ratio is above threshold; the
+        first exceedance is in hours from the start (NaN if never). An
+        empty time axis gives zero exceedance and NaN first/maximum values.
+        """
+        moisture_fraction = np.asarray(fuel_moisture, dtype=float) / 100.0
+        heat_release = np.asarray(flame_heat_release, dtype=float)
+        
+        total_sink = (self.PREHEAT_BASE + self.PYROLYSIS_HEAT
+                      + (self.PREHEAT_MOISTURE_COEFFICIENT + self.LATENT_HEAT_VAPORIZATION)
+                      * moisture_fraction)
+        heat_release, total_sink = np.broadcast_arrays(heat_release, total_sink)
+        if heat_release.ndim == 0:
+            raise ValueError("Energy balance series need a time axis (axis 0)")
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(total_sink > 0, heat_release / total_sink, 0.0)
+        
+        exceeded = ratio > threshold
+        cumulative_hours = np.cumsum(exceeded, axis=0) * timestep_hours
+        excess = np.where(exceeded, ratio - threshold, 0.0)
+        
+        if len(exceeded):
+            first_step = np.argmax(exceeded, axis=0)
+        else:
+            first_step = np.zeros(exceeded.shape[1:], dtype=np.intp)
+        first_exceedance = np.where(exceeded.any(axis=0), first_step * timestep_hours, np.nan)
+        
+        # nanmax warns on all-NaN cells and fails on an empty time axis
+        valid = ~np.isnan(ratio)
+        max_ratio = np.where(valid.any(axis=0),
+                             np.max(np.where(valid, ratio, -np.inf), axis=0, initial=-np.inf), np.nan)
+        
+        return {
+            "total_heat_sink_kJ_kg": total_sink,
+            "energy_balance_ratio": ratio,
+            "cumulative_exceedance_hours": cumulative_hours,
+            "exceedance_hours": exceeded.sum(axis=0) * timestep_hours,
+            "exceedance_integral": excess.sum(axis=0) * timestep_hours,
+            "first_exceedance_hour": first_exceedance,
+            "max_energy_balance_ratio": max_ratio
+        }
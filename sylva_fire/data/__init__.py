@@ -5,4 +5,14 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-__all__ = []
+from sylva_fire.data.fuel_models import load_fuel_models, compile_fuel_models
+from sylva_fire.data.raster import open_raster, create_raster, iter_windows, derived_cache_dir
+
+__all__ = [
+    "load_fuel_models",
+    "compile_fuel_models",
+    "open_raster",
+    "create_raster",
+    "iter_windows",
+    "derived_cache_dir",
+]
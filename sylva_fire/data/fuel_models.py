@@ -0,0 +1,214 @@
+"""Fuel model JSON loader with a compiled, memory-mapped .npz cache
+
+The data/fuel_models/*.json files are parsed once into FuelRegistry
+arrays and written to an uncompressed .npz. Later loads memory-map the
+cached arrays directly and only rebuild when a source file changes.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from typing import Dict, Optional
+
+import numpy as np
+
+from sylva_fire.utils.fuel_registry import BUILTIN_FUEL_DEFINITIONS, FuelRegistry
+from sylva_fire.utils.state import created_file_mode
+
+
+DEFAULT_FUEL_MODEL_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data",
+    "fuel_models",
+)
+
+CACHE_FORMAT_VERSION = 2
+
+# RSI scale of a calibration table -> RSI units per 0-1 RSI. Every
+# "calibration_coefficients" table must name its scale in "rsi_scale".
+CALIBRATION_RSI_SCALES = {"unit": 1.0, "percent": 100.0}
+
+# JSON key -> registry term, where the two differ
+_ROTHERMEL_KEYS = {"surface_area_volume_ratio": "surface_area_volume"}
+
+
+def _unit_scale_calibration(table: Dict, source: str) -> Dict[str, float]:
+    """Calibration betas converted to the 0-1 RSI scale used by ProbabilityCalibrator."""
+    scale = table.get("rsi_scale")
+    if scale not in CALIBRATION_RSI_SCALES:
+        raise ValueError(f"calibration_coefficients of {source} need an rsi_scale "
+                         f"of {sorted(CALIBRATION_RSI_SCALES)}, got {scale!r}")
+    factor = CALIBRATION_RSI_SCALES[scale]
+    return {
+        "beta_0": table["beta_0"],
+        "beta_1": table["beta_1"] * factor,
+        "beta_2": table["beta_2"] * factor ** 2,
+        "beta_3": table["beta_3"],
+    }
+
+
+def _fuel_definition(document: Dict, fallback: Dict) -> Dict:
+    """Merge one fuel-model JSON document over built-in defaults."""
+    definition = {
+        group: (dict(values) if isinstance(values, dict) else values)
+        for group, values in fallback.items()
+    }
+    # Older files carry no optimum packing ratio; the physical Rothermel
+    # engine then derives it from the surface-area-to-volume ratio.
+    if "rothermel_coefficients" in document:
+        definition["rothermel"]["optimum_packing_ratio"] = np.nan
+        for key, value in document["rothermel_coefficients"].items():
+            definition["rothermel"][_ROTHERMEL_KEYS.get(key, key)] = value
+    if "rsi_weights" in document:
+        definition["rsi_weights"].update(document["rsi_weights"])
+    if "calibration_coefficients" in document:
+        definition["calibration"].update(_unit_scale_calibration(
+            document["calibration_coefficients"], document.get("fuel_type", "fuel model")))
+    if "lfm" in document.get("critical_thresholds", {}):
+        definition["lfm_critical"] = document["critical_thresholds"]["lfm"]
+    return definition
+
+
+def compile_fuel_models(source_dir: str) -> FuelRegistry:
+    """Parse every *.json fuel model in source_dir into a FuelRegistry."""
+    documents = {}
+    for filename in sorted(os.listdir(source_dir)):
+        if filename.endswith(".json"):
+            with open(os.path.join(source_dir, filename), "r", encoding="utf-8") as fh:
+                document = json.load(fh)
+            documents[document.get("fuel_type", filename[:-5])] = document
+
+    # Built-in fuels keep their ids; fuels only known from JSON are appended
+    default = BUILTIN_FUEL_DEFINITIONS[FuelRegistry.DEFAULT_FUEL]
+    definitions = {}
+    for name in list(BUILTIN_FUEL_DEFINITIONS) + sorted(set(documents) - set(BUILTIN_FUEL_DEFINITIONS)):
+        fallback = BUILTIN_FUEL_DEFINITIONS.get(name, default)
+        definitions[name] = _fuel_definition(documents.get(name, {}), fallback)
+    return FuelRegistry.from_definitions(definitions)
+
+
+def _source_manifest(source_dir: str) -> Dict[str, np.ndarray]:
+    """File names, mtimes and sizes of the JSON sources."""
+    names = sorted(f for f in os.listdir(source_dir) if f.endswith(".json"))
+    stats = [os.stat(os.path.join(source_dir, name)) for name in names]
+    return {
+        "source_names": np.array(names, dtype="U"),
+        "source_mtime_ns": np.array([st.st_mtime_ns for st in stats], dtype=np.int64),
+        "source_size": np.array([st.st_size for st in stats], dtype=np.int64),
+    }
+
+
+def _builtin_hash() -> str:
+    """Digest of the built-in tables, which fill in fuels and terms the JSON files omit."""
+    text = json.dumps(BUILTIN_FUEL_DEFINITIONS, sort_keys=True)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _source_hashes(source_dir: str, names) -> np.ndarray:
+    digests = []
+    for name in names:
+        with open(os.path.join(source_dir, str(name)), "rb") as fh:
+            digests.append(hashlib.sha256(fh.read()).hexdigest())
+    return np.array(digests, dtype="U64")
+
+
+def _open_npz_mmap(path: str) -> Dict[str, np.ndarray]:
+    """
+    Memory-map every member of an uncompressed .npz.
+
+    np.load ignores mmap_mode for .npz archives, so the member offsets
+    are located through the zip headers instead.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as fh:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path} member {info.filename} is compressed")
+            # Local file header: 30 fixed bytes + file name + extra field
+            fh.seek(info.header_offset + 26)
+            name_len, extra_len = np.frombuffer(fh.read(4), dtype="<u2")
+            fh.seek(info.header_offset + 30 + int(name_len) + int(extra_len))
+            version = np.lib.format.read_magic(fh)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fh)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fh)
+            key = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if not shape or 0 in shape:
+                # Scalars and empty arrays are read directly
+                count = int(np.prod(shape))
+                arrays[key] = np.frombuffer(fh.read(count * dtype.itemsize), dtype=dtype).reshape(shape)
+                continue
+            arrays[key] = np.memmap(
+                path, dtype=dtype, mode="r", offset=fh.tell(), shape=shape,
+                order="F" if fortran_order else "C",
+            )
+    return arrays
+
+
+def _write_cache(cache_path: str, arrays: Dict[str, np.ndarray]):
+    """Atomically write the cache; failures (e.g. read-only installs) are ignored."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".npz")
+        with os.fdopen(fd, "wb") as fh:
+            np.savez(fh, **arrays)
+        # mkstemp creates 0600; the cache is shared with other users' workers
+        os.chmod(tmp_path, created_file_mode())
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def load_fuel_models(source_dir: Optional[str] = None,
+                     cache_path: Optional[str] = None,
+                     use_cache: bool = True) -> FuelRegistry:
+    """
+    Load fuel-model JSON files as a FuelRegistry, using the compiled cache.
+
+    The cache is reused while every source file keeps its mtime and size
+    and the built-in tables are unchanged.
+    Files whose mtime changed are hashed; if the content is unchanged only
+    the stored mtimes are refreshed, otherwise the cache is rebuilt.
+    """
+    if source_dir is None:
+        source_dir = DEFAULT_FUEL_MODEL_DIR
+    if not use_cache:
+        return compile_fuel_models(source_dir)
+    if cache_path is None:
+        cache_path = os.path.join(source_dir, "__pycache__", "fuel_models.npz")
+
+    manifest = _source_manifest(source_dir)
+    manifest["builtin_sha256"] = np.array(_builtin_hash(), dtype="U64")
+    cached = None
+    if os.path.exists(cache_path):
+        try:
+            cached = _open_npz_mmap(cache_path)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            cached = None
+
+    if cached is not None and "format_version" in cached \
+            and int(cached["format_version"]) == CACHE_FORMAT_VERSION \
+            and "builtin_sha256" in cached \
+            and str(cached["builtin_sha256"]) == str(manifest["builtin_sha256"]) \
+            and np.array_equal(cached["source_names"], manifest["source_names"]):
+        if np.array_equal(cached["source_mtime_ns"], manifest["source_mtime_ns"]) \
+                and np.array_equal(cached["source_size"], manifest["source_size"]):
+            return FuelRegistry.from_arrays(cached)
+
+        hashes = _source_hashes(source_dir, manifest["source_names"])
+        if np.array_equal(cached["source_sha256"], hashes):
+            # Touched but unchanged: refresh the manifest, keep the tables
+            registry = FuelRegistry.from_arrays({k: np.array(v) for k, v in cached.items()})
+            _write_cache(cache_path, dict(registry.as_arrays(), **manifest,
+                                          source_sha256=hashes,
+                                          format_version=CACHE_FORMAT_VERSION))
+            return registry
+
+    registry = compile_fuel_models(source_dir)
+    _write_cache(cache_path, dict(registry.as_arrays(), **manifest,
+                                  source_sha256=_source_hashes(source_dir, manifest["source_names"]),
+                                  format_version=CACHE_FORMAT_VERSION))
+    return registry
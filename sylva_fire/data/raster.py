@@ -0,0 +1,127 @@
+"""Memory-mapped raster I/O and windowed iteration
+
+Rasters are single-band 2-D grids stored either as .npy files or as raw
+binary with a JSON sidecar header (<path>.json) giving shape and dtype.
+Both are opened as memory maps so large scenes are processed window by
+window instead of being loaded whole.
+"""
+
+import hashlib
+import json
+import os
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+
+HEADER_SUFFIX = ".json"
+
+
+def _header_path(path: str) -> str:
+    return path + HEADER_SUFFIX
+
+
+def read_raster_header(path: str) -> dict:
+    """Sidecar header of a raw raster: shape, dtype, offset and nodata."""
+    with open(_header_path(path), "r", encoding="utf-8") as fh:
+        header = json.load(fh)
+    header.setdefault("offset", 0)
+    header.setdefault("nodata", None)
+    return header
+
+
+def raster_nodata(path: str) -> Optional[float]:
+    """Nodata value from a raw raster's header; .npy rasters carry none."""
+    if path.endswith(".npy"):
+        return None
+    return read_raster_header(path)["nodata"]
+
+
+def open_raster(path: str, mode: str = "r") -> np.ndarray:
+    """Memory-map an existing .npy or raw (+ sidecar) raster."""
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode=mode)
+    header = read_raster_header(path)
+    return np.memmap(path, dtype=np.dtype(header["dtype"]), mode=mode,
+                     offset=header["offset"], shape=tuple(header["shape"]))
+
+
+def create_raster(path: str,
+                  shape: Tuple[int, int],
+                  dtype=np.float32,
+                  nodata: Optional[float] = None) -> np.ndarray:
+    """Create a raster on disk and return it as a writable memory map."""
+    dtype = np.dtype(dtype)
+    if path.endswith(".npy"):
+        return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=tuple(shape))
+    header = {"shape": list(shape), "dtype": dtype.str, "offset": 0, "nodata": nodata}
+    with open(_header_path(path), "w", encoding="utf-8") as fh:
+        json.dump(header, fh)
+    return np.memmap(path, dtype=dtype, mode="w+", shape=tuple(shape))
+
+
+def derived_cache_dir(source_path: str, name: str, *settings) -> str:
+    """
+    Cache directory for products derived from a source raster.
+
+    Lives in __pycache__ next to the source and is keyed on the source's
+    mtime and size plus the given settings, so any change starts a new cache.
+    """
+    st = os.stat(source_path)
+    key = ":".join([str(st.st_mtime_ns), str(st.st_size)] + [repr(value) for value in settings])
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(os.path.dirname(os.path.abspath(source_path)), "__pycache__",
+                        f"{name}_{stem}_{digest}")
+
+
+def cache_manifest(source_path: str, **settings) -> dict:
+    """Manifest identifying a derived product: source path, mtime, size and settings."""
+    st = os.stat(source_path)
+    manifest = {"source_path": os.path.abspath(source_path),
+                "source_mtime_ns": st.st_mtime_ns, "source_size": st.st_size}
+    manifest.update(settings)
+    # Round-trip through JSON so tuples and lists compare equal to a stored copy
+    return json.loads(json.dumps(manifest))
+
+
+def manifest_matches(manifest_path: str, manifest: dict) -> bool:
+    """True when manifest_path exists and records exactly manifest."""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as fh:
+            return json.load(fh) == manifest
+    except (OSError, ValueError):
+        return False
+
+
+def write_manifest(manifest_path: str, manifest: dict):
+    """Write a cache manifest under a temporary name and rename it into place."""
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh)
+    os.replace(tmp_path, manifest_path)
+
+
+def iter_windows(shape: Tuple[int, int],
+                 tile_shape: Tuple[int, int] = (1024, 1024),
+                 halo: int = 0) -> Iterator[Tuple[tuple, tuple, tuple]]:
+    """
+    Yield (window, padded, inner) slice tuples covering a 2-D grid.
+
+    window is the tile in the output grid, padded the same tile grown by
+    halo cells (clipped at the grid edges) for reading inputs, and inner
+    selects window from a block read with padded.
+    """
+    rows, cols = shape
+    tile_rows, tile_cols = tile_shape
+    for r0 in range(0, rows, tile_rows):
+        r1 = min(r0 + tile_rows, rows)
+        pr0, pr1 = max(r0 - halo, 0), min(r1 + halo, rows)
+        for c0 in range(0, cols, tile_cols):
+            c1 = min(c0 + tile_cols, cols)
+            pc0, pc1 = max(c0 - halo, 0), min(c1 + halo, cols)
+            yield (
+                (slice(r0, r1), slice(c0, c1)),
+                (slice(pr0, pr1), slice(pc0, pc1)),
+                (slice(r0 - pr0, r1 - pr0), slice(c0 - pc0, c1 - pc0)),
+            )
@@ -1,8 +1,9 @@
 """Crown Fire Probability and Transition Model"""
 
-import numpy as np
 from typing import Dict
 
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY
+
 class CrownFireProbabilityModel:
     """
     Calculate probability of surface-to-crown fire transition.
@@ -12,19 +13,8 @@ class CrownFireProbabilityModel:
     
     def __init__(self):
         # Critical thresholds for Mediterranean species
-        self.cbd_thresholds = {
-            'pinus_halepensis': 0.10,
-            'pinus_pinaster': 0.12,
-            'quercus_ilex': 0.15,
-            'mediterranean_maquis': 0.18
-        }
-        
-        self.cbh_thresholds = {
-            'pinus_halepensis': 4.0,
-            'pinus_pinaster': 5.0,
-            'quercus_ilex': 3.0,
-            'mediterranean_maquis': 1.5
-        }
+        self.cbd_thresholds = FUEL_REGISTRY.crown_threshold_dict("cbd")
+        self.cbh_thresholds = FUEL_REGISTRY.crown_threshold_dict("cbh")
     
     def calculate_crown_fire_probability(self,
                                         surface_intensity: float,
@@ -10,6 +10,7 @@ from sylva_fire.integration.confidence_estimator import ConfidenceEstimator
 from sylva_fire.core.rothermel import RothermelModel
 from sylva_fire.core.byram import ByramIntensity
 from sylva_fire.core.van_wagner import VanWagnerCrownFire
+from sylva_fire.utils.classification import ThresholdClassifier
 
 
 class RapidSpreadForecaster:
@@ -27,6 +28,15 @@ class RapidSpreadForecaster:
         "imminent": (0.8, 1.0)
     }
     
+    # Probabilities outside [0, 1) (and NaN) fall back to "normal"
+    HAZARD_CLASSES = ThresholdClassifier(
+        edges=[low for low, _ in THRESHOLDS.values()][1:],
+        labels=list(THRESHOLDS),
+        lower=0.0,
+        upper=1.0,
+        fill_code=0
+    )
+    
     def __init__(self, fuel_type: str = "pinus_halepensis"):
         self.fuel_type = fuel_type
         self.rsi_calculator = RSICalculator(fuel_type)
@@ -103,6 +113,30 @@ class RapidSpreadForecaster:
             "timestamp": datetime.now().isoformat()
         }
     
+    def predict_sensitivity(self, values: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Probability, RSI and their local gradients for a batch of cells.
+        
+        values is a (rows × 9) array in RSICalculator.INPUT_FIELDS order
+        (NaN = missing) or a structured array. Gradients are (rows × 9),
+        per raw input unit, through the clipped normalizations, the RSI
+        weighting and the logistic calibration. Confidence only changes
+        in steps, so it is held fixed.
+        """
+        matrix = self.rsi_calculator.as_matrix(values)
+        rsi, rsi_gradient = self.rsi_calculator.rsi_gradient_array(matrix)
+        confidence = self.confidence_estimator.estimate_array(matrix)
+        probability, d_probability = self.calibrator.probability_gradient(rsi, confidence)
+        
+        return {
+            "probability": probability,
+            "confidence": confidence,
+            "rsi": rsi,
+            "rsi_gradient": rsi_gradient,
+            "probability_gradient": rsi_gradient * d_probability[:, None],
+            "parameters": RSICalculator.INPUT_FIELDS
+        }
+    
     def _estimate_lead_time(self, probability: float) -> int:
         """Estimate early warning lead time in minutes."""
         if probability >= 0.8:
@@ -116,10 +150,11 @@ class RapidSpreadForecaster:
     
     def _get_hazard_level(self, probability: float) -> str:
         """Get hazard level from probability."""
-        for level, (low, high) in self.THRESHOLDS.items():
-            if low <= probability < high:
-                return level
-        return "normal"
+        return self.HAZARD_CLASSES.label(probability)
+    
+    def get_hazard_codes(self, probability: np.ndarray) -> np.ndarray:
+        """Hazard level codes (uint8) for a probability array; labels: HAZARD_CLASSES.labels."""
+        return self.HAZARD_CLASSES.classify(probability)
     
     def get_decision_support(self, probability: float) -> Dict:
         """Get decision support recommendations."""
@@ -8,9 +8,19 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from sylva_fire.integration.rsi_calculator import RSICalculator
 from sylva_fire.integration.probability_calibration import ProbabilityCalibrator
 from sylva_fire.integration.confidence_estimator import ConfidenceEstimator
+from sylva_fire.integration.isotonic_recalibration import IsotonicRecalibrator
+from sylva_fire.integration.online_calibration import OnlineCalibrationUpdater
+from sylva_fire.integration.calibration_fitting import fit_calibration, write_calibration_coefficients
+from sylva_fire.integration.weight_fitting import fit_rsi_weight_table, write_rsi_weights
 
 __all__ = [
     "RSICalculator",
     "ProbabilityCalibrator",
     "ConfidenceEstimator",
+    "IsotonicRecalibrator",
+    "OnlineCalibrationUpdater",
+    "fit_calibration",
+    "write_calibration_coefficients",
+    "fit_rsi_weight_table",
+    "write_rsi_weights",
 ]
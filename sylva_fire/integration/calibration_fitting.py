@@ -0,0 +1,169 @@
+"""Fitting of the quadratic logistic probability calibration
+
+Estimates β₀..β₃ of P(RS) = 1 / (1 + e^-(β₀ + β₁·RSI + β₂·RSI² + β₃·C))
+from archives of (RSI, confidence, outcome) records by iteratively
+reweighted least squares, one fuel type per worker process, and writes
+the result back to the fuel-model JSON files.
+"""
+
+import json
+import os
+import stat
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY, FuelRegistry
+from sylva_fire.utils.state import created_file_mode
+
+
+CALIBRATION_TERMS = FuelRegistry.CALIBRATION_TERMS
+
+# Fuels with fewer records (or only one outcome class) are not refitted
+MIN_RECORDS = 50
+
+
+def design_matrix(rsi: np.ndarray, confidence: np.ndarray) -> np.ndarray:
+    """Columns [1, RSI, RSI², C] of the calibration model."""
+    rsi = np.asarray(rsi, dtype=float).reshape(-1)
+    confidence = np.broadcast_to(np.asarray(confidence, dtype=float), rsi.shape)
+    return np.column_stack([np.ones_like(rsi), rsi, rsi * rsi, confidence])
+
+
+def fit_logistic_irls(rsi: np.ndarray,
+                      confidence: np.ndarray,
+                      outcome: np.ndarray,
+                      max_iter: int = 50,
+                      tol: float = 1e-8,
+                      ridge: float = 1e-6) -> Dict[str, float]:
+    """
+    Fit β₀..β₃ by IRLS (Newton-Raphson on the log-likelihood).
+
+    outcome holds 0/1 rapid-spread observations. A small ridge term keeps
+    the normal equations solvable for separable or collinear data.
+    """
+    X = design_matrix(rsi, confidence)
+    y = np.asarray(outcome, dtype=float).reshape(-1)
+    beta = np.zeros(X.shape[1])
+    beta[0] = np.log((y.mean() + 0.5 / len(y)) / (1.0 - y.mean() + 0.5 / len(y)))
+    penalty = ridge * np.eye(X.shape[1])
+    penalty[0, 0] = 0.0
+
+    for _ in range(max_iter):
+        p = 1.0 / (1.0 + np.exp(-(X @ beta)))
+        w = np.clip(p * (1.0 - p), 1e-10, None)
+        hessian = (X * w[:, None]).T @ X + penalty
+        gradient = X.T @ (y - p) - penalty @ beta
+        step = np.linalg.solve(hessian, gradient)
+        beta += step
+        if np.max(np.abs(step)) < tol:
+            break
+
+    return {term: float(value) for term, value in zip(CALIBRATION_TERMS, beta)}
+
+
+def _fit_group(args) -> Dict[str, float]:
+    rsi, confidence, outcome = args
+    return fit_logistic_irls(rsi, confidence, outcome)
+
+
+def fuel_groups(fuel_ids: np.ndarray, outcome: np.ndarray) -> List[Tuple[str, np.ndarray]]:
+    """
+    (fuel type, row indices) for every fuel id worth fitting.
+
+    Records are grouped with one sort. Unknown ids, fuel types with fewer
+    than MIN_RECORDS records and groups with a single outcome class are
+    skipped.
+    """
+    order = np.argsort(fuel_ids, kind="stable")
+    ids, starts, counts = np.unique(fuel_ids[order], return_index=True, return_counts=True)
+
+    groups = []
+    for fuel_id, start, count in zip(ids, starts, counts):
+        if not 0 <= fuel_id < len(FUEL_REGISTRY) or count < MIN_RECORDS:
+            continue
+        rows = order[start:start + count]
+        if outcome[rows].min() == outcome[rows].max():
+            continue
+        groups.append((FUEL_REGISTRY.fuel_types[fuel_id], rows))
+    return groups
+
+
+def fit_calibration(rsi: np.ndarray,
+                    confidence: np.ndarray,
+                    outcome: np.ndarray,
+                    fuel_ids: np.ndarray,
+                    workers: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Fit calibration coefficients for every fuel type present in fuel_ids.
+
+    Records are grouped by fuel_groups; each group is fitted in its own
+    process (workers=1 fits in-process).
+    """
+    rsi = np.asarray(rsi, dtype=float).reshape(-1)
+    confidence = np.broadcast_to(np.asarray(confidence, dtype=float), rsi.shape)
+    outcome = np.asarray(outcome, dtype=float).reshape(-1)
+    fuel_ids = np.asarray(fuel_ids).reshape(-1)
+
+    names, groups = [], []
+    for fuel_type, rows in fuel_groups(fuel_ids, outcome):
+        names.append(fuel_type)
+        groups.append((rsi[rows], confidence[rows], outcome[rows]))
+
+    if workers == 1 or len(groups) <= 1:
+        results = [_fit_group(group) for group in groups]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_fit_group, groups))
+    return dict(zip(names, results))
+
+
+def write_fuel_model_tables(tables: Dict[str, Dict[str, object]], key: str, model_dir: str):
+    """
+    Store one table per fuel as <key> in <model_dir>/<fuel>.json.
+
+    Other keys of existing files are kept and their permissions preserved;
+    missing files are created. model_dir is required so fitted tables
+    never land in the shipped fuel-model directory by accident. The
+    compiled fuel-model cache notices the change on its next load.
+    """
+    os.makedirs(model_dir, exist_ok=True)
+
+    for fuel_type, table in tables.items():
+        path = os.path.join(model_dir, f"{fuel_type}.json")
+        document = {"fuel_type": fuel_type}
+        mode = created_file_mode()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as fh:
+                document = json.load(fh)
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        document[key] = dict(table)
+
+        # The .tmp suffix keeps partial or leftover files out of the *.json scan
+        fd, tmp_path = tempfile.mkstemp(dir=model_dir, suffix=".json.tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(document, fh, indent=2, ensure_ascii=False)
+                fh.write("\n")
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def write_calibration_coefficients(coefficients: Dict[str, Dict[str, float]], model_dir: str):
+    """
+    Store coefficients as "calibration_coefficients" in <model_dir>/<fuel>.json.
+
+    Fitted betas are on the 0-1 RSI scale and are tagged rsi_scale "unit",
+    so the loader never mixes them with percent-scale tables.
+    """
+    tables = {
+        fuel_type: dict({term: round(float(betas[term]), 6) for term in CALIBRATION_TERMS},
+                        rsi_scale="unit")
+        for fuel_type, betas in coefficients.items()
+    }
+    write_fuel_model_tables(tables, "calibration_coefficients", model_dir)
@@ -3,10 +3,18 @@
 import numpy as np
 from typing import Dict
 
+from sylva_fire.utils.classification import ThresholdClassifier
+
 
 class ConfidenceEstimator:
     """Estimate forecast confidence based on data quality."""
     
+    CONFIDENCE_CLASSES = ThresholdClassifier(
+        edges=[0.35, 0.50, 0.65, 0.75],
+        labels=["Very Low", "Low", "Moderate", "High", "Very High"],
+        fill_code=0
+    )
+    
     def __init__(self):
         self.weights = {
             "data_completeness": 0.50,
@@ -54,15 +62,38 @@ class ConfidenceEstimator:
         
         return np.clip(confidence, 0.2, 0.9)
     
+    def estimate_array(self, values: np.ndarray) -> np.ndarray:
+        """
+        estimate() for a (rows × 9) array in RSICalculator.INPUT_FIELDS order.
+        
+        NaN marks a missing parameter.
+        """
+        values = np.asarray(values, dtype=float).reshape(-1, 9)
+        lfm, dfm, cbd, wind_speed = values[:, 0], values[:, 1], values[:, 2], values[:, 5]
+        
+        present_cbd = ~np.isnan(cbd)
+        present = (~np.isnan(lfm)).astype(float) + ~np.isnan(dfm) + ~np.isnan(wind_speed) + present_cbd
+        completeness = present / (3.0 + present_cbd)
+        
+        # NaN comparisons are False, so missing values add no penalty
+        with np.errstate(invalid="ignore"):
+            penalties = 0.2 * (((lfm < 30) | (lfm > 200)).astype(float)
+                               + ((dfm < 1) | (dfm > 30))
+                               + ((wind_speed < 0) | (wind_speed > 40)))
+        quality = np.maximum(0.4, 0.8 - penalties)
+        model_uncertainty = 0.7
+        
+        confidence = (0.5 * completeness +
+                     0.3 * quality +
+                     0.2 * model_uncertainty)
+        confidence = 0.4 + (confidence * 0.4)
+        
+        return np.clip(confidence, 0.2, 0.9)
+    
     def categorize_confidence(self, confidence: float) -> str:
         """Categorize confidence level."""
-        if confidence >= 0.75:
-            return "Very High"
-        elif confidence >= 0.65:
-            return "High"
-        elif confidence >= 0.50:
-            return "Moderate"
-        elif confidence >= 0.35:
-            return "Low"
-        else:
-            return "Very Low"
+        return self.CONFIDENCE_CLASSES.label(confidence)
+    
+    def categorize_confidence_codes(self, confidence: np.ndarray) -> np.ndarray:
+        """Confidence class codes (uint8); labels: CONFIDENCE_CLASSES.labels."""
+        return self.CONFIDENCE_CLASSES.classify(confidence)
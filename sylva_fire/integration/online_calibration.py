@@ -0,0 +1,95 @@
+"""Online recalibration of the rapid spread probability coefficients
+
+Recursive Bayesian (Laplace) update of β₀..β₃: the current coefficients
+and their precision act as a Gaussian prior for each new batch of
+confirmed outcomes, so the archive never has to be re-read.
+"""
+
+import numpy as np
+from typing import Dict
+
+from sylva_fire.integration.calibration_fitting import CALIBRATION_TERMS, design_matrix
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY
+from sylva_fire.utils.state import load_state, save_state
+
+
+class OnlineCalibrationUpdater:
+    """
+    Incremental logistic calibration for one fuel type.
+
+    Each update maximizes  log L(batch) - ½ (β - β_prev)ᵀ P (β - β_prev)
+    by Newton steps and keeps the Hessian at the optimum as the new
+    precision P. forgetting < 1 scales P down before each batch so older
+    seasons gradually lose weight.
+    """
+
+    STATE_KIND = "online_calibration"
+    STATE_VERSION = 1
+
+    def __init__(self,
+                 fuel_type: str = "pinus_halepensis",
+                 prior_precision: float = 1.0,
+                 forgetting: float = 1.0):
+        self.fuel_type = fuel_type
+        coefficients = FUEL_REGISTRY.calibration_dict(fuel_type)
+        self.beta = np.array([coefficients[term] for term in CALIBRATION_TERMS])
+        self.precision = prior_precision * np.eye(len(CALIBRATION_TERMS))
+        self.forgetting = forgetting
+        self.version = 0
+        self.n_records = 0
+
+    @property
+    def coefficients(self) -> Dict[str, float]:
+        return {term: float(value) for term, value in zip(CALIBRATION_TERMS, self.beta)}
+
+    def update(self,
+               rsi: np.ndarray,
+               confidence: np.ndarray,
+               outcome: np.ndarray,
+               newton_steps: int = 20,
+               tol: float = 1e-8) -> Dict[str, float]:
+        """Fold a batch of (RSI, confidence, 0/1 outcome) records into the coefficients."""
+        X = design_matrix(rsi, confidence)
+        y = np.asarray(outcome, dtype=float).reshape(-1)
+        prior_beta = self.beta
+        prior_precision = self.forgetting * self.precision
+
+        beta = prior_beta.copy()
+        for _ in range(newton_steps):
+            p = 1.0 / (1.0 + np.exp(-(X @ beta)))
+            w = p * (1.0 - p)
+            hessian = (X * w[:, None]).T @ X + prior_precision
+            gradient = X.T @ (y - p) - prior_precision @ (beta - prior_beta)
+            step = np.linalg.solve(hessian, gradient)
+            beta = beta + step
+            if np.max(np.abs(step)) < tol:
+                break
+
+        p = 1.0 / (1.0 + np.exp(-(X @ beta)))
+        self.precision = (X * (p * (1.0 - p))[:, None]).T @ X + prior_precision
+        self.beta = beta
+        self.version += 1
+        self.n_records += len(y)
+        return self.coefficients
+
+    def save(self, path: str):
+        """Atomically write the coefficients, precision and version."""
+        save_state(path, self.STATE_KIND, self.STATE_VERSION, {
+            "fuel_type": np.array(self.fuel_type),
+            "beta": self.beta,
+            "precision": self.precision,
+            "forgetting": np.array(self.forgetting),
+            "version": np.array(self.version),
+            "n_records": np.array(self.n_records),
+        })
+
+    @classmethod
+    def load(cls, path: str) -> "OnlineCalibrationUpdater":
+        """Resume from a state file written by save()."""
+        state = load_state(path, cls.STATE_KIND, cls.STATE_VERSION)
+        updater = cls(str(state["fuel_type"]), forgetting=float(state["forgetting"]))
+        updater.beta = state["beta"]
+        updater.precision = state["precision"]
+        updater.version = int(state["version"])
+        updater.n_records = int(state["n_records"])
+        return updater
@@ -1,7 +1,13 @@
 """Probability calibration for rapid spread forecasting"""
 
+import os
 import numpy as np
-from typing import Dict
+from typing import Dict, Optional, Tuple
+
+from sylva_fire.integration.calibration_fitting import fit_logistic_irls
+from sylva_fire.integration.isotonic_recalibration import IsotonicRecalibrator
+from sylva_fire.integration.online_calibration import OnlineCalibrationUpdater
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY
 
 
 class ProbabilityCalibrator:
@@ -9,21 +15,22 @@ class ProbabilityCalibrator:
     Calibrate RSI to rapid spread probability.
     
     P(RS) = 1 / (1 + e^-(β₀ + β₁·RSI + β₂·RSI² + β₃·C))
+    
+    An optional isotonic recalibrator corrects the logistic output.
     """
     
-    def __init__(self, fuel_type: str = "pinus_halepensis"):
+    def __init__(self,
+                 fuel_type: str = "pinus_halepensis",
+                 recalibrator: Optional[IsotonicRecalibrator] = None):
         self.fuel_type = fuel_type
         self.coefficients = self._load_coefficients()
+        self.recalibrator = recalibrator
+        self.coefficients_version = 0
+        self._state_key = None
     
     def _load_coefficients(self) -> Dict:
         """Load calibration coefficients."""
-        coeffs = {
-            "pinus_halepensis": {"beta_0": -4.8, "beta_1": 9.2, "beta_2": -4.1, "beta_3": 1.4},
-            "quercus_ilex": {"beta_0": -4.5, "beta_1": 8.7, "beta_2": -3.8, "beta_3": 1.3},
-            "mediterranean_maquis": {"beta_0": -4.3, "beta_1": 8.5, "beta_2": -3.6, "beta_3": 1.2},
-            "dry_grassland": {"beta_0": -3.9, "beta_1": 7.8, "beta_2": -3.2, "beta_3": 1.1}
-        }
-        return coeffs.get(self.fuel_type, coeffs["pinus_halepensis"])
+        return FUEL_REGISTRY.calibration_dict(self.fuel_type)
     
     def calibrate_probability(self, rsi: float, confidence: float = 1.0) -> float:
         """Convert RSI to calibrated probability."""
@@ -35,4 +42,69 @@ class ProbabilityCalibrator:
         logit = beta_0 + beta_1 * rsi + beta_2 * (rsi ** 2) + beta_3 * confidence
         probability = 1.0 / (1.0 + np.exp(-logit))
         
+        if self.recalibrator is not None:
+            probability = self.recalibrator.transform(probability)
+        
         return np.clip(probability, 0.0, 1.0)
+    
+    def probability_gradient(self, rsi: np.ndarray, confidence: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calibrated probability and ∂probability/∂RSI for arrays.
+        
+        ∂p/∂RSI = p(1 - p)(β₁ + 2β₂·RSI), times the slope of the isotonic
+        stage when one is set. The final [0, 1] clip never binds.
+        """
+        rsi = np.asarray(rsi, dtype=float)
+        beta_0 = self.coefficients["beta_0"]
+        beta_1 = self.coefficients["beta_1"]
+        beta_2 = self.coefficients["beta_2"]
+        beta_3 = self.coefficients["beta_3"]
+        
+        logit = beta_0 + beta_1 * rsi + beta_2 * (rsi ** 2) + beta_3 * np.asarray(confidence, dtype=float)
+        probability = 1.0 / (1.0 + np.exp(-logit))
+        gradient = probability * (1.0 - probability) * (beta_1 + 2.0 * beta_2 * rsi)
+        
+        if self.recalibrator is not None:
+            gradient = gradient * self.recalibrator.derivative(probability)
+            probability = self.recalibrator.transform(probability)
+        
+        return np.clip(probability, 0.0, 1.0), gradient
+    
+    def fit(self, rsi: np.ndarray, confidence: np.ndarray, outcome: np.ndarray) -> Dict:
+        """Fit this fuel type's coefficients to (RSI, confidence, 0/1 outcome) records."""
+        self.coefficients = fit_logistic_irls(rsi, confidence, outcome)
+        return self.coefficients
+    
+    def fit_recalibration(self,
+                          rsi: np.ndarray,
+                          confidence: np.ndarray,
+                          outcome: np.ndarray) -> IsotonicRecalibrator:
+        """Fit the isotonic stage on historical outcomes of the logistic forecasts."""
+        self.recalibrator = None
+        probability = self.calibrate_probability(np.asarray(rsi, dtype=float), np.asarray(confidence, dtype=float))
+        self.recalibrator = IsotonicRecalibrator().fit(probability, outcome)
+        return self.recalibrator
+    
+    def reload_coefficients(self, state_path: str) -> bool:
+        """
+        Hot-swap coefficients from an OnlineCalibrationUpdater state file.
+        
+        Only re-reads the file when its inode, size or mtime changed (each
+        save renames a new file into place, so the inode changes even within
+        the filesystem's mtime resolution); returns True when new
+        coefficients were installed.
+        """
+        status = os.stat(state_path)
+        state_key = (status.st_ino, status.st_size, status.st_mtime_ns)
+        if state_key == self._state_key:
+            return False
+        updater = OnlineCalibrationUpdater.load(state_path)
+        if updater.fuel_type != self.fuel_type:
+            raise ValueError(f"{state_path} holds coefficients for '{updater.fuel_type}', "
+                             f"not '{self.fuel_type}'")
+        self._state_key = state_key
+        if updater.version == self.coefficients_version:
+            return False
+        self.coefficients = updater.coefficients
+        self.coefficients_version = updater.version
+        return True
@@ -1,7 +1,9 @@
 """Rapid Spread Index (RSI) Calculator"""
 
 import numpy as np
-from typing import Dict
+from typing import Dict, Optional, Tuple
+
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY
 
 
 class RSICalculator:
@@ -11,31 +13,33 @@ class RSICalculator:
     RSI = Σ(αᵢ × Pᵢ_norm)
     """
     
+    # Column order of the batch API; raw input names, then RSI weight names
+    INPUT_FIELDS = ("lfm", "dfm", "cbd", "sfl", "fbd", "wind_speed", "vpd", "aspect", "drought_code")
+    PARAMETERS = FUEL_REGISTRY.RSI_PARAMETERS
+    
+    # Normalization per column, shared by normalize_parameters and the
+    # array paths: ("negative", p10, p100), ("positive", p90, p0) or ("aspect",)
+    NORMALIZATION = (
+        ("negative", 70.0, 200.0),
+        ("negative", 6.0, 30.0),
+        ("positive", 0.20, 0.0),
+        ("positive", 40.0, 0.0),
+        ("positive", 0.6, 0.0),
+        ("positive", 10.0, 0.0),
+        ("positive", 30.0, 0.0),
+        ("aspect",),
+        ("positive", 400.0, 0.0),
+    )
+    
+    BATCH_ROWS = 1 << 20
+    
     def __init__(self, fuel_type: str = "pinus_halepensis"):
         self.fuel_type = fuel_type
         self.weights = self._get_weights()
     
     def _get_weights(self) -> Dict:
         """Get fuel type-specific weights."""
-        weights = {
-            "pinus_halepensis": {
-                "lfm": 0.20, "dfm": 0.15, "cbd": 0.12, "sfl": 0.10,
-                "fbd": 0.08, "wind": 0.15, "vpd": 0.08, "aspect": 0.06, "dc": 0.06
-            },
-            "quercus_ilex": {
-                "lfm": 0.18, "dfm": 0.14, "cbd": 0.14, "sfl": 0.12,
-                "fbd": 0.10, "wind": 0.14, "vpd": 0.07, "aspect": 0.05, "dc": 0.06
-            },
-            "mediterranean_maquis": {
-                "lfm": 0.22, "dfm": 0.16, "cbd": 0.10, "sfl": 0.08,
-                "fbd": 0.06, "wind": 0.16, "vpd": 0.09, "aspect": 0.07, "dc": 0.06
-            },
-            "dry_grassland": {
-                "lfm": 0.15, "dfm": 0.18, "cbd": 0.08, "sfl": 0.12,
-                "fbd": 0.10, "wind": 0.18, "vpd": 0.10, "aspect": 0.04, "dc": 0.05
-            }
-        }
-        return weights.get(self.fuel_type, weights["pinus_halepensis"])
+        return FUEL_REGISTRY.rsi_weight_dict(self.fuel_type)
     
     def normalize_negative(self, value: float, p10: float, p100: float) -> float:
         """Normalize parameters with negative correlation."""
@@ -62,24 +66,15 @@ class RSICalculator:
         """Normalize all parameters to 0-1 scale."""
         normalized = {}
         
-        if "lfm" in parameters:
-            normalized["lfm"] = self.normalize_negative(parameters["lfm"], 70.0, 200.0)
-        if "dfm" in parameters:
-            normalized["dfm"] = self.normalize_negative(parameters["dfm"], 6.0, 30.0)
-        if "cbd" in parameters:
-            normalized["cbd"] = self.normalize_positive(parameters["cbd"], 0.20)
-        if "sfl" in parameters:
-            normalized["sfl"] = self.normalize_positive(parameters["sfl"], 40.0)
-        if "fbd" in parameters:
-            normalized["fbd"] = self.normalize_positive(parameters["fbd"], 0.6)
-        if "wind_speed" in parameters:
-            normalized["wind"] = self.normalize_positive(parameters["wind_speed"], 10.0)
-        if "vpd" in parameters:
-            normalized["vpd"] = self.normalize_positive(parameters["vpd"], 30.0)
-        if "aspect" in parameters:
-            normalized["aspect"] = self.normalize_aspect(parameters["aspect"])
-        if "drought_code" in parameters:
-            normalized["dc"] = self.normalize_positive(parameters["drought_code"], 400.0)
+        for field, param, rule in zip(self.INPUT_FIELDS, self.PARAMETERS, self.NORMALIZATION):
+            if field not in parameters:
+                continue
+            if rule[0] == "negative":
+                normalized[param] = self.normalize_negative(parameters[field], *rule[1:])
+            elif rule[0] == "positive":
+                normalized[param] = self.normalize_positive(parameters[field], *rule[1:])
+            else:
+                normalized[param] = self.normalize_aspect(parameters[field])
         
         return normalized
     
@@ -112,3 +107,125 @@ class RSICalculator:
                 contributions[param] = (weight * value) / rsi
         
         return contributions
+    
+    def as_matrix(self, values: np.ndarray) -> np.ndarray:
+        """(rows × 9) float64 array, columns in INPUT_FIELDS order, from plain or structured input."""
+        values = np.asarray(values)
+        if values.dtype.names is None:
+            return np.asarray(values, dtype=float).reshape(-1, len(self.INPUT_FIELDS))
+        matrix = np.full((values.size, len(self.INPUT_FIELDS)), np.nan)
+        for i, (field, param) in enumerate(zip(self.INPUT_FIELDS, self.PARAMETERS)):
+            name = field if field in values.dtype.names else param
+            if name in values.dtype.names:
+                matrix[:, i] = values[name].reshape(-1)
+        return matrix
+    
+    def normalize_array(self, values: np.ndarray) -> np.ndarray:
+        """
+        Normalize a (rows × 9) array, or a structured array, to 0-1 per column.
+        
+        Columns follow INPUT_FIELDS; structured arrays may name fields by
+        INPUT_FIELDS or PARAMETERS, and absent fields count as missing.
+        NaN (missing) stays NaN.
+        """
+        matrix = self.as_matrix(values)
+        normalized = np.empty_like(matrix)
+        for i, rule in enumerate(self.NORMALIZATION):
+            column = matrix[:, i]
+            if rule[0] == "negative":
+                _, p10, p100 = rule
+                norm = (p100 - column) / (p100 - p10)
+            elif rule[0] == "positive":
+                _, p90, p0 = rule
+                norm = (column - p0) / (p90 - p0)
+            else:
+                norm = (1 + np.cos(np.radians(column) - np.radians(225.0))) / 2
+            normalized[:, i] = np.clip(norm, 0.0, 1.0)
+        return normalized
+    
+    def normalize_gradient_array(self, values: np.ndarray) -> np.ndarray:
+        """
+        ∂Pᵢ_norm/∂valueᵢ for a (rows × 9) or structured array.
+        
+        Zero where the normalization is clipped to 0 or 1 and where the
+        value is missing (NaN); aspect is per degree.
+        """
+        matrix = self.as_matrix(values)
+        gradient = np.zeros_like(matrix)
+        for i, rule in enumerate(self.NORMALIZATION):
+            column = matrix[:, i]
+            if rule[0] == "negative":
+                _, p10, p100 = rule
+                norm = (p100 - column) / (p100 - p10)
+                slope = np.full_like(column, -1.0 / (p100 - p10))
+            elif rule[0] == "positive":
+                _, p90, p0 = rule
+                norm = (column - p0) / (p90 - p0)
+                slope = np.full_like(column, 1.0 / (p90 - p0))
+            else:
+                angle = np.radians(column) - np.radians(225.0)
+                norm = (1 + np.cos(angle)) / 2
+                slope = -np.sin(angle) / 2 * (np.pi / 180.0)
+            with np.errstate(invalid="ignore"):
+                inside = (norm > 0.0) & (norm < 1.0)
+            gradient[:, i] = np.where(inside, slope, 0.0)
+        return gradient
+    
+    def calculate_rsi_array(self,
+                            values: np.ndarray,
+                            fuel_ids: Optional[np.ndarray] = None,
+                            normalized: bool = False) -> np.ndarray:
+        """
+        Rapid Spread Index for many rows at once.
+        
+        Same semantics as normalize_parameters + calculate_rsi: each row is
+        renormalized by the weights of its non-missing (non-NaN) columns,
+        and rows with nothing present get 0.5. Columns are accumulated in
+        the same order as the dict path, so results are bit-identical.
+        fuel_ids selects per-row registry weights (unknown ids use
+        pinus_halepensis); otherwise the calculator's fuel type is used.
+        """
+        matrix = self.as_matrix(values)
+        if fuel_ids is not None:
+            fuel_ids = FUEL_REGISTRY.clip_ids(np.asarray(fuel_ids).reshape(-1))
+        row_weights = np.array([self.weights[param] for param in self.PARAMETERS])
+        
+        rsi = np.empty(len(matrix))
+        for start in range(0, len(matrix), self.BATCH_ROWS):
+            stop = start + self.BATCH_ROWS
+            block = matrix[start:stop] if normalized else self.normalize_array(matrix[start:stop])
+            weights = row_weights if fuel_ids is None else FUEL_REGISTRY.rsi_weights[fuel_ids[start:stop]]
+            
+            weighted_sum = np.zeros(len(block))
+            total_weight = np.zeros(len(block))
+            for i in range(len(self.PARAMETERS)):
+                present = ~np.isnan(block[:, i])
+                weight = weights[..., i]
+                weighted_sum += np.where(present, weight * block[:, i], 0.0)
+                total_weight += np.where(present, weight, 0.0)
+            
+            with np.errstate(invalid="ignore", divide="ignore"):
+                block_rsi = np.where(total_weight > 0, weighted_sum / total_weight, 0.5)
+            rsi[start:stop] = np.clip(block_rsi, 0.0, 1.0)
+        
+        return rsi
+    
+    def rsi_gradient_array(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        RSI and ∂RSI/∂value (rows × 9, per raw input unit) in one pass.
+        
+        With W the weight of a row's present columns, RSI is a convex
+        combination of the present Pⱼ_norm, so the final clip never binds and
+            ∂RSI/∂valueᵢ = αᵢ / W · ∂Pᵢ_norm/∂valueᵢ
+        Missing columns and rows with nothing present get zero gradient.
+        """
+        matrix = self.as_matrix(values)
+        normalized = self.normalize_array(matrix)
+        rsi = self.calculate_rsi_array(normalized, normalized=True)
+        
+        weights = np.array([self.weights[param] for param in self.PARAMETERS])
+        total_weight = ~np.isnan(normalized) @ weights
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scale = np.where(total_weight > 0, 1.0 / total_weight, 0.0)
+        gradient = self.normalize_gradient_array(matrix) * weights * scale[:, None]
+        return rsi, gradient
@@ -0,0 +1,154 @@
+"""Fitting of the per-fuel RSI weights
+
+Estimates the nine weights αᵢ of RSI = Σ(αᵢ × Pᵢ_norm) / Σαᵢ against
+observed rapid-spread events, holding the fuel's probability calibration
+fixed. The mean log-loss of the calibrated probability is minimized by
+projected gradient descent on the simplex (αᵢ >= 0, Σαᵢ = 1) with
+analytic gradients, and the result is written back to the fuel-model
+JSON files.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+from sylva_fire.integration.calibration_fitting import CALIBRATION_TERMS, fuel_groups, write_fuel_model_tables
+from sylva_fire.integration.rsi_calculator import RSICalculator
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY
+
+
+RSI_PARAMETERS = FUEL_REGISTRY.RSI_PARAMETERS
+
+
+def project_to_simplex(values: np.ndarray) -> np.ndarray:
+    """Euclidean projection onto {w : w >= 0, Σw = 1} (sort-based)."""
+    values = np.asarray(values, dtype=float)
+    ordered = np.sort(values)[::-1]
+    cumulative = np.cumsum(ordered) - 1.0
+    index = np.arange(1, len(values) + 1)
+    rho = np.nonzero(ordered - cumulative / index > 0)[0][-1]
+    return np.maximum(values - cumulative[rho] / (rho + 1), 0.0)
+
+
+def rsi_log_loss(weights: np.ndarray,
+                 normalized: np.ndarray,
+                 confidence: np.ndarray,
+                 outcome: np.ndarray,
+                 calibration: Mapping[str, float]) -> Tuple[float, np.ndarray]:
+    """
+    Mean log-loss of the calibrated probability and its gradient in the weights.
+
+    normalized is the (rows × 9) output of RSICalculator.normalize_array
+    (NaN = missing). With W = Σ present αⱼ, each row's RSI is a convex
+    combination of its present columns, so the [0, 1] clip never binds and
+        ∂RSI/∂αᵢ = present_i · (Pᵢ - RSI) / W
+        ∂L/∂RSI  = (p - y) · (β₁ + 2β₂·RSI)
+    Rows with no present column have RSI = 0.5 and zero gradient.
+    """
+    beta_0, beta_1, beta_2, beta_3 = (calibration[term] for term in CALIBRATION_TERMS)
+    present = ~np.isnan(normalized)
+    values = np.where(present, normalized, 0.0)
+
+    total_weight = present @ weights
+    covered = total_weight > 0
+    safe_total = np.where(covered, total_weight, 1.0)
+    rsi = np.where(covered, (values @ weights) / safe_total, 0.5)
+
+    logit = beta_0 + beta_1 * rsi + beta_2 * rsi * rsi + beta_3 * confidence
+    # log(1 + e^z) - y·z, evaluated without overflow
+    loss = np.mean(np.logaddexp(0.0, logit) - outcome * logit)
+
+    p = 1.0 / (1.0 + np.exp(-logit))
+    d_rsi = np.where(covered, (p - outcome) * (beta_1 + 2.0 * beta_2 * rsi) / safe_total, 0.0)
+    gradient = (d_rsi @ values - (d_rsi * rsi) @ present) / len(rsi)
+    return float(loss), gradient
+
+
+def fit_rsi_weights(values: np.ndarray,
+                    confidence: np.ndarray,
+                    outcome: np.ndarray,
+                    fuel_type: str = "pinus_halepensis",
+                    calibration: Optional[Mapping[str, float]] = None,
+                    normalized: bool = False,
+                    max_iter: int = 500,
+                    tol: float = 1e-7) -> Dict[str, float]:
+    """
+    Fit one fuel type's RSI weights to (parameters, confidence, 0/1 outcome) records.
+
+    values is a (rows × 9) or structured array as accepted by
+    RSICalculator.calculate_rsi_array (already normalized if normalized).
+    The fuel's registry weights are the starting point and its registry
+    calibration is used unless calibration is given. Steps are
+    backtracked until the projected point decreases the loss.
+    """
+    calculator = RSICalculator(fuel_type)
+    matrix = calculator.as_matrix(values)
+    if not normalized:
+        matrix = calculator.normalize_array(matrix)
+    confidence = np.broadcast_to(np.asarray(confidence, dtype=float), (len(matrix),))
+    outcome = np.asarray(outcome, dtype=float).reshape(-1)
+    if calibration is None:
+        calibration = FUEL_REGISTRY.calibration_dict(fuel_type)
+
+    weights = project_to_simplex([calculator.weights[param] for param in RSI_PARAMETERS])
+    loss, gradient = rsi_log_loss(weights, matrix, confidence, outcome, calibration)
+    step = 1.0
+    for _ in range(max_iter):
+        while True:
+            candidate = project_to_simplex(weights - step * gradient)
+            delta = candidate - weights
+            candidate_loss, candidate_gradient = rsi_log_loss(candidate, matrix, confidence, outcome, calibration)
+            # Sufficient decrease for projected gradient (Armijo along the projection arc)
+            if candidate_loss <= loss + gradient @ delta + delta @ delta / (2.0 * step) or step < 1e-12:
+                break
+            step *= 0.5
+        weights, loss, gradient = candidate, candidate_loss, candidate_gradient
+        if np.max(np.abs(delta)) < tol:
+            break
+        step *= 2.0
+
+    return {param: float(weight) for param, weight in zip(RSI_PARAMETERS, weights)}
+
+
+def _fit_group(args) -> Dict[str, float]:
+    matrix, confidence, outcome, fuel_type = args
+    return fit_rsi_weights(matrix, confidence, outcome, fuel_type, normalized=True)
+
+
+def fit_rsi_weight_table(values: np.ndarray,
+                         confidence: np.ndarray,
+                         outcome: np.ndarray,
+                         fuel_ids: np.ndarray,
+                         workers: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Fit RSI weights for every fuel type present in fuel_ids.
+
+    Rows are normalized once, grouped by fuel_groups and fitted one fuel
+    type per process (workers=1 fits in-process).
+    """
+    matrix = RSICalculator().normalize_array(values)
+    confidence = np.broadcast_to(np.asarray(confidence, dtype=float), (len(matrix),))
+    outcome = np.asarray(outcome, dtype=float).reshape(-1)
+    fuel_ids = np.asarray(fuel_ids).reshape(-1)
+
+    names, groups = [], []
+    for fuel_type, rows in fuel_groups(fuel_ids, outcome):
+        names.append(fuel_type)
+        groups.append((matrix[rows], confidence[rows], outcome[rows], fuel_type))
+
+    if workers == 1 or len(groups) <= 1:
+        results = [_fit_group(group) for group in groups]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_fit_group, groups))
+    return dict(zip(names, results))
+
+
+def write_rsi_weights(weights: Dict[str, Dict[str, float]], model_dir: str):
+    """Store weights as "rsi_weights" in <model_dir>/<fuel>.json."""
+    tables = {
+        fuel_type: {param: round(float(table[param]), 6) for param in RSI_PARAMETERS}
+        for fuel_type, table in weights.items()
+    }
+    write_fuel_model_tables(tables, "rsi_weights", model_dir)
@@ -10,6 +10,10 @@ from sylva_fire.parameters.fuel_structure import FuelStructureCalculator
 from sylva_fire.parameters.atmospheric import AtmosphericCalculator
 from sylva_fire.parameters.terrain import TerrainCalculator
 from sylva_fire.parameters.drought import DroughtCodeCalculator
+from sylva_fire.parameters.dead_fuel_moisture import DeadFuelMoistureModel
+from sylva_fire.parameters.fwi import FireWeatherIndexSystem
+from sylva_fire.parameters.fire_danger_indices import FireDangerIndexCalculator
+from sylva_fire.parameters.solar import SolarRadiationCalculator
 
 __all__ = [
     "FuelMoistureCalculator",
@@ -17,4 +21,8 @@ __all__ = [
     "AtmosphericCalculator",
     "TerrainCalculator",
     "DroughtCodeCalculator",
+    "DeadFuelMoistureModel",
+    "FireWeatherIndexSystem",
+    "FireDangerIndexCalculator",
+    "SolarRadiationCalculator",
 ]
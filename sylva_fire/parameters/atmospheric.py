@@ -1,39 +1,129 @@
 """Atmospheric parameters - Wind, VPD"""
 
 import numpy as np
-from typing import Dict
+from typing import Dict, Tuple
+
+from sylva_fire.data.raster import create_raster, iter_windows, open_raster
+from sylva_fire.utils.classification import ThresholdClassifier
 
 
 class AtmosphericCalculator:
     """Calculate atmospheric parameters."""
     
+    VPD_HAZARD_CLASSES = ThresholdClassifier(
+        edges=[5, 10, 15, 25, 35],
+        labels=["Very Low", "Low", "Moderate", "High", "Very High", "Extreme"]
+    )
+    
+    # Stepwise wind adjustment factor by canopy cover class
+    CANOPY_COVER_CLASSES = ThresholdClassifier(
+        edges=[0.2, 0.5, 0.8],
+        labels=["Open", "Sparse", "Moderate", "Dense"]
+    )
+    WIND_ADJUSTMENT_TABLE = np.array([0.6, 0.4, 0.25, 0.15])
+    
+    WIND_ADJUSTMENT_METHODS = ("step", "sheltered")
+    TEN_METRE_TO_TWENTY_FOOT = 1.0 / 1.15
+    M_TO_FT = 3.28084
+    
     def calculate_wind_adjustment_factor(self, canopy_cover: float) -> float:
         """Calculate canopy wind reduction factor."""
-        if canopy_cover < 0.2:
-            return 0.6
-        elif canopy_cover < 0.5:
-            return 0.4
-        elif canopy_cover < 0.8:
-            return 0.25
-        else:
-            return 0.15
+        return float(self.WIND_ADJUSTMENT_TABLE[self.CANOPY_COVER_CLASSES.code(canopy_cover)])
+    
+    def calculate_wind_adjustment_array(self,
+                                        canopy_cover: np.ndarray,
+                                        method: str = "step",
+                                        canopy_height: np.ndarray = 10.0,
+                                        crown_ratio: np.ndarray = 0.5,
+                                        fuel_bed_depth: np.ndarray = 0.6) -> np.ndarray:
+        """
+        Wind adjustment factor (float32) for canopy cover grids.
+        
+        "step" uses the stepwise table of calculate_wind_adjustment_factor;
+        "sheltered" the continuous Albini & Baughman (1979) formulas
+        (Andrews 2012): with crown fill f = cover · crown_ratio / 3,
+        WAF = 0.555 / (√(f·H) · ln((20 + 0.36H) / 0.13H)) under canopy and
+        WAF = 1.83 / ln((20 + 0.36δ) / 0.13δ) for unsheltered fuel
+        (f <= 0.05), with H and δ in feet.
+        """
+        if method not in self.WIND_ADJUSTMENT_METHODS:
+            raise ValueError(f"Unknown method '{method}', expected one of {self.WIND_ADJUSTMENT_METHODS}")
+        
+        canopy_cover = np.asarray(canopy_cover)
+        if method == "step":
+            codes = self.CANOPY_COVER_CLASSES.classify(canopy_cover)
+            return self.WIND_ADJUSTMENT_TABLE.astype(np.float32)[codes]
+        
+        cover = canopy_cover.astype(np.float32)
+        height = np.float32(self.M_TO_FT) * np.asarray(canopy_height, dtype=np.float32)
+        depth = np.float32(self.M_TO_FT) * np.asarray(fuel_bed_depth, dtype=np.float32)
+        crown_fill = cover * np.asarray(crown_ratio, dtype=np.float32) / np.float32(3.0)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sheltered = 0.555 / (np.sqrt(crown_fill * height)
+                                 * np.log((20.0 + 0.36 * height) / (0.13 * height)))
+            unsheltered = 1.83 / np.log((20.0 + 0.36 * depth) / (0.13 * depth))
+        waf = np.where(crown_fill > 0.05, sheltered, unsheltered)
+        return np.clip(waf, 0.0, 1.0).astype(np.float32, copy=False)
+    
+    def calculate_midflame_wind(self,
+                                wind_speed: np.ndarray,
+                                canopy_cover: np.ndarray,
+                                method: str = "step",
+                                **canopy) -> np.ndarray:
+        """
+        Mid-flame wind speed (float32, units of wind_speed) from 10 m wind.
+        
+        The 10 m wind is reduced to 20 ft (÷ 1.15) before the adjustment
+        factor is applied; wind direction is not changed by the reduction.
+        canopy takes the canopy_height, crown_ratio and fuel_bed_depth
+        arguments of calculate_wind_adjustment_array.
+        """
+        waf = self.calculate_wind_adjustment_array(canopy_cover, method, **canopy)
+        wind_20ft = np.asarray(wind_speed, dtype=np.float32) * np.float32(self.TEN_METRE_TO_TWENTY_FOOT)
+        return wind_20ft * waf
+    
+    def calculate_midflame_wind_raster(self,
+                                       wind_speed_path: str,
+                                       canopy_cover_path: str,
+                                       midflame_wind_path: str,
+                                       method: str = "step",
+                                       tile_shape: Tuple[int, int] = (1024, 1024),
+                                       **canopy):
+        """
+        Stream 10 m wind and canopy cover rasters into a mid-flame wind raster.
+        
+        Rasters are .npy or raw with a sidecar header (see sylva_fire.data.raster).
+        canopy_height, crown_ratio and fuel_bed_depth may each be a scalar,
+        a raster path or a grid of the wind raster's shape (e.g. the
+        FuelStructureCalculator layers); grids are windowed like canopy
+        cover. The wind direction raster can be reused unchanged.
+        """
+        wind = open_raster(wind_speed_path)
+        cover = open_raster(canopy_cover_path)
+        layers = {}
+        for name, value in canopy.items():
+            layer = open_raster(value) if isinstance(value, str) else np.asarray(value)
+            if layer.ndim and layer.shape != wind.shape:
+                raise ValueError(f"{name} has shape {layer.shape}, expected {wind.shape}")
+            layers[name] = layer
+        out = create_raster(midflame_wind_path, wind.shape, np.float32)
+        
+        for window, _, _ in iter_windows(wind.shape, tile_shape):
+            canopy_window = {name: layer[window] if layer.ndim else layer for name, layer in layers.items()}
+            out[window] = self.calculate_midflame_wind(wind[window], cover[window], method, **canopy_window)
+        
+        out.flush()
     
     def classify_vpd_hazard(self, vpd: float) -> Dict:
         """Classify VPD hazard level."""
-        if vpd < 5:
-            level = "Very Low"
-        elif vpd < 10:
-            level = "Low"
-        elif vpd < 15:
-            level = "Moderate"
-        elif vpd < 25:
-            level = "High"
-        elif vpd < 35:
-            level = "Very High"
-        else:
-            level = "Extreme"
+        level = self.VPD_HAZARD_CLASSES.label(vpd)
         
         return {
             "vpd_hPa": vpd,
             "hazard_level": level
         }
+    
+    def classify_vpd_codes(self, vpd: np.ndarray) -> np.ndarray:
+        """VPD hazard class codes (uint8); labels: VPD_HAZARD_CLASSES.labels."""
+        return self.VPD_HAZARD_CLASSES.classify(vpd)
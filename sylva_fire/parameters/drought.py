@@ -1,12 +1,25 @@
 """Drought Code calculations"""
 
 import numpy as np
-from typing import Dict
+from typing import Dict, Optional
+
+from sylva_fire.utils.classification import ThresholdClassifier
+from sylva_fire.utils.state import load_state, save_state
 
 
 class DroughtCodeCalculator:
     """Calculate Canadian Drought Code."""
     
+    DC_HAZARD_CLASSES = ThresholdClassifier(
+        edges=[100, 200, 300, 400, 500],
+        labels=["Very Low", "Low", "Moderate", "High", "Very High", "Extreme"]
+    )
+    
+    MIN_DC = 15.0
+    
+    STATE_KIND = "drought_code"
+    STATE_VERSION = 1
+    
     def calculate_drought_code(self,
                               dc_previous: float,
                               max_temp: float,
@@ -22,20 +35,67 @@ class DroughtCodeCalculator:
     
     def classify_dc_hazard(self, dc: float) -> Dict:
         """Classify Drought Code hazard level."""
-        if dc < 100:
-            level = "Very Low"
-        elif dc < 200:
-            level = "Low"
-        elif dc < 300:
-            level = "Moderate"
-        elif dc < 400:
-            level = "High"
-        elif dc < 500:
-            level = "Very High"
-        else:
-            level = "Extreme"
+        level = self.DC_HAZARD_CLASSES.label(dc)
         
         return {
             "drought_code": dc,
             "hazard_level": level
         }
+    
+    def classify_dc_codes(self, dc: np.ndarray) -> np.ndarray:
+        """Drought Code hazard class codes (uint8); labels: DC_HAZARD_CLASSES.labels."""
+        return self.DC_HAZARD_CLASSES.classify(dc)
+    
+    def calculate_drought_code_series(self,
+                                      max_temp: np.ndarray,
+                                      precipitation: np.ndarray,
+                                      dc_initial: np.ndarray = MIN_DC,
+                                      season_start: Optional[np.ndarray] = None,
+                                      season_start_dc: float = MIN_DC) -> np.ndarray:
+        """
+        Drought Code for (days × stations) weather arrays.
+        
+        Same recursion as calculate_drought_code, DC_t = max(15, DC_t-1 + d_t),
+        evaluated as a scan: with S_t the cumulative sum of d,
+        DC_t - 15 = S_t - min(15 - DC_0, min_{k<=t} S_k).
+        season_start is a boolean (days × stations) mask, or one flag per
+        day, marking where DC restarts from season_start_dc before the
+        day's update.
+        """
+        max_temp = np.asarray(max_temp, dtype=float)
+        precipitation = np.asarray(precipitation, dtype=float)
+        p_eff = np.where(precipitation <= 2.8, precipitation, 2.8 + 0.83 * (precipitation - 2.8))
+        daily_change = 0.5 * (max_temp + 4.0) - p_eff
+        
+        dc = np.empty(daily_change.shape)
+        excess = np.broadcast_to(np.asarray(dc_initial, dtype=float) - self.MIN_DC,
+                                 daily_change.shape[1:]).copy()
+        
+        if season_start is None:
+            resets = np.zeros(daily_change.shape, dtype=bool)
+        else:
+            resets = np.asarray(season_start, dtype=bool)
+            if resets.ndim == 1 and daily_change.ndim > 1:
+                resets = resets.reshape((-1,) + (1,) * (daily_change.ndim - 1))
+            resets = np.broadcast_to(resets, daily_change.shape)
+        
+        # Scan each run of days between season starts, carrying the excess over
+        reset_days = np.flatnonzero(resets.reshape(len(resets), -1).any(axis=1))
+        bounds = np.unique(np.concatenate([[0], reset_days, [len(daily_change)]]))
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            excess = np.where(resets[start], season_start_dc - self.MIN_DC, excess)
+            cumulative = np.cumsum(daily_change[start:stop], axis=0)
+            floor = np.minimum(-excess, np.minimum.accumulate(cumulative, axis=0))
+            segment = cumulative - floor
+            dc[start:stop] = segment + self.MIN_DC
+            excess = segment[-1]
+        
+        return dc
+    
+    def save_drought_state(self, path: str, dc: np.ndarray):
+        """Save the latest Drought Code per station for the next update."""
+        save_state(path, self.STATE_KIND, self.STATE_VERSION, {"dc": np.asarray(dc, dtype=float)})
+    
+    def load_drought_state(self, path: str) -> np.ndarray:
+        """Drought Code per station saved by save_drought_state."""
+        return load_state(path, self.STATE_KIND, self.STATE_VERSION)["dc"]
@@ -0,0 +1,124 @@
+"""Additional fire danger indices - KBDI, Fosberg FFWI, Nesterov, Angström
+
+All four are computed in one pass over the same weather arrays, sharing
+the saturation and actual vapour pressure terms with VPD.
+"""
+
+import numpy as np
+from typing import Dict, Tuple
+
+from sylva_fire.parameters.fuel_moisture import saturation_vapour_pressure
+from sylva_fire.utils.state import load_state, save_state
+
+
+class FireDangerIndexCalculator:
+    """
+    Daily KBDI (metric), Fosberg FFWI, Nesterov and Angström indices.
+
+    KBDI and Nesterov accumulate from day to day, so their state (and the
+    rain of the current wet spell used by KBDI) is kept per cell.
+    """
+
+    KBDI_MAX = 203.2            # mm (8 in)
+    KBDI_RAIN_THRESHOLD = 5.08  # mm (0.2 in) per wet spell
+    NESTEROV_RAIN_RESET = 3.0   # mm
+    MS_TO_MPH = 2.23694
+
+    STATE_KIND = "fire_danger_indices"
+    STATE_VERSION = 1
+
+    def __init__(self,
+                 shape: Tuple[int, ...] = (),
+                 mean_annual_rain: float = 600.0,
+                 kbdi: float = 0.0,
+                 nesterov: float = 0.0):
+        self.mean_annual_rain = np.asarray(mean_annual_rain, dtype=float)
+        self.kbdi = np.full(shape, kbdi, dtype=float)
+        self.nesterov = np.full(shape, nesterov, dtype=float)
+        self.wet_spell_rain = np.zeros(shape, dtype=float)
+
+    @staticmethod
+    def simard_emc(temperature_f: np.ndarray, humidity: np.ndarray) -> np.ndarray:
+        """Equilibrium moisture content (%) after Simard (1968), temperature in °F."""
+        h, t = humidity, temperature_f
+        return np.where(h < 10.0, 0.03229 + 0.281073 * h - 0.000578 * h * t,
+                        np.where(h < 50.0, 2.22749 + 0.160107 * h - 0.01478 * t,
+                                 21.0606 + 0.005565 * h ** 2 - 0.00035 * h * t - 0.483199 * h))
+
+    def step(self,
+             temperature: np.ndarray,
+             humidity: np.ndarray,
+             wind_speed: np.ndarray,
+             rain: np.ndarray,
+             max_temp: np.ndarray = None) -> Dict[str, np.ndarray]:
+        """
+        Advance the accumulating indices by one day and return all four.
+
+        temperature (afternoon, °C), humidity (%), wind_speed (m/s) and
+        24-h rain (mm); max_temp defaults to temperature. The shared
+        vapour pressure deficit is returned as "vpd" (hPa).
+        """
+        t = np.asarray(temperature, dtype=float)
+        h = np.clip(np.asarray(humidity, dtype=float), 0.0, 100.0)
+        wind = np.maximum(np.asarray(wind_speed, dtype=float), 0.0)
+        rain = np.maximum(np.asarray(rain, dtype=float), 0.0)
+        t_max = t if max_temp is None else np.asarray(max_temp, dtype=float)
+
+        # Shared vapour pressure terms
+        e_s = saturation_vapour_pressure(t)
+        e = e_s * (h / 100.0)
+        log_ratio = np.log(np.maximum(e, 1e-3) / 6.1078)
+        dew_point = 237.3 * log_ratio / (17.27 - log_ratio)
+
+        # Angström: I = RH/20 + (27 - T)/10
+        angstrom = h / 20.0 + (27.0 - t) / 10.0
+
+        # Nesterov: Σ T·(T - Td) over days with at most 3 mm of rain
+        nesterov = np.where(rain > self.NESTEROV_RAIN_RESET, 0.0,
+                            self.nesterov + np.maximum(t * (t - dew_point), 0.0))
+
+        # Fosberg FFWI from the Simard EMC, wind in mi/h
+        m = self.simard_emc(t * 1.8 + 32.0, h) / 30.0
+        eta = 1.0 - 2.0 * m + 1.5 * m ** 2 - 0.5 * m ** 3
+        ffwi = eta * np.sqrt(1.0 + (wind * self.MS_TO_MPH) ** 2) / 0.3002
+
+        # KBDI (metric): the first 5.08 mm of each wet spell is intercepted
+        spell = np.where(rain > 0, self.wet_spell_rain + rain, 0.0)
+        net_rain = (np.maximum(spell - self.KBDI_RAIN_THRESHOLD, 0.0)
+                    - np.maximum(self.wet_spell_rain - self.KBDI_RAIN_THRESHOLD, 0.0))
+        net_rain = np.where(rain > 0, net_rain, 0.0)
+        q = np.maximum(self.kbdi - net_rain, 0.0)
+        drying = ((self.KBDI_MAX - q) * (0.968 * np.exp(0.0875 * t_max + 1.5552) - 8.30) * 1e-3
+                  / (1.0 + 10.88 * np.exp(-0.001736 * self.mean_annual_rain)))
+        kbdi = np.minimum(q + np.maximum(drying, 0.0), self.KBDI_MAX)
+
+        self.kbdi, self.nesterov, self.wet_spell_rain = (
+            np.array(a) for a in np.broadcast_arrays(kbdi, nesterov, spell)
+        )
+
+        return {
+            "kbdi": self.kbdi,
+            "ffwi": ffwi,
+            "nesterov": self.nesterov,
+            "angstrom": angstrom,
+            "vpd": e_s - e
+        }
+
+    def save(self, path: str):
+        """Save the accumulating index state."""
+        save_state(path, self.STATE_KIND, self.STATE_VERSION, {
+            "kbdi": self.kbdi,
+            "nesterov": self.nesterov,
+            "wet_spell_rain": self.wet_spell_rain,
+            "mean_annual_rain": self.mean_annual_rain,
+        })
+
+    @classmethod
+    def load(cls, path: str) -> "FireDangerIndexCalculator":
+        """Resume from a state file written by save()."""
+        state = load_state(path, cls.STATE_KIND, cls.STATE_VERSION)
+        calculator = cls(shape=state["kbdi"].shape, mean_annual_rain=state["mean_annual_rain"])
+        calculator.kbdi = state["kbdi"]
+        calculator.nesterov = state["nesterov"]
+        calculator.wet_spell_rain = state["wet_spell_rain"]
+        return calculator
@@ -1,39 +1,144 @@
 """Fuel moisture calculations - Live Fuel Moisture (LFM) and Dead Fuel Moisture (DFM)"""
 
 import numpy as np
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
+
+from sylva_fire.data.raster import create_raster, iter_windows, open_raster, raster_nodata
+from sylva_fire.utils.classification import ThresholdClassifier
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY
+
+
+def saturation_vapour_pressure(temperature: np.ndarray) -> np.ndarray:
+    """Saturation vapour pressure (hPa) over water, Tetens formula."""
+    return 6.1078 * np.exp((17.27 * temperature) / (temperature + 237.3))
 
 
 class FuelMoistureCalculator:
     """Calculate live and dead fuel moisture content."""
     
-    def __init__(self):
-        self.LFM_CRITICAL = {
-            "pinus_halepensis": 85.0,
-            "quercus_ilex": 75.0,
-            "mediterranean_maquis": 80.0,
-            "dry_grassland": 70.0
-        }
+    # Read-only, like the registry it is built from
+    LFM_CRITICAL = MappingProxyType({
+        name: float(FUEL_REGISTRY.lfm_critical[i])
+        for i, name in enumerate(FUEL_REGISTRY.fuel_types)
+    })
+    
+    # Critical LFM by fuel id
+    _LFM_CRITICAL_TABLE = FUEL_REGISTRY.lfm_critical.astype(np.float32)
+    
+    MASK_NODATA = 255
+    
+    # Default gap in fine dead fuel moisture between fully shaded and exposed
+    # sites, in percentage points: the daytime shaded vs unshaded corrections
+    # of Rothermel (1983), Tables 2-4, after Fosberg & Deeming (1971)
+    SHADING_MOISTURE_CORRECTION = 3.0
+    
+    # The ladder tests lfm >= threshold from the top, so NaN ends in "Very Low"
+    LFM_HAZARD_CLASSES = ThresholdClassifier(
+        edges=[60, 80, 100, 120],
+        labels=["Very Low", "Low", "Moderate", "High", "Very High"],
+        fill_code=0
+    )
     
     def estimate_lfm_from_ndwi(self, ndwi: float) -> float:
         """Estimate Live Fuel Moisture from NDWI."""
         lfm = 50.0 + (ndwi * 100.0)
         return np.clip(lfm, 30, 200)
     
+    def estimate_dfm_from_ffmc(self, ffmc: float) -> float:
+        """Estimate fine Dead Fuel Moisture (%) from FFMC (Van Wagner 1987 FF scale)."""
+        ffmc = np.asarray(ffmc, dtype=float)
+        return 147.2 * (101.0 - ffmc) / (59.5 + ffmc)
+    
+    def apply_solar_correction(self,
+                               dfm: np.ndarray,
+                               insolation: np.ndarray,
+                               reference_insolation: np.ndarray,
+                               shading_correction: float = SHADING_MOISTURE_CORRECTION) -> np.ndarray:
+        """
+        Adjust dead fuel moisture (%) for local insolation.
+        
+        reference_insolation is that of open flat ground (e.g. from
+        SolarRadiationCalculator with slope 0 and no horizon); cells at or
+        above it are unchanged, fully shaded cells gain shading_correction
+        percentage points, and partly shaded cells a linear share of it.
+        Where the reference is zero (night) no correction is applied.
+        """
+        insolation = np.asarray(insolation, dtype=float)
+        reference_insolation = np.asarray(reference_insolation, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative = np.where(reference_insolation > 0,
+                                np.clip(insolation / reference_insolation, 0.0, 1.0), 1.0)
+        return np.asarray(dfm, dtype=float) + shading_correction * (1.0 - relative)
+    
+    def estimate_lfm_array(self, ndwi: np.ndarray) -> np.ndarray:
+        """Estimate Live Fuel Moisture (float32) from an NDWI array."""
+        lfm = np.asarray(ndwi, dtype=np.float32) * np.float32(100.0) + np.float32(50.0)
+        return np.clip(lfm, 30, 200, out=lfm)
+    
+    def below_critical_mask(self,
+                            lfm: np.ndarray,
+                            fuel_ids: Optional[np.ndarray] = None,
+                            species: str = "pinus_halepensis") -> np.ndarray:
+        """
+        1 where LFM is below the critical value of the cell's fuel, else 0.
+        
+        fuel_ids index the fuel registry; without them every cell uses
+        species. NaN LFM and ids outside the registry (including the
+        FUEL_NODATA 255 of non-fuel pixels) give MASK_NODATA.
+        """
+        lfm = np.asarray(lfm)
+        nodata = np.isnan(lfm)
+        if fuel_ids is None:
+            critical = np.float32(self.LFM_CRITICAL.get(species, 85.0))
+        else:
+            fuel_ids = np.asarray(fuel_ids)
+            unknown = (fuel_ids < 0) | (fuel_ids >= len(FUEL_REGISTRY))
+            critical = self._LFM_CRITICAL_TABLE[np.where(unknown, 0, fuel_ids)]
+            nodata = nodata | unknown
+        mask = (lfm < critical).astype(np.uint8)
+        mask[nodata] = self.MASK_NODATA
+        return mask
+    
+    def estimate_lfm_raster(self,
+                            ndwi_path: str,
+                            lfm_path: str,
+                            mask_path: str,
+                            fuel_id_path: Optional[str] = None,
+                            species: str = "pinus_halepensis",
+                            tile_shape: Tuple[int, int] = (1024, 1024)):
+        """
+        Stream an NDWI raster into LFM (float32) and below-critical mask (uint8) rasters.
+        
+        Inputs and outputs are .npy or raw rasters with a sidecar header
+        (see sylva_fire.data.raster); only one tile is held in memory at a time.
+        fuel_id_path optionally gives a per-pixel fuel id (species) map.
+        NDWI cells equal to the input header's nodata are treated as NaN, so
+        they become NaN LFM and MASK_NODATA.
+        """
+        ndwi = open_raster(ndwi_path)
+        ndwi_nodata = raster_nodata(ndwi_path)
+        fuel_ids = open_raster(fuel_id_path) if fuel_id_path is not None else None
+        lfm_out = create_raster(lfm_path, ndwi.shape, np.float32, nodata=float("nan"))
+        mask_out = create_raster(mask_path, ndwi.shape, np.uint8, nodata=self.MASK_NODATA)
+        
+        for window, _, _ in iter_windows(ndwi.shape, tile_shape):
+            block = np.array(ndwi[window], dtype=np.float32)
+            if ndwi_nodata is not None:
+                block[block == np.float32(ndwi_nodata)] = np.nan
+            lfm = self.estimate_lfm_array(block)
+            lfm_out[window] = lfm
+            mask_out[window] = self.below_critical_mask(
+                lfm, None if fuel_ids is None else fuel_ids[window], species
+            )
+        
+        lfm_out.flush()
+        mask_out.flush()
+    
     def classify_lfm_hazard(self, lfm: float, species: str = "pinus_halepensis") -> Dict:
         """Classify LFM hazard level."""
         critical = self.LFM_CRITICAL.get(species, 85.0)
-        
-        if lfm >= 120:
-            level = "Very High"
-        elif lfm >= 100:
-            level = "High"
-        elif lfm >= 80:
-            level = "Moderate"
-        elif lfm >= 60:
-            level = "Low"
-        else:
-            level = "Very Low"
+        level = self.LFM_HAZARD_CLASSES.label(lfm)
         
         return {
             "lfm_percent": lfm,
@@ -41,8 +146,12 @@ class FuelMoistureCalculator:
             "below_critical": lfm < critical
         }
     
+    def classify_lfm_codes(self, lfm: np.ndarray) -> np.ndarray:
+        """LFM hazard class codes (uint8); labels: LFM_HAZARD_CLASSES.labels."""
+        return self.LFM_HAZARD_CLASSES.classify(lfm)
+    
     def calculate_vpd(self, temperature: float, humidity: float) -> float:
         """Calculate Vapor Pressure Deficit (hPa)."""
-        e_s = 6.1078 * np.exp((17.27 * temperature) / (temperature + 237.3))
+        e_s = saturation_vapour_pressure(temperature)
         e = e_s * (humidity / 100.0)
         return e_s - e
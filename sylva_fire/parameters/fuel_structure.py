@@ -1,85 +1,125 @@
 """Fuel structure parameters - CBD, CBH, SFL, FBD"""
 
-from typing import Dict
+import os
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+from sylva_fire.data.raster import create_raster, iter_windows, open_raster, raster_nodata
+from sylva_fire.utils.classification import ThresholdClassifier
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY
 
 
 class FuelStructureCalculator:
     """Calculate fuel structure parameters."""
     
+    CBD_HAZARD_CLASSES = ThresholdClassifier(
+        edges=[0.05, 0.10, 0.15, 0.25],
+        labels=["Very Low", "Low", "Moderate", "High", "Extreme"]
+    )
+    
+    FUEL_NODATA = 255
+    STRUCTURE_LAYERS = ("cbd", "cbh", "sfl", "fbd")
+    
+    # Structure defaults indexed by uint8 fuel id; unused ids (incl. nodata) are NaN
+    _STRUCTURE_TABLE = np.full((256, len(STRUCTURE_LAYERS)), np.nan, dtype=np.float32)
+    _STRUCTURE_TABLE[:len(FUEL_REGISTRY)] = FUEL_REGISTRY.structure
+    
     def __init__(self, fuel_type: str = "pinus_halepensis"):
         self.fuel_type = fuel_type
     
     def classify_cbd_hazard(self, cbd: float) -> Dict:
         """Classify CBD hazard level."""
-        if cbd < 0.05:
-            level = "Very Low"
-        elif cbd < 0.10:
-            level = "Low"
-        elif cbd < 0.15:
-            level = "Moderate"
-        elif cbd < 0.25:
-            level = "High"
-        else:
-            level = "Extreme"
+        level = self.CBD_HAZARD_CLASSES.label(cbd)
         
         return {
             "cbd_kg_m3": cbd,
             "hazard_level": level
         }
     
+    def classify_cbd_codes(self, cbd: np.ndarray) -> np.ndarray:
+        """CBD hazard class codes (uint8); labels: CBD_HAZARD_CLASSES.labels."""
+        return self.CBD_HAZARD_CLASSES.classify(cbd)
+    
     def get_fuel_defaults(self, fuel_type: str = None) -> Dict:
         """Get default fuel structure parameters."""
         if fuel_type is None:
             fuel_type = self.fuel_type
         
-        defaults = {
-            "pinus_halepensis": {
-                "cbd_typical": 0.15,
-                "cbh_typical": 4.0,
-                "sfl_typical": 25.0,
-                "fbd_typical": 0.6
-            },
-            "quercus_ilex": {
-                "cbd_typical": 0.18,
-                "cbh_typical": 3.0,
-                "sfl_typical": 35.0,
-                "fbd_typical": 0.7
-            },
-            "mediterranean_maquis": {
-                "cbd_typical": 0.30,
-                "cbh_typical": 1.2,
-                "sfl_typical": 45.0,
-                "fbd_typical": 2.5
-            },
-            "dry_grassland": {
-                "cbd_typical": 0.0,
-                "cbh_typical": 0.0,
-                "sfl_typical": 4.0,
-                "fbd_typical": 0.5
-            }
-        }
-        
-        return defaults.get(fuel_type, defaults["pinus_halepensis"])
+        return FUEL_REGISTRY.structure_dict(fuel_type)
 
-    # Add Pinus pinaster to fuel defaults
-    def _add_pinus_pinaster(self):
-        """Add Pinus pinaster fuel parameters"""
-        self.params["pinus_pinaster"] = {
-            "net_fuel_load": 3.0,
-            "surface_area_volume": 3200.0,
-            "fuel_bed_depth": 0.7,
-            "moisture_of_extinction": 0.22,
-            "heat_content": 18500.0,
-            "ovendry_density": 540.0,
-            "particle_density": 1540.0,
-            "optimum_packing_ratio": 0.019
-        }
+    def landcover_lookup(self, mapping: Dict[int, Optional[str]]) -> np.ndarray:
+        """
+        uint8 lookup table from land-cover code to fuel id.
         
-        self.RSI_WEIGHTS["pinus_pinaster"] = {
-            "lfm": 0.19, "dfm": 0.16, "cbd": 0.13, "sfl": 0.11,
-            "fbd": 0.09, "wind": 0.16, "vpd": 0.08, "aspect": 0.05, "dc": 0.06
-        }
+        mapping gives a fuel type per land-cover code (unknown fuel types
+        use pinus_halepensis, None marks non-fuel); unmapped codes get
+        FUEL_NODATA.
+        """
+        if len(FUEL_REGISTRY) >= self.FUEL_NODATA:
+            raise ValueError("Too many fuel types for uint8 fuel ids")
+        lut = np.full(max(mapping, default=-1) + 1, self.FUEL_NODATA, dtype=np.uint8)
+        for code, fuel_type in mapping.items():
+            if code < 0:
+                raise ValueError(f"Negative land-cover code {code}")
+            if fuel_type is not None:
+                lut[code] = FUEL_REGISTRY.resolve_id(fuel_type)
+        return lut
+    
+    def map_fuel_ids(self,
+                     landcover: np.ndarray,
+                     lut: np.ndarray,
+                     nodata: Optional[float] = None) -> np.ndarray:
+        """
+        uint8 fuel ids for a land-cover array.
         
-        self.CALIBRATION_COEFFS["pinus_pinaster"] = {
-            "beta_0": -4.6, "beta_1": 8.9, "beta_2": -3.9, "beta_3": 1.35
-        }
+        Codes outside the table, the nodata code and, for float rasters,
+        NaN or non-integer values get FUEL_NODATA.
+        """
+        landcover = np.asarray(landcover)
+        valid = (landcover >= 0) & (landcover < len(lut))
+        if landcover.dtype.kind == "f":
+            valid &= landcover == np.floor(landcover)
+        if nodata is not None:
+            valid &= landcover != nodata
+        fuel_ids = lut[np.where(valid, landcover, 0).astype(np.intp)]
+        fuel_ids[~valid] = self.FUEL_NODATA
+        return fuel_ids
+    
+    def structure_arrays(self, fuel_ids: np.ndarray) -> Dict[str, np.ndarray]:
+        """CBD, CBH, SFL and FBD defaults (float32) per cell from uint8 fuel ids."""
+        values = self._STRUCTURE_TABLE[np.asarray(fuel_ids, dtype=np.uint8)]
+        return {layer: values[..., i] for i, layer in enumerate(self.STRUCTURE_LAYERS)}
+    
+    def map_landcover_raster(self,
+                             landcover_path: str,
+                             mapping: Dict[int, Optional[str]],
+                             output_dir: str,
+                             tile_shape: Tuple[int, int] = (1024, 1024)) -> Dict[str, np.ndarray]:
+        """
+        Stream a land-cover raster into fuel_id (uint8) and CBD/CBH/SFL/FBD (float32) rasters.
+        
+        Outputs are written as <output_dir>/<layer>.npy tile by tile and
+        returned as read-only memory maps. Cells at the land-cover header's
+        nodata value get FUEL_NODATA.
+        """
+        lut = self.landcover_lookup(mapping)
+        landcover = open_raster(landcover_path)
+        landcover_nodata = raster_nodata(landcover_path)
+        os.makedirs(output_dir, exist_ok=True)
+        
+        paths = {layer: os.path.join(output_dir, f"{layer}.npy")
+                 for layer in ("fuel_id",) + self.STRUCTURE_LAYERS}
+        outputs = {"fuel_id": create_raster(paths["fuel_id"], landcover.shape, np.uint8,
+                                            nodata=self.FUEL_NODATA)}
+        for layer in self.STRUCTURE_LAYERS:
+            outputs[layer] = create_raster(paths[layer], landcover.shape, np.float32)
+        
+        for window, _, _ in iter_windows(landcover.shape, tile_shape):
+            fuel_ids = self.map_fuel_ids(landcover[window], lut, landcover_nodata)
+            outputs["fuel_id"][window] = fuel_ids
+            for layer, values in self.structure_arrays(fuel_ids).items():
+                outputs[layer][window] = values
+        
+        for array in outputs.values():
+            array.flush()
+        return {layer: open_raster(path) for layer, path in paths.items()}
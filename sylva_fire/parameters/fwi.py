@@ -0,0 +1,183 @@
+"""Canadian Forest Fire Weather Index (FWI) System
+
+Van Wagner (1987) daily equations for FFMC, DMC, DC, ISI, BUI and FWI,
+evaluated over station or grid arrays with per-cell carry-over state.
+"""
+
+import numpy as np
+from typing import Dict, Tuple
+
+from sylva_fire.parameters.dead_fuel_moisture import DeadFuelMoistureModel
+from sylva_fire.utils.state import load_state, save_state
+
+
+class FireWeatherIndexSystem:
+    """
+    Daily FWI System with FFMC, DMC and DC state per cell.
+
+    Weather is taken at noon local standard time: temperature in °C,
+    relative humidity in %, wind speed in m/s and 24-h rain in mm.
+    """
+
+    # Day-length factors for DMC (Le) and DC (Lf), Van Wagner (1987), ~46°N
+    DMC_DAY_LENGTH = np.array([6.5, 7.5, 9.0, 12.8, 13.9, 13.9, 12.4, 10.9, 9.4, 8.0, 7.0, 6.0])
+    DC_DAY_LENGTH = np.array([-1.6, -1.6, -1.6, 0.9, 3.8, 5.8, 6.4, 5.0, 2.4, 0.4, -1.6, -1.6])
+
+    # Standard start-up values
+    FFMC_START = 85.0
+    DMC_START = 6.0
+    DC_START = 15.0
+
+    MS_TO_KMH = 3.6
+
+    STATE_KIND = "fire_weather_index"
+    STATE_VERSION = 1
+
+    def __init__(self,
+                 shape: Tuple[int, ...] = (),
+                 ffmc: float = FFMC_START,
+                 dmc: float = DMC_START,
+                 dc: float = DC_START):
+        self.ffmc = np.full(shape, ffmc, dtype=float)
+        self.dmc = np.full(shape, dmc, dtype=float)
+        self.dc = np.full(shape, dc, dtype=float)
+
+    @staticmethod
+    def fine_fuel_moisture(ffmc: np.ndarray) -> np.ndarray:
+        """Fine fuel moisture content (%) on the FF scale."""
+        return 147.2 * (101.0 - ffmc) / (59.5 + ffmc)
+
+    def _fine_fuel_moisture_update(self, temperature, humidity, wind_kmh, rain) -> np.ndarray:
+        """Today's fine fuel moisture content from yesterday's FFMC."""
+        mo = self.fine_fuel_moisture(self.ffmc)
+
+        rf = rain - 0.5
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wetted = mo + 42.5 * rf * np.exp(-100.0 / (251.0 - mo)) * (1.0 - np.exp(-6.93 / rf))
+            wetted = wetted + np.where(mo > 150.0, 0.0015 * (mo - 150.0) ** 2 * np.sqrt(rf), 0.0)
+        mo = np.where(rain > 0.5, np.minimum(wetted, 250.0), mo)
+
+        # Same equilibrium and rate equations as the hourly model, at the daily rate
+        model = DeadFuelMoistureModel
+        ed, ew = model.equilibrium_moisture(temperature, humidity)
+        kd = model.log_rate(temperature, humidity / 100.0, wind_kmh, model.DAILY_RATE_FACTOR)
+        kw = model.log_rate(temperature, (100.0 - humidity) / 100.0, wind_kmh, model.DAILY_RATE_FACTOR)
+
+        m = np.where(mo > ed, ed + (mo - ed) * 10.0 ** (-kd), mo)
+        return np.where(mo < ew, ew - (ew - mo) * 10.0 ** (-kw), m)
+
+    def _duff_moisture_code(self, temperature, humidity, rain, month) -> np.ndarray:
+        """Today's DMC: rain reduction above 1.5 mm, then the day-length-weighted drying."""
+        dmc0 = self.dmc
+
+        re = 0.92 * rain - 1.27
+        mo = 20.0 + np.exp(5.6348 - dmc0 / 43.43)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_dmc = np.log(dmc0)
+            b = np.where(dmc0 <= 33.0, 100.0 / (0.5 + 0.3 * dmc0),
+                         np.where(dmc0 <= 65.0, 14.0 - 1.3 * log_dmc, 6.2 * log_dmc - 17.2))
+            mr = mo + 1000.0 * re / (48.77 + b * re)
+            pr = np.maximum(244.72 - 43.43 * np.log(mr - 20.0), 0.0)
+        pr = np.where(rain > 1.5, pr, dmc0)
+
+        t = np.maximum(temperature, -1.1)
+        rk = 1.894 * (t + 1.1) * (100.0 - humidity) * self.DMC_DAY_LENGTH[month - 1] * 1e-4
+        return pr + rk
+
+    def _drought_code(self, temperature, rain, month) -> np.ndarray:
+        """Today's DC: rain reduction above 2.8 mm, then potential evapotranspiration."""
+        dc0 = self.dc
+
+        rd = 0.83 * rain - 1.27
+        qo = 800.0 * np.exp(-dc0 / 400.0)
+        qr = qo + 3.937 * rd
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dr = np.maximum(400.0 * np.log(800.0 / qr), 0.0)
+        dr = np.where(rain > 2.8, dr, dc0)
+
+        t = np.maximum(temperature, -2.8)
+        pe = np.maximum((0.36 * (t + 2.8) + self.DC_DAY_LENGTH[month - 1]) / 2.0, 0.0)
+        return dr + pe
+
+    @staticmethod
+    def initial_spread_index(fine_fuel_moisture: np.ndarray, wind_kmh: np.ndarray) -> np.ndarray:
+        """ISI from FF-scale fine fuel moisture (%) and wind speed (km/h)."""
+        m = fine_fuel_moisture
+        f_wind = np.exp(0.05039 * wind_kmh)
+        f_fuel = 91.9 * np.exp(-0.1386 * m) * (1.0 + m ** 5.31 / 4.93e7)
+        return 0.208 * f_wind * f_fuel
+
+    @staticmethod
+    def buildup_index(dmc: np.ndarray, dc: np.ndarray) -> np.ndarray:
+        """BUI combining DMC and DC; zero when both are zero."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            low = 0.8 * dmc * dc / (dmc + 0.4 * dc)
+            high = dmc - (1.0 - 0.8 * dc / (dmc + 0.4 * dc)) * (0.92 + (0.0114 * dmc) ** 1.7)
+        bui = np.where(dmc <= 0.4 * dc, low, high)
+        return np.where((dmc == 0) & (dc == 0), 0.0, np.maximum(bui, 0.0))
+
+    @staticmethod
+    def fire_weather_index(isi: np.ndarray, bui: np.ndarray) -> np.ndarray:
+        """FWI from ISI and BUI, with the log scaling applied above B = 1."""
+        f_duff = np.where(bui <= 80.0,
+                          0.626 * bui ** 0.809 + 2.0,
+                          1000.0 / (25.0 + 108.64 * np.exp(-0.023 * bui)))
+        b = 0.1 * isi * f_duff
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scaled = np.exp(2.72 * (0.434 * np.log(b)) ** 0.647)
+        return np.where(b > 1.0, scaled, b)
+
+    def step(self,
+             temperature: np.ndarray,
+             humidity: np.ndarray,
+             wind_speed: np.ndarray,
+             rain: np.ndarray,
+             month) -> Dict[str, np.ndarray]:
+        """
+        Advance all codes by one day and return the six components.
+
+        month (1-12) may be a scalar or an array. The fine fuel moisture
+        behind today's FFMC and ISI is returned as "dfm" (%).
+        """
+        temperature = np.asarray(temperature, dtype=float)
+        humidity = np.clip(np.asarray(humidity, dtype=float), 0.0, 100.0)
+        wind_kmh = np.maximum(np.asarray(wind_speed, dtype=float), 0.0) * self.MS_TO_KMH
+        rain = np.maximum(np.asarray(rain, dtype=float), 0.0)
+        month = np.asarray(month, dtype=int)
+
+        m = self._fine_fuel_moisture_update(temperature, humidity, wind_kmh, rain)
+        ffmc = np.clip(59.5 * (250.0 - m) / (147.2 + m), 0.0, 101.0)
+        dmc = self._duff_moisture_code(temperature, humidity, rain, month)
+        dc = self._drought_code(temperature, rain, month)
+
+        # ISI uses today's FFMC mapped back to the FF moisture scale
+        fine_moisture = self.fine_fuel_moisture(ffmc)
+        isi = self.initial_spread_index(fine_moisture, wind_kmh)
+        bui = self.buildup_index(dmc, dc)
+        fwi = self.fire_weather_index(isi, bui)
+
+        self.ffmc, self.dmc, self.dc = np.broadcast_arrays(ffmc, dmc, dc)
+        self.ffmc, self.dmc, self.dc = self.ffmc.copy(), self.dmc.copy(), self.dc.copy()
+
+        return {
+            "ffmc": self.ffmc,
+            "dmc": self.dmc,
+            "dc": self.dc,
+            "isi": isi,
+            "bui": bui,
+            "fwi": fwi,
+            "dfm": fine_moisture
+        }
+
+    def save(self, path: str):
+        """Save the FFMC, DMC and DC state arrays."""
+        save_state(path, self.STATE_KIND, self.STATE_VERSION,
+                   {"ffmc": self.ffmc, "dmc": self.dmc, "dc": self.dc})
+
+    @classmethod
+    def load(cls, path: str) -> "FireWeatherIndexSystem":
+        """Resume from a state file written by save()."""
+        state = load_state(path, cls.STATE_KIND, cls.STATE_VERSION)
+        system = cls(shape=state["ffmc"].shape)
+        system.ffmc, system.dmc, system.dc = state["ffmc"], state["dmc"], state["dc"]
+        return system
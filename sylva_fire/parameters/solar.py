@@ -0,0 +1,243 @@
+"""Solar radiation on terrain - hourly insolation with horizon shading
+
+Clear-sky beam and diffuse radiation on sloping cells, with the beam
+blocked where the sun is below the DEM horizon. Horizon angles are
+computed once per DEM and hourly insolation once per DEM and day of
+year; both are cached as memory-mapped .npy files next to the DEM.
+"""
+
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+import numpy as np
+
+from sylva_fire.data.raster import (cache_manifest, create_raster, derived_cache_dir, iter_windows,
+                                    manifest_matches, open_raster, write_manifest)
+from sylva_fire.parameters.terrain import TerrainCalculator
+
+
+class SolarRadiationCalculator:
+    """
+    Hourly clear-sky insolation (W/m²) on slopes.
+
+    cos i = cos Z · cos S + sin Z · sin S · cos(A_sun - A)
+    G = B · E₀ · τ^m · cos i · (sun above horizon) + D · (1 + cos S) / 2
+    """
+
+    SOLAR_CONSTANT = 1361.0      # W/m²
+    TRANSMISSIVITY = 0.70        # clear-sky atmospheric transmissivity
+    DIFFUSE_FRACTION = 0.30      # share of the attenuated beam scattered to the ground
+
+    HORIZON_SECTORS = 16
+    HORIZON_DISTANCE = 5000.0    # m searched for the horizon
+    HOURS = np.arange(24) + 0.5  # hour midpoints, local solar time
+
+    CACHE_FORMAT_VERSION = 1
+
+    def __init__(self):
+        self.terrain = TerrainCalculator()
+
+    def solar_position(self, latitude: float, day_of_year: int, hour: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Solar zenith and azimuth (degrees clockwise from north) at local solar time."""
+        phi = np.radians(latitude)
+        declination = np.radians(23.45 * np.sin(np.radians(360.0 * (284 + day_of_year) / 365.0)))
+        hour_angle = np.radians(15.0 * (np.asarray(hour, dtype=float) - 12.0))
+
+        cos_zenith = (np.sin(phi) * np.sin(declination)
+                      + np.cos(phi) * np.cos(declination) * np.cos(hour_angle))
+        zenith = np.degrees(np.arccos(np.clip(cos_zenith, -1.0, 1.0)))
+        azimuth = np.degrees(np.arctan2(np.sin(hour_angle),
+                                        np.cos(hour_angle) * np.sin(phi)
+                                        - np.tan(declination) * np.cos(phi))) + 180.0
+        return zenith, azimuth % 360.0
+
+    def sector_azimuths(self, n_sectors: int = HORIZON_SECTORS) -> np.ndarray:
+        """Centre azimuth (degrees) of each horizon sector."""
+        return np.arange(n_sectors) * (360.0 / n_sectors)
+
+    def horizon_angles(self,
+                       dem: np.ndarray,
+                       cell_size: float,
+                       n_sectors: int = HORIZON_SECTORS,
+                       max_distance: float = HORIZON_DISTANCE,
+                       halo: Optional[int] = None) -> np.ndarray:
+        """
+        Horizon elevation angle (degrees, >= 0) per sector, shape (n_sectors,) + cells.
+
+        Marches outward along each sector azimuth, one cell at a time, and
+        keeps the steepest elevation angle. With halo the input block
+        already carries that many border cells (e.g. from iter_windows),
+        which are dropped from the result.
+        """
+        steps = max(1, int(max_distance // cell_size))
+        z = np.asarray(dem, dtype=np.float64)
+        if halo is None:
+            halo = 0
+            z_pad = np.pad(z, steps, mode="constant", constant_values=np.nan)
+            border = steps
+        else:
+            z_pad = np.pad(z, max(steps - halo, 0), mode="constant", constant_values=np.nan)
+            border = max(steps, halo)
+        rows, cols = z_pad.shape[0] - 2 * border, z_pad.shape[1] - 2 * border
+        centre = z_pad[border:border + rows, border:border + cols]
+
+        angles = np.empty((n_sectors, rows, cols), dtype=np.float32)
+        for s, azimuth in enumerate(np.radians(self.sector_azimuths(n_sectors))):
+            d_row, d_col = -np.cos(azimuth), np.sin(azimuth)
+            max_tan = np.zeros((rows, cols))
+            seen = set()
+            for k in range(1, steps + 1):
+                offset = (int(round(k * d_row)), int(round(k * d_col)))
+                if offset in seen:
+                    continue
+                seen.add(offset)
+                r0, c0 = border + offset[0], border + offset[1]
+                distance = cell_size * np.hypot(*offset)
+                np.fmax(max_tan, (z_pad[r0:r0 + rows, c0:c0 + cols] - centre) / distance, out=max_tan)
+            angles[s] = np.degrees(np.arctan(max_tan))
+        return angles
+
+    def hourly_insolation(self,
+                          slope: np.ndarray,
+                          aspect: np.ndarray,
+                          latitude: float,
+                          day_of_year: int,
+                          horizon: Optional[np.ndarray] = None,
+                          hours: np.ndarray = HOURS) -> np.ndarray:
+        """
+        Clear-sky insolation (W/m², float32) for each hour, shape (hours,) + cells.
+
+        slope and aspect in degrees (NaN aspect = flat); horizon as
+        returned by horizon_angles, or None for no shading.
+        """
+        slope_rad = np.radians(np.asarray(slope, dtype=np.float32))
+        aspect_rad = np.radians(np.nan_to_num(np.asarray(aspect, dtype=np.float32)))
+        sky_view = (1.0 + np.cos(slope_rad)) / 2.0
+
+        zenith, azimuth = self.solar_position(latitude, day_of_year, hours)
+        eccentricity = 1.0 + 0.033 * np.cos(2.0 * np.pi * day_of_year / 365.0)
+        n_sectors = None if horizon is None else len(horizon)
+
+        result = np.zeros((len(zenith),) + slope_rad.shape, dtype=np.float32)
+        for h, (z, a) in enumerate(zip(zenith, azimuth)):
+            if z >= 90.0:
+                continue
+            cos_z = np.cos(np.radians(z))
+            attenuation = self.TRANSMISSIVITY ** (1.0 / cos_z)
+            beam = self.SOLAR_CONSTANT * eccentricity * attenuation
+            diffuse = self.DIFFUSE_FRACTION * (1.0 - attenuation) * self.SOLAR_CONSTANT * eccentricity * cos_z
+
+            z_rad, a_rad = np.radians(z), np.radians(a)
+            cos_incidence = (cos_z * np.cos(slope_rad)
+                             + np.sin(z_rad) * np.sin(slope_rad) * np.cos(a_rad - aspect_rad))
+            direct = beam * np.maximum(cos_incidence, 0.0)
+            if horizon is not None:
+                sector = int(np.round(a / (360.0 / n_sectors))) % n_sectors
+                direct = np.where(horizon[sector] < 90.0 - z, direct, 0.0)
+            result[h] = direct + diffuse * sky_view
+        return result
+
+    def daily_insolation(self, hourly: np.ndarray, hours_per_step: float = 1.0) -> np.ndarray:
+        """Daily insolation (Wh/m²) from an hourly series."""
+        return np.sum(hourly, axis=0, dtype=np.float64) * hours_per_step
+
+    def horizon_raster(self,
+                       dem_path: str,
+                       cell_size: float,
+                       n_sectors: int = HORIZON_SECTORS,
+                       max_distance: float = HORIZON_DISTANCE,
+                       cache_dir: Optional[str] = None,
+                       tile_shape: Tuple[int, int] = (512, 512),
+                       workers: Optional[int] = None) -> np.ndarray:
+        """
+        Horizon angles for a DEM raster, computed once and memory-mapped afterwards.
+
+        Stored as float16 degrees, shape (n_sectors, rows, cols). The cache
+        is reused only while horizon.json matches the DEM (path, mtime, size,
+        shape), cell_size, n_sectors and max_distance; a rebuild also drops
+        the insolation rasters derived from the old horizon.
+        """
+        if cache_dir is None:
+            cache_dir = self._cache_dir(dem_path, cell_size, n_sectors, max_distance)
+        path = os.path.join(cache_dir, "horizon.npy")
+        manifest_path = os.path.join(cache_dir, "horizon.json")
+        dem = open_raster(dem_path)
+        manifest = cache_manifest(dem_path, cell_size=cell_size, n_sectors=n_sectors,
+                                  max_distance=max_distance, shape=dem.shape)
+        if manifest_matches(manifest_path, manifest):
+            return open_raster(path)
+
+        os.makedirs(cache_dir, exist_ok=True)
+        for stale in [manifest_path, path] + glob.glob(os.path.join(cache_dir, "insolation_*.npy")):
+            if os.path.exists(stale):
+                os.unlink(stale)
+        halo = max(1, int(max_distance // cell_size))
+        out = create_raster(path, (n_sectors,) + dem.shape, np.float16)
+
+        def process(windows):
+            window, padded, inner = windows
+            block = np.asarray(dem[padded], dtype=np.float64)
+            # Pad clipped edges with NaN so every block carries the full halo
+            pad = tuple((halo - axis.start, halo - (size - axis.stop)) for axis, size in zip(inner, block.shape))
+            block = np.pad(block, pad, mode="constant", constant_values=np.nan)
+            out[(slice(None),) + window] = self.horizon_angles(block, cell_size, n_sectors, max_distance, halo=halo)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(process, iter_windows(dem.shape, tile_shape, halo=halo)))
+
+        out.flush()
+        write_manifest(manifest_path, manifest)
+        return open_raster(path)
+
+    def insolation_raster(self,
+                          dem_path: str,
+                          cell_size: float,
+                          latitude: float,
+                          day_of_year: int,
+                          cache_dir: Optional[str] = None,
+                          n_sectors: int = HORIZON_SECTORS,
+                          max_distance: float = HORIZON_DISTANCE,
+                          tile_shape: Tuple[int, int] = (512, 512),
+                          workers: Optional[int] = None) -> np.ndarray:
+        """
+        Hourly insolation for a DEM and day of year, cached as float16 W/m².
+
+        Shape (24, rows, cols); slope and aspect come from the terrain cache
+        and shading from the horizon cache. Computed tile by tile, so only
+        one (24,) + tile block per worker is held in memory. The file name
+        carries every setting, and the horizon cache is validated first so
+        a changed DEM invalidates it too.
+        """
+        if cache_dir is None:
+            cache_dir = self._cache_dir(dem_path, cell_size, n_sectors, max_distance)
+        horizon = self.horizon_raster(dem_path, cell_size, n_sectors, max_distance, cache_dir)
+        path = os.path.join(cache_dir, f"insolation_lat{latitude:+.4f}_doy{day_of_year:03d}"
+                                       f"_cell{cell_size:g}_sec{n_sectors}_dist{max_distance:g}.npy")
+        if os.path.exists(path):
+            return open_raster(path)
+
+        terrain = self.terrain.calculate_terrain_raster(dem_path, cell_size)
+        slope, aspect = terrain["slope_degrees"], terrain["aspect"]
+
+        # Write under a temporary name so readers never see a partial file
+        tmp_path = path[:-4] + ".tmp.npy"
+        out = create_raster(tmp_path, (len(self.HOURS),) + slope.shape, np.float16)
+
+        def process(windows):
+            window = windows[0]
+            out[(slice(None),) + window] = self.hourly_insolation(
+                slope[window], aspect[window], latitude, day_of_year, horizon[(slice(None),) + window])
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(process, iter_windows(slope.shape, tile_shape)))
+
+        out.flush()
+        del out
+        os.replace(tmp_path, path)
+        return open_raster(path)
+
+    def _cache_dir(self, dem_path: str, cell_size: float, n_sectors: int, max_distance: float) -> str:
+        return derived_cache_dir(dem_path, "solar", self.CACHE_FORMAT_VERSION,
+                                 cell_size, n_sectors, max_distance)
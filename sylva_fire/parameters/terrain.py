@@ -1,12 +1,22 @@
 """Terrain parameters - Aspect, Slope"""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
 import numpy as np
-from typing import Dict
+
+from sylva_fire.data.raster import (cache_manifest, create_raster, derived_cache_dir, iter_windows,
+                                    manifest_matches, open_raster, write_manifest)
 
 
 class TerrainCalculator:
     """Calculate terrain parameters."""
     
+    SLOPE_METHODS = ("horn", "zevenbergen_thorne")
+    TERRAIN_LAYERS = ("slope_degrees", "slope_percent", "aspect", "aspect_norm")
+    CACHE_FORMAT_VERSION = 1
+    
     def calculate_aspect_norm(self, aspect: float) -> float:
         """Normalize terrain aspect (0-1)."""
         aspect_rad = np.radians(aspect)
@@ -14,6 +24,19 @@ class TerrainCalculator:
         norm = (1 + np.cos(aspect_rad - target_rad)) / 2
         return np.clip(norm, 0.0, 1.0)
     
+    def calculate_insolation_norm(self,
+                                  insolation: np.ndarray,
+                                  reference: Optional[float] = None) -> np.ndarray:
+        """
+        Normalize insolation (0-1); a radiation-based alternative to calculate_aspect_norm.
+        
+        reference defaults to the grid maximum.
+        """
+        insolation = np.asarray(insolation, dtype=float)
+        if reference is None:
+            reference = np.nanmax(insolation)
+        return np.clip(insolation / reference, 0.0, 1.0)
+    
     def get_aspect_class(self, aspect: float) -> Dict:
         """Get aspect class and characteristics."""
         if aspect < 45 or aspect >= 315:
@@ -35,3 +58,105 @@ class TerrainCalculator:
             "ros_adjustment_factor": ros_adjustment,
             "normalized_value": self.calculate_aspect_norm(aspect)
         }
+    
+    def _gradients(self, block: np.ndarray, cell_size: float, method: str) -> Tuple[np.ndarray, np.ndarray]:
+        """dz/dx (east) and dz/dy (south) of the interior of a block with a 1-cell halo."""
+        z = block.astype(np.float64, copy=False)
+        a, b, c = z[:-2, :-2], z[:-2, 1:-1], z[:-2, 2:]
+        d, f = z[1:-1, :-2], z[1:-1, 2:]
+        g, h, i = z[2:, :-2], z[2:, 1:-1], z[2:, 2:]
+        if method == "horn":
+            dz_dx = ((c + 2.0 * f + i) - (a + 2.0 * d + g)) / (8.0 * cell_size)
+            dz_dy = ((g + 2.0 * h + i) - (a + 2.0 * b + c)) / (8.0 * cell_size)
+        else:
+            dz_dx = (f - d) / (2.0 * cell_size)
+            dz_dy = (h - b) / (2.0 * cell_size)
+        return dz_dx, dz_dy
+    
+    def calculate_slope_aspect(self,
+                               dem: np.ndarray,
+                               cell_size: float,
+                               method: str = "horn",
+                               halo_block: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Slope (degrees and percent), aspect and aspect norm from a DEM grid.
+        
+        Uses the Horn (1981) or Zevenbergen & Thorne (1987) 3×3 kernel;
+        rows run north to south. Aspect is the downslope direction in
+        degrees clockwise from north, NaN on flat cells. With halo_block
+        the input already carries a 1-cell border; otherwise edges are
+        replicated. Outputs are float32.
+        """
+        if method not in self.SLOPE_METHODS:
+            raise ValueError(f"Unknown method '{method}', expected one of {self.SLOPE_METHODS}")
+        dem = np.asarray(dem)
+        if not halo_block:
+            dem = np.pad(dem, 1, mode="edge")
+        
+        dz_dx, dz_dy = self._gradients(dem, cell_size, method)
+        rise = np.hypot(dz_dx, dz_dy)
+        aspect = np.degrees(np.arctan2(-dz_dx, dz_dy)) % 360.0
+        aspect[rise == 0] = np.nan
+        
+        return {
+            "slope_degrees": np.degrees(np.arctan(rise)).astype(np.float32),
+            "slope_percent": (100.0 * rise).astype(np.float32),
+            "aspect": aspect.astype(np.float32),
+            "aspect_norm": self.calculate_aspect_norm(aspect).astype(np.float32)
+        }
+    
+    def calculate_terrain_raster(self,
+                                 dem_path: str,
+                                 cell_size: float,
+                                 method: str = "horn",
+                                 cache_dir: Optional[str] = None,
+                                 tile_shape: Tuple[int, int] = (1024, 1024),
+                                 workers: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Slope, aspect and aspect norm rasters for a DEM raster, cached on disk.
+        
+        Tiles are read with a 1-cell halo and processed in a thread pool.
+        Results are written as float32 .npy files under cache_dir (by
+        default next to the DEM, keyed on its mtime and size) and returned
+        as read-only memory maps. Later calls reuse them only while the
+        manifest still matches the DEM (path, mtime, size, shape), cell_size
+        and method; anything else recomputes them.
+        """
+        if method not in self.SLOPE_METHODS:
+            raise ValueError(f"Unknown method '{method}', expected one of {self.SLOPE_METHODS}")
+        if cache_dir is None:
+            cache_dir = derived_cache_dir(dem_path, "terrain", self.CACHE_FORMAT_VERSION, cell_size, method)
+        manifest_path = os.path.join(cache_dir, "manifest.json")
+        paths = {layer: os.path.join(cache_dir, f"{layer}.npy") for layer in self.TERRAIN_LAYERS}
+        
+        dem = open_raster(dem_path)
+        manifest = cache_manifest(dem_path, cell_size=cell_size, method=method, shape=dem.shape)
+        if manifest_matches(manifest_path, manifest):
+            return {layer: open_raster(path) for layer, path in paths.items()}
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        # Drop stale files first: an interrupted rebuild is never reused and
+        # maps still open on the old layers keep their own (unlinked) files
+        for stale in [manifest_path] + list(paths.values()):
+            if os.path.exists(stale):
+                os.unlink(stale)
+        outputs = {layer: create_raster(path, dem.shape, np.float32) for layer, path in paths.items()}
+        
+        def process(windows):
+            window, padded, inner = windows
+            block = dem[padded]
+            # Replicate edges where the halo runs off the grid
+            pad = tuple((1 - axis.start, 1 - (size - axis.stop)) for axis, size in zip(inner, block.shape))
+            if any(before or after for before, after in pad):
+                block = np.pad(block, pad, mode="edge")
+            result = self.calculate_slope_aspect(block, cell_size, method, halo_block=True)
+            for layer, values in result.items():
+                outputs[layer][window] = values
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(process, iter_windows(dem.shape, tile_shape, halo=1)))
+        
+        for array in outputs.values():
+            array.flush()
+        write_manifest(manifest_path, manifest)
+        return {layer: open_raster(path) for layer, path in paths.items()}
@@ -6,7 +6,16 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sylva_fire.utils.fuel_coefficients import FuelCoefficients
+from sylva_fire.utils.classification import ThresholdClassifier
+from sylva_fire.utils.fuel_registry import FuelRegistry, FUEL_REGISTRY, get_fuel_registry
+from sylva_fire.utils.state import save_state, load_state
 
 __all__ = [
     "FuelCoefficients",
+    "FuelRegistry",
+    "FUEL_REGISTRY",
+    "get_fuel_registry",
+    "ThresholdClassifier",
+    "save_state",
+    "load_state",
 ]
@@ -0,0 +1,78 @@
+"""Threshold classification shared by the hazard classifiers"""
+
+import bisect
+import math
+
+import numpy as np
+from typing import Optional, Sequence
+
+
+class ThresholdClassifier:
+    """
+    Map values to ordered classes through bin edges.
+
+    A value v gets class i when edges[i-1] <= v < edges[i], i.e. the
+    `if v < edge: ... elif` ladders used throughout SYLVA. Codes are uint8;
+    labels live in a separate lookup table.
+    """
+
+    MAX_COMPARISON_EDGES = 8
+
+    def __init__(self,
+                 edges: Sequence[float],
+                 labels: Sequence[str],
+                 lower: Optional[float] = None,
+                 upper: Optional[float] = None,
+                 fill_code: Optional[int] = None):
+        """
+        Values that are NaN or fall outside [lower, upper) get fill_code
+        when it is given; otherwise NaN sorts into the last class.
+        """
+        self.edges = np.asarray(edges, dtype=np.float64)
+        self._edge_list = [float(edge) for edge in self.edges]
+        self.labels = np.asarray(labels, dtype=object)
+        if len(self.labels) != len(self.edges) + 1:
+            raise ValueError("Need exactly one more label than edges")
+        if np.any(np.diff(self.edges) <= 0):
+            raise ValueError("Edges must be strictly increasing")
+        self.lower = lower
+        self.upper = upper
+        self.fill_code = fill_code
+
+    def classify(self, values: np.ndarray) -> np.ndarray:
+        """Class codes (uint8) for an array of values."""
+        values = np.asarray(values)
+        if len(self.edges) <= self.MAX_COMPARISON_EDGES:
+            # For short ladders a few streaming comparisons beat the binary
+            # search; comparing in float64 keeps float32 inputs exact
+            codes = np.zeros(values.shape, dtype=np.uint8)
+            for edge in self.edges:
+                codes += np.greater_equal(values, edge, signature=(np.float64, np.float64, np.bool_))
+            codes[np.isnan(values)] = len(self.edges)
+        else:
+            codes = np.searchsorted(self.edges, values, side="right").astype(np.uint8)
+        if self.fill_code is not None:
+            invalid = np.isnan(values)
+            if self.lower is not None:
+                invalid |= values < self.lower
+            if self.upper is not None:
+                invalid |= values >= self.upper
+            codes[invalid] = self.fill_code
+        return codes
+
+    def code(self, value: float) -> int:
+        """Class code of a single value (same rules as classify)."""
+        if self.fill_code is not None:
+            if math.isnan(value) \
+                    or (self.lower is not None and value < self.lower) \
+                    or (self.upper is not None and value >= self.upper):
+                return self.fill_code
+        return bisect.bisect_right(self._edge_list, value)
+
+    def label(self, value: float) -> str:
+        """Class label of a single value."""
+        return self.labels[self.code(value)]
+
+    def lookup(self, codes: np.ndarray) -> np.ndarray:
+        """Labels for an array of class codes."""
+        return self.labels[np.asarray(codes)]
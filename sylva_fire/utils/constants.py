@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from typing import Dict
 
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY
+
 
 @dataclass
 class PhysicalConstants:
@@ -19,10 +21,8 @@ class FuelConstants:
     
     def __post_init__(self):
         self.CRITICAL_LFM = {
-            "pinus_halepensis": 85.0,
-            "quercus_ilex": 90.0,
-            "mediterranean_maquis": 80.0,
-            "dry_grassland": 70.0
+            name: float(FUEL_REGISTRY.lfm_critical[i])
+            for i, name in enumerate(FUEL_REGISTRY.fuel_types)
         }
 
 
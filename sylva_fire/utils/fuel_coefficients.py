@@ -1,10 +1,13 @@
 """Fuel-type specific coefficients"""
 
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Optional
 from dataclasses import dataclass
 
+from sylva_fire.utils.fuel_registry import FuelRegistry, get_fuel_registry
 
-@dataclass
+
+@dataclass(frozen=True)
 class FuelCoefficientSet:
     """Coefficient set for a specific fuel type."""
     weight_lfm: float = 0.20
@@ -19,44 +22,23 @@ class FuelCoefficientSet:
 
 
 class FuelCoefficients:
-    """Manager for fuel-type specific coefficients."""
-    
-    _instance = None
-    _coefficients: Dict[str, FuelCoefficientSet] = {}
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(FuelCoefficients, cls).__new__(cls)
-            cls._instance._load_coefficients()
-        return cls._instance
+    """Fuel-type specific coefficients, read from the fuel registry."""
     
-    def _load_coefficients(self):
-        """Load default coefficients."""
-        self._coefficients["pinus_halepensis"] = FuelCoefficientSet(
-            weight_lfm=0.20, weight_dfm=0.15, weight_cbd=0.12,
-            weight_sfl=0.10, weight_fbd=0.08, weight_wind=0.15,
-            weight_vpd=0.08, weight_aspect=0.06, weight_dc=0.06
-        )
-        self._coefficients["quercus_ilex"] = FuelCoefficientSet(
-            weight_lfm=0.18, weight_dfm=0.14, weight_cbd=0.14,
-            weight_sfl=0.12, weight_fbd=0.10, weight_wind=0.14,
-            weight_vpd=0.07, weight_aspect=0.05, weight_dc=0.06
-        )
-        self._coefficients["mediterranean_maquis"] = FuelCoefficientSet(
-            weight_lfm=0.22, weight_dfm=0.16, weight_cbd=0.10,
-            weight_sfl=0.08, weight_fbd=0.06, weight_wind=0.16,
-            weight_vpd=0.09, weight_aspect=0.07, weight_dc=0.06
-        )
-        self._coefficients["dry_grassland"] = FuelCoefficientSet(
-            weight_lfm=0.15, weight_dfm=0.18, weight_cbd=0.08,
-            weight_sfl=0.12, weight_fbd=0.10, weight_wind=0.18,
-            weight_vpd=0.10, weight_aspect=0.04, weight_dc=0.05
-        )
+    def __init__(self, registry: Optional[FuelRegistry] = None):
+        self.registry = registry if registry is not None else get_fuel_registry()
     
     def get_coefficients(self, fuel_type: str) -> Optional[FuelCoefficientSet]:
         """Get coefficients for specified fuel type."""
-        return self._coefficients.get(fuel_type)
+        if fuel_type not in self.registry:
+            return None
+        return _coefficient_set(self.registry, fuel_type)
     
     def list_fuel_types(self) -> list:
         """List all available fuel types."""
-        return list(self._coefficients.keys())
+        return list(self.registry.fuel_types)
+
+
+@lru_cache(maxsize=None)
+def _coefficient_set(registry: FuelRegistry, fuel_type: str) -> FuelCoefficientSet:
+    weights = registry.rsi_weight_dict(fuel_type)
+    return FuelCoefficientSet(**{f"weight_{param}": value for param, value in weights.items()})
@@ -0,0 +1,366 @@
+"""Struct-of-arrays registry of fuel-type coefficients
+
+Every fuel type gets a small integer id. All coefficients are held in
+contiguous NumPy arrays indexed by that id, so vectorized code can gather
+per-cell coefficients with a single fancy-index.
+"""
+
+import os
+import threading
+from types import MappingProxyType
+
+import numpy as np
+from typing import Dict, Iterable, Mapping, Optional, Sequence
+
+
+# Built-in coefficient tables (Mediterranean calibration).
+# Ids follow the insertion order of this dict.
+BUILTIN_FUEL_DEFINITIONS = {
+    "pinus_halepensis": {
+        "rothermel": {
+            "net_fuel_load": 2.5,
+            "surface_area_volume": 3500.0,
+            "fuel_bed_depth": 0.6,
+            "moisture_of_extinction": 0.25,
+            "heat_content": 18600.0,
+            "ovendry_density": 512.0,
+            "particle_density": 1540.0,
+            "optimum_packing_ratio": 0.02
+        },
+        "ros_linear": {"base": 5.0, "wind": 2.2, "moisture": 0.15},
+        "rsi_weights": {
+            "lfm": 0.20, "dfm": 0.15, "cbd": 0.12, "sfl": 0.10,
+            "fbd": 0.08, "wind": 0.15, "vpd": 0.08, "aspect": 0.06, "dc": 0.06
+        },
+        "calibration": {"beta_0": -4.8, "beta_1": 9.2, "beta_2": -4.1, "beta_3": 1.4},
+        "lfm_critical": 85.0,
+        "structure": {
+            "cbd_typical": 0.15,
+            "cbh_typical": 4.0,
+            "sfl_typical": 25.0,
+            "fbd_typical": 0.6
+        },
+        "crown_thresholds": {"cbd": 0.10, "cbh": 4.0}
+    },
+    "quercus_ilex": {
+        "rothermel": {
+            "net_fuel_load": 3.2,
+            "surface_area_volume": 2800.0,
+            "fuel_bed_depth": 1.2,
+            "moisture_of_extinction": 0.30,
+            "heat_content": 18400.0,
+            "ovendry_density": 580.0,
+            "particle_density": 1540.0,
+            "optimum_packing_ratio": 0.018
+        },
+        "ros_linear": {"base": 4.0, "wind": 1.8, "moisture": 0.12},
+        "rsi_weights": {
+            "lfm": 0.18, "dfm": 0.14, "cbd": 0.14, "sfl": 0.12,
+            "fbd": 0.10, "wind": 0.14, "vpd": 0.07, "aspect": 0.05, "dc": 0.06
+        },
+        "calibration": {"beta_0": -4.5, "beta_1": 8.7, "beta_2": -3.8, "beta_3": 1.3},
+        "lfm_critical": 75.0,
+        "structure": {
+            "cbd_typical": 0.18,
+            "cbh_typical": 3.0,
+            "sfl_typical": 35.0,
+            "fbd_typical": 0.7
+        },
+        "crown_thresholds": {"cbd": 0.15, "cbh": 3.0}
+    },
+    "mediterranean_maquis": {
+        "rothermel": {
+            "net_fuel_load": 4.0,
+            "surface_area_volume": 4000.0,
+            "fuel_bed_depth": 1.5,
+            "moisture_of_extinction": 0.20,
+            "heat_content": 18800.0,
+            "ovendry_density": 490.0,
+            "particle_density": 1540.0,
+            "optimum_packing_ratio": 0.025
+        },
+        "ros_linear": {"base": 6.0, "wind": 2.5, "moisture": 0.18},
+        "rsi_weights": {
+            "lfm": 0.22, "dfm": 0.16, "cbd": 0.10, "sfl": 0.08,
+            "fbd": 0.06, "wind": 0.16, "vpd": 0.09, "aspect": 0.07, "dc": 0.06
+        },
+        "calibration": {"beta_0": -4.3, "beta_1": 8.5, "beta_2": -3.6, "beta_3": 1.2},
+        "lfm_critical": 80.0,
+        "structure": {
+            "cbd_typical": 0.30,
+            "cbh_typical": 1.2,
+            "sfl_typical": 45.0,
+            "fbd_typical": 2.5
+        },
+        "crown_thresholds": {"cbd": 0.18, "cbh": 1.5}
+    },
+    "dry_grassland": {
+        "rothermel": {
+            "net_fuel_load": 0.8,
+            "surface_area_volume": 4500.0,
+            "fuel_bed_depth": 0.4,
+            "moisture_of_extinction": 0.15,
+            "heat_content": 17200.0,
+            "ovendry_density": 320.0,
+            "particle_density": 1540.0,
+            "optimum_packing_ratio": 0.015
+        },
+        "ros_linear": {"base": 8.0, "wind": 3.0, "moisture": 0.20},
+        "rsi_weights": {
+            "lfm": 0.15, "dfm": 0.18, "cbd": 0.08, "sfl": 0.12,
+            "fbd": 0.10, "wind": 0.18, "vpd": 0.10, "aspect": 0.04, "dc": 0.05
+        },
+        "calibration": {"beta_0": -3.9, "beta_1": 7.8, "beta_2": -3.2, "beta_3": 1.1},
+        "lfm_critical": 70.0,
+        "structure": {
+            "cbd_typical": 0.0,
+            "cbh_typical": 0.0,
+            "sfl_typical": 4.0,
+            "fbd_typical": 0.5
+        },
+        "crown_thresholds": {"cbd": 0.10, "cbh": 0.0}
+    },
+    "pinus_pinaster": {
+        "rothermel": {
+            "net_fuel_load": 3.0,
+            "surface_area_volume": 3200.0,
+            "fuel_bed_depth": 0.7,
+            "moisture_of_extinction": 0.22,
+            "heat_content": 18500.0,
+            "ovendry_density": 540.0,
+            "particle_density": 1540.0,
+            "optimum_packing_ratio": 0.019
+        },
+        "ros_linear": {"base": 5.5, "wind": 2.4, "moisture": 0.16},
+        "rsi_weights": {
+            "lfm": 0.18, "dfm": 0.15, "cbd": 0.13, "sfl": 0.11,
+            "fbd": 0.09, "wind": 0.15, "vpd": 0.08, "aspect": 0.05, "dc": 0.06
+        },
+        "calibration": {"beta_0": -4.6, "beta_1": 8.9, "beta_2": -3.9, "beta_3": 1.35},
+        # LFM threshold and structure defaults are not yet calibrated for
+        # P. pinaster; they mirror pinus_halepensis.
+        "lfm_critical": 85.0,
+        "structure": {
+            "cbd_typical": 0.15,
+            "cbh_typical": 4.0,
+            "sfl_typical": 25.0,
+            "fbd_typical": 0.6
+        },
+        "crown_thresholds": {"cbd": 0.12, "cbh": 5.0}
+    }
+}
+
+# Linear Rothermel stand-in used for fuels outside the registry
+DEFAULT_ROS_LINEAR = {"base": 5.0, "wind": 2.0, "moisture": 0.1}
+
+
+class FuelRegistry:
+    """
+    Fuel coefficients as contiguous arrays indexed by integer fuel id.
+
+    registry.rsi_weights[fuel_ids] -> (cells × 9) weights in one gather
+
+    Registries are immutable: tables are read-only arrays and the per-fuel
+    dict views are read-only mappings built once, so one instance can be
+    shared freely between calculators and threads.
+    """
+
+    DEFAULT_FUEL = "pinus_halepensis"
+
+    ROTHERMEL_TERMS = (
+        "net_fuel_load",
+        "surface_area_volume",
+        "fuel_bed_depth",
+        "moisture_of_extinction",
+        "heat_content",
+        "ovendry_density",
+        "particle_density",
+        "optimum_packing_ratio",
+    )
+    ROS_LINEAR_TERMS = ("base", "wind", "moisture")
+    RSI_PARAMETERS = ("lfm", "dfm", "cbd", "sfl", "fbd", "wind", "vpd", "aspect", "dc")
+    CALIBRATION_TERMS = ("beta_0", "beta_1", "beta_2", "beta_3")
+    STRUCTURE_TERMS = ("cbd_typical", "cbh_typical", "sfl_typical", "fbd_typical")
+    CROWN_THRESHOLD_TERMS = ("cbd", "cbh")
+
+    def __init__(self,
+                 fuel_types: Sequence[str],
+                 rothermel: np.ndarray,
+                 ros_linear: np.ndarray,
+                 rsi_weights: np.ndarray,
+                 calibration: np.ndarray,
+                 lfm_critical: np.ndarray,
+                 structure: np.ndarray,
+                 crown_thresholds: np.ndarray,
+                 ros_fallback: Optional[np.ndarray] = None):
+        self.fuel_types = tuple(fuel_types)
+        self._ids = MappingProxyType({name: i for i, name in enumerate(self.fuel_types)})
+
+        n = len(self.fuel_types)
+        self.rothermel = self._table(rothermel, (n, len(self.ROTHERMEL_TERMS)))
+        self.ros_linear = self._table(ros_linear, (n, len(self.ROS_LINEAR_TERMS)))
+        self.rsi_weights = self._table(rsi_weights, (n, len(self.RSI_PARAMETERS)))
+        self.calibration = self._table(calibration, (n, len(self.CALIBRATION_TERMS)))
+        self.lfm_critical = self._table(lfm_critical, (n,))
+        self.structure = self._table(structure, (n, len(self.STRUCTURE_TERMS)))
+        self.crown_thresholds = self._table(crown_thresholds, (n, len(self.CROWN_THRESHOLD_TERMS)))
+
+        if ros_fallback is None:
+            ros_fallback = [DEFAULT_ROS_LINEAR[k] for k in self.ROS_LINEAR_TERMS]
+        self.ros_fallback = self._table(ros_fallback, (len(self.ROS_LINEAR_TERMS),))
+
+        self._row_views = {
+            "rothermel": self._row_views_of(self.rothermel, self.ROTHERMEL_TERMS),
+            "rsi_weights": self._row_views_of(self.rsi_weights, self.RSI_PARAMETERS),
+            "calibration": self._row_views_of(self.calibration, self.CALIBRATION_TERMS),
+            "structure": self._row_views_of(self.structure, self.STRUCTURE_TERMS),
+        }
+        self._crown_threshold_views = {
+            term: MappingProxyType(dict(zip(self.fuel_types, map(float, self.crown_thresholds[:, i]))))
+            for i, term in enumerate(self.CROWN_THRESHOLD_TERMS)
+        }
+
+    @staticmethod
+    def _table(values, shape) -> np.ndarray:
+        """Read-only contiguous float64 view of values with the given shape."""
+        array = np.ascontiguousarray(values, dtype=np.float64)
+        if array.shape != shape:
+            raise ValueError(f"Expected coefficient table of shape {shape}, got {array.shape}")
+        array = array.view()
+        array.flags.writeable = False
+        return array
+
+    @staticmethod
+    def _row_views_of(table: np.ndarray, terms: Sequence[str]) -> tuple:
+        return tuple(
+            MappingProxyType({term: float(value) for term, value in zip(terms, row)})
+            for row in table
+        )
+
+    @classmethod
+    def from_definitions(cls, definitions: Dict[str, Dict]) -> "FuelRegistry":
+        """Build a registry from per-fuel nested dicts (BUILTIN_FUEL_DEFINITIONS layout)."""
+        names = list(definitions)
+
+        def rows(group, terms):
+            return [[definitions[name][group][term] for term in terms] for name in names]
+
+        return cls(
+            fuel_types=names,
+            rothermel=rows("rothermel", cls.ROTHERMEL_TERMS),
+            ros_linear=rows("ros_linear", cls.ROS_LINEAR_TERMS),
+            rsi_weights=rows("rsi_weights", cls.RSI_PARAMETERS),
+            calibration=rows("calibration", cls.CALIBRATION_TERMS),
+            lfm_critical=[definitions[name]["lfm_critical"] for name in names],
+            structure=rows("structure", cls.STRUCTURE_TERMS),
+            crown_thresholds=rows("crown_thresholds", cls.CROWN_THRESHOLD_TERMS),
+        )
+
+    TABLES = (
+        "rothermel",
+        "ros_linear",
+        "rsi_weights",
+        "calibration",
+        "lfm_critical",
+        "structure",
+        "crown_thresholds",
+        "ros_fallback",
+    )
+
+    def as_arrays(self) -> Dict[str, np.ndarray]:
+        """All tables plus the fuel names, e.g. for np.savez."""
+        arrays = {name: getattr(self, name) for name in self.TABLES}
+        arrays["fuel_types"] = np.array(self.fuel_types)
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "FuelRegistry":
+        """Inverse of as_arrays(); contiguous float64 inputs are used without copying."""
+        return cls(
+            fuel_types=[str(name) for name in arrays["fuel_types"]],
+            **{name: arrays[name] for name in cls.TABLES}
+        )
+
+    def __len__(self) -> int:
+        return len(self.fuel_types)
+
+    def __contains__(self, fuel_type: str) -> bool:
+        return fuel_type in self._ids
+
+    def fuel_id(self, fuel_type: str) -> int:
+        """Integer id of a fuel type (-1 if unknown)."""
+        return self._ids.get(fuel_type, -1)
+
+    def resolve_id(self, fuel_type: Optional[str]) -> int:
+        """Integer id of a fuel type, falling back to DEFAULT_FUEL."""
+        return self._ids.get(fuel_type, self._ids[self.DEFAULT_FUEL])
+
+    def fuel_ids(self, fuel_types: Iterable[str]) -> np.ndarray:
+        """Map fuel type names to an int16 id array (-1 for unknown names)."""
+        names = np.asarray(fuel_types)
+        unique, inverse = np.unique(names, return_inverse=True)
+        lookup = np.array([self.fuel_id(name) for name in unique], dtype=np.int16)
+        return lookup[inverse].reshape(names.shape)
+
+    def clip_ids(self, fuel_ids: np.ndarray) -> np.ndarray:
+        """Replace out-of-range ids with the DEFAULT_FUEL id."""
+        fuel_ids = np.asarray(fuel_ids)
+        valid = (fuel_ids >= 0) & (fuel_ids < len(self.fuel_types))
+        return np.where(valid, fuel_ids, self._ids[self.DEFAULT_FUEL])
+
+    # Read-only dict views for the scalar, name-based APIs
+
+    def _row_view(self, table: str, fuel_type: str) -> Mapping[str, float]:
+        return self._row_views[table][self.resolve_id(fuel_type)]
+
+    def rothermel_params(self, fuel_type: str) -> Mapping[str, float]:
+        """Rothermel fuel parameters for one fuel type."""
+        return self._row_view("rothermel", fuel_type)
+
+    def ros_coefficients(self, fuel_type: str) -> tuple:
+        """(base, wind, moisture) linear ROS coefficients; fallback row if unknown."""
+        fuel_id = self.fuel_id(fuel_type)
+        row = self.ros_linear[fuel_id] if fuel_id >= 0 else self.ros_fallback
+        return tuple(float(value) for value in row)
+
+    def rsi_weight_dict(self, fuel_type: str) -> Mapping[str, float]:
+        """RSI weights for one fuel type."""
+        return self._row_view("rsi_weights", fuel_type)
+
+    def calibration_dict(self, fuel_type: str) -> Mapping[str, float]:
+        """Probability calibration coefficients for one fuel type."""
+        return self._row_view("calibration", fuel_type)
+
+    def structure_dict(self, fuel_type: str) -> Mapping[str, float]:
+        """Fuel structure defaults for one fuel type."""
+        return self._row_view("structure", fuel_type)
+
+    def crown_threshold_dict(self, term: str) -> Mapping[str, float]:
+        """One crown fire threshold ("cbd" or "cbh") for every fuel type."""
+        return self._crown_threshold_views[term]
+
+
+def _load_process_registry() -> FuelRegistry:
+    """Built-in tables, or the fuel-model directory named by SYLVA_FUEL_MODELS."""
+    source_dir = os.environ.get("SYLVA_FUEL_MODELS")
+    if source_dir:
+        from sylva_fire.data.fuel_models import load_fuel_models
+        return load_fuel_models(source_dir)
+    return FuelRegistry.from_definitions(BUILTIN_FUEL_DEFINITIONS)
+
+
+_REGISTRY_LOCK = threading.Lock()
+_process_registry: Optional[FuelRegistry] = None
+
+
+def get_fuel_registry() -> FuelRegistry:
+    """Return the process-wide fuel registry, loading it on first use."""
+    global _process_registry
+    if _process_registry is None:
+        with _REGISTRY_LOCK:
+            if _process_registry is None:
+                _process_registry = _load_process_registry()
+    return _process_registry
+
+
+FUEL_REGISTRY = get_fuel_registry()
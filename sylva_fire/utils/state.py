@@ -0,0 +1,69 @@
+"""Persistent per-cell model state
+
+Stateful models (hourly moisture codes, drought codes, online
+calibrators) save their state arrays as an .npz tagged with a kind and a
+format version, so a run can resume where the previous one stopped.
+"""
+
+import os
+import tempfile
+from typing import Dict, Optional
+
+import numpy as np
+
+
+def _process_umask() -> int:
+    """The process umask, read without changing it where the OS allows."""
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    # Elsewhere the umask can only be read by setting it; done once, at import
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _process_umask()
+
+
+def created_file_mode() -> int:
+    """
+    Permissions a plain open() would give a new file (0o666 minus the umask).
+
+    mkstemp creates files as 0600; atomic writers chmod their temporary
+    file to this before renaming it into place. The umask is read once
+    at import, never toggled per write, so concurrent threads are safe.
+    """
+    return 0o666 & ~_UMASK
+
+
+def save_state(path: str, kind: str, version: int, arrays: Dict[str, np.ndarray]):
+    """Atomically write state arrays to an .npz file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            np.savez(fh, state_kind=np.array(kind), state_version=np.array(version), **arrays)
+        os.chmod(tmp_path, created_file_mode())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_state(path: str, kind: str, version: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """Read state arrays written by save_state, checking kind and version."""
+    with np.load(path) as archive:
+        arrays = {name: archive[name] for name in archive.files}
+    stored_kind = str(arrays.pop("state_kind"))
+    stored_version = int(arrays.pop("state_version"))
+    if stored_kind != kind:
+        raise ValueError(f"{path} holds '{stored_kind}' state, expected '{kind}'")
+    if version is not None and stored_version != version:
+        raise ValueError(f"{path} has state version {stored_version}, expected {version}")
+    return arrays
@@ -0,0 +1,33 @@
+"""Tests for mid-flame wind rasters"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from sylva_fire.data.raster import open_raster
+from sylva_fire.parameters.atmospheric import AtmosphericCalculator
+
+
+def test_midflame_raster_accepts_per_pixel_canopy(tmp_path):
+    """Test that canopy structure given as paths or grids is windowed like canopy cover."""
+    rng = np.random.default_rng(2)
+    shape = (45, 61)
+    paths = {}
+    for name, values in (("wind", rng.uniform(0, 15, shape)),
+                         ("cover", rng.uniform(0, 1, shape)),
+                         ("height", rng.uniform(2, 25, shape))):
+        paths[name] = str(tmp_path / f"{name}.npy")
+        np.save(paths[name], values.astype(np.float32))
+    crown_ratio = rng.uniform(0.2, 0.8, shape).astype(np.float32)
+
+    calculator = AtmosphericCalculator()
+    calculator.calculate_midflame_wind_raster(
+        paths["wind"], paths["cover"], str(tmp_path / "midflame.npy"), method="sheltered",
+        tile_shape=(16, 20), canopy_height=paths["height"], crown_ratio=crown_ratio, fuel_bed_depth=0.4)
+
+    expected = calculator.calculate_midflame_wind(
+        np.load(paths["wind"]), np.load(paths["cover"]), "sheltered",
+        canopy_height=np.load(paths["height"]), crown_ratio=crown_ratio, fuel_bed_depth=0.4)
+    assert np.array_equal(open_raster(str(tmp_path / "midflame.npy")), expected)
@@ -0,0 +1,119 @@
+"""Tests for calibration fitting and fuel-model write-back"""
+
+import sys
+import os
+import json
+import shutil
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+
+from sylva_fire.data.fuel_models import DEFAULT_FUEL_MODEL_DIR, load_fuel_models
+from sylva_fire.integration.calibration_fitting import (
+    fit_calibration,
+    fit_logistic_irls,
+    write_calibration_coefficients,
+    write_fuel_model_tables,
+)
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY
+
+
+def _copy_models(tmp_path):
+    model_dir = tmp_path / "fuel_models"
+    shutil.copytree(DEFAULT_FUEL_MODEL_DIR, model_dir, ignore=shutil.ignore_patterns("__pycache__"))
+    return str(model_dir)
+
+
+def _saturated_records(rng, n_per_cell=400):
+    """Records on four (RSI, confidence) cells: the model is saturated, so the MLE is closed-form."""
+    cells = [(0.0, 0.0), (0.5, 0.0), (1.0, 0.0), (0.0, 1.0)]
+    rsi, confidence, outcome = [], [], []
+    for r, c in cells:
+        rsi.append(np.full(n_per_cell, r))
+        confidence.append(np.full(n_per_cell, c))
+        outcome.append(rng.random(n_per_cell) < rng.uniform(0.1, 0.9))
+    return np.concatenate(rsi), np.concatenate(confidence), np.concatenate(outcome).astype(float)
+
+
+def _closed_form(rsi, confidence, outcome):
+    """β from the empirical log-odds of each cell."""
+    def log_odds(mask):
+        p = outcome[mask].mean()
+        return np.log(p / (1.0 - p))
+    l00 = log_odds((rsi == 0.0) & (confidence == 0.0))
+    l05 = log_odds(rsi == 0.5)
+    l10 = log_odds(rsi == 1.0)
+    l01 = log_odds(confidence == 1.0)
+    # l05 = β₀ + β₁/2 + β₂/4 and l10 = β₀ + β₁ + β₂
+    beta_2 = 2.0 * (l10 - l00) - 4.0 * (l05 - l00)
+    beta_1 = (l10 - l00) - beta_2
+    return {"beta_0": l00, "beta_1": beta_1, "beta_2": beta_2, "beta_3": l01 - l00}
+
+
+def test_irls_matches_closed_form_fit():
+    """Test IRLS against the closed-form MLE of a saturated design, also per fuel group."""
+    rng = np.random.default_rng(21)
+    rsi, confidence, outcome = _saturated_records(rng)
+    expected = _closed_form(rsi, confidence, outcome)
+
+    fitted = fit_logistic_irls(rsi, confidence, outcome)
+    for term, value in expected.items():
+        assert np.isclose(fitted[term], value, atol=1e-4), term
+
+    # Grouped fit: one fuel with the same records, one below MIN_RECORDS is skipped
+    fuel_ids = np.full(len(rsi), FUEL_REGISTRY.fuel_id("quercus_ilex"))
+    fuel_ids[:10] = FUEL_REGISTRY.fuel_id("dry_grassland")
+    grouped = fit_calibration(rsi, confidence, outcome, fuel_ids, workers=1)
+    assert list(grouped) == ["quercus_ilex"]
+    reference = fit_logistic_irls(rsi[10:], confidence[10:], outcome[10:])
+    for term, value in reference.items():
+        assert np.isclose(grouped["quercus_ilex"][term], value)
+
+
+def test_written_coefficients_keep_their_rsi_scale(tmp_path):
+    """Test that refitted (unit) and shipped (percent) tables load on one scale."""
+    model_dir = _copy_models(tmp_path)
+    path = os.path.join(model_dir, "quercus_ilex.json")
+    os.chmod(path, 0o644)
+    fitted = {"beta_0": -3.0, "beta_1": 6.5, "beta_2": -2.25, "beta_3": 1.1}
+
+    write_calibration_coefficients({"quercus_ilex": fitted}, model_dir)
+
+    with open(path, "r", encoding="utf-8") as fh:
+        assert json.load(fh)["calibration_coefficients"]["rsi_scale"] == "unit"
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+    registry = load_fuel_models(model_dir, use_cache=False)
+    assert dict(registry.calibration_dict("quercus_ilex")) == fitted
+    # Not refitted: the shipped percent-scale betas are converted
+    pinus = registry.calibration_dict("pinus_halepensis")
+    assert np.isclose(pinus["beta_1"], 0.12 * 100)
+    assert np.isclose(pinus["beta_2"], -0.0008 * 100 ** 2)
+    assert pinus["beta_0"] == -4.82
+
+
+def test_calibration_without_rsi_scale_is_rejected(tmp_path):
+    """Test that a calibration table of unknown scale fails to load."""
+    model_dir = _copy_models(tmp_path)
+    path = os.path.join(model_dir, "dry_grassland.json")
+    with open(path, "r", encoding="utf-8") as fh:
+        document = json.load(fh)
+    del document["calibration_coefficients"]["rsi_scale"]
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(document, fh)
+
+    with pytest.raises(ValueError):
+        load_fuel_models(model_dir, use_cache=False)
+
+
+def test_failed_write_leaves_no_model_file(tmp_path):
+    """Test that an aborted write-back leaves the fuel-model directory as it was."""
+    model_dir = _copy_models(tmp_path)
+    before = sorted(os.listdir(model_dir))
+
+    with pytest.raises(TypeError):
+        write_fuel_model_tables({"quercus_ilex": {"beta_0": object()}}, "calibration_coefficients", model_dir)
+
+    assert sorted(os.listdir(model_dir)) == before
+    load_fuel_models(model_dir, use_cache=False)
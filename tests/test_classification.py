@@ -0,0 +1,108 @@
+"""Tests for threshold classification against the scalar if/elif ladders"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+
+from sylva_fire.core.byram import ByramIntensity
+from sylva_fire.forecasting.rapid_spread_forecast import RapidSpreadForecaster
+from sylva_fire.integration.confidence_estimator import ConfidenceEstimator
+from sylva_fire.parameters.atmospheric import AtmosphericCalculator
+from sylva_fire.parameters.drought import DroughtCodeCalculator
+from sylva_fire.parameters.fuel_moisture import FuelMoistureCalculator
+from sylva_fire.parameters.fuel_structure import FuelStructureCalculator
+from sylva_fire.utils.classification import ThresholdClassifier
+
+
+def _below_ladder(edges, labels):
+    """The `if v < edge` ladder: NaN fails every test and lands in the last class."""
+    def classify(value):
+        for edge, label in zip(edges, labels):
+            if value < edge:
+                return label
+        return labels[-1]
+    return classify
+
+
+def _at_least_ladder(edges, labels):
+    """The `if v >= edge` ladder from the top: NaN lands in the first class."""
+    def classify(value):
+        for edge, label in zip(reversed(edges), reversed(labels[1:])):
+            if value >= edge:
+                return label
+        return labels[0]
+    return classify
+
+
+def _hazard_level(probability):
+    """RapidSpreadForecaster's original scan of the THRESHOLDS ranges."""
+    for level, (low, high) in RapidSpreadForecaster.THRESHOLDS.items():
+        if low <= probability < high:
+            return level
+    return "normal"
+
+
+LADDERS = [
+    (ByramIntensity.FIRE_BEHAVIOR_CLASSES,
+     _below_ladder([500, 2000, 4000, 10000, 25000],
+                   ["Low", "Moderate", "High", "Very High", "Extreme", "Catastrophic"])),
+    (DroughtCodeCalculator.DC_HAZARD_CLASSES,
+     _below_ladder([100, 200, 300, 400, 500],
+                   ["Very Low", "Low", "Moderate", "High", "Very High", "Extreme"])),
+    (AtmosphericCalculator.VPD_HAZARD_CLASSES,
+     _below_ladder([5, 10, 15, 25, 35],
+                   ["Very Low", "Low", "Moderate", "High", "Very High", "Extreme"])),
+    (AtmosphericCalculator.CANOPY_COVER_CLASSES,
+     _below_ladder([0.2, 0.5, 0.8], ["Open", "Sparse", "Moderate", "Dense"])),
+    (FuelStructureCalculator.CBD_HAZARD_CLASSES,
+     _below_ladder([0.05, 0.10, 0.15, 0.25], ["Very Low", "Low", "Moderate", "High", "Extreme"])),
+    (FuelMoistureCalculator.LFM_HAZARD_CLASSES,
+     _at_least_ladder([60, 80, 100, 120], ["Very Low", "Low", "Moderate", "High", "Very High"])),
+    (ConfidenceEstimator.CONFIDENCE_CLASSES,
+     _at_least_ladder([0.35, 0.50, 0.65, 0.75], ["Very Low", "Low", "Moderate", "High", "Very High"])),
+    (RapidSpreadForecaster.HAZARD_CLASSES, _hazard_level),
+]
+
+
+def _probe_values(classifier):
+    """Every edge, its float64 neighbours, the range limits and non-finite values."""
+    edges = list(classifier.edges) + [classifier.lower or 0.0, classifier.upper or 1.0]
+    probes = [np.nextafter(edge, -np.inf) for edge in edges] + edges
+    probes += [np.nextafter(edge, np.inf) for edge in edges]
+    return np.array(probes + [-1e9, -1.0, 0.0, 1e9, np.inf, -np.inf, np.nan])
+
+
+@pytest.mark.parametrize("classifier, ladder", LADDERS)
+def test_classifier_matches_scalar_ladder(classifier, ladder):
+    """Test that array and scalar classification equal the ladder at and around every edge."""
+    values = _probe_values(classifier)
+    expected = [ladder(value) for value in values]
+    assert list(classifier.lookup(classifier.classify(values))) == expected
+    assert [classifier.label(value) for value in values] == expected
+    # float32 inputs are compared in float64, so they classify like their float64 value
+    values32 = values.astype(np.float32)
+    assert list(classifier.lookup(classifier.classify(values32))) == [ladder(float(v)) for v in values32]
+
+
+def test_fill_code_and_long_ladders():
+    """Test the fill code for NaN and out-of-range values and the binary-search path."""
+    classifier = ThresholdClassifier([0.25, 0.5, 0.75], ["a", "b", "c", "d"],
+                                     lower=0.0, upper=1.0, fill_code=3)
+    values = np.array([np.nan, -0.1, 0.0, 0.5, 0.99, 1.0])
+    assert list(classifier.classify(values)) == [3, 3, 0, 2, 3, 3]
+    assert [classifier.code(value) for value in values] == [3, 3, 0, 2, 3, 3]
+
+    edges = np.arange(1.0, 13.0)
+    long_ladder = ThresholdClassifier(edges, [str(i) for i in range(13)])
+    assert len(edges) > ThresholdClassifier.MAX_COMPARISON_EDGES
+    values = np.concatenate([edges, edges - 0.5, [0.0, 100.0]])
+    assert list(long_ladder.classify(values)) == [long_ladder.code(value) for value in values]
+    assert list(long_ladder.classify(values)) == [_below_ladder(edges, list(range(13)))(v) for v in values]
+
+    with pytest.raises(ValueError):
+        ThresholdClassifier([1.0, 1.0], ["a", "b", "c"])
+    with pytest.raises(ValueError):
+        ThresholdClassifier([1.0], ["a"])
@@ -0,0 +1,39 @@
+"""Tests for the torching and crowning index solver"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from sylva_fire.core.crown_indices import CrownFireIndexSolver
+
+
+def test_solver_brackets_target():
+    """Test that the solved wind speed reproduces the target spread rate."""
+    solver = CrownFireIndexSolver()
+    target = np.array([0.5, 5.0, 20.0, 1e6])
+    moisture = np.array([6.0, 10.0, 14.0, 6.0])
+
+    wind = solver.solve_wind_speed(target, moisture, 0.0)
+    assert np.isinf(wind[-1])
+
+    finite = np.isfinite(wind)
+    below = solver._surface_ros(np.maximum(wind[finite] - solver.TOLERANCE, 0.0), moisture[finite], 0.0, None)
+    at = solver._surface_ros(wind[finite], moisture[finite], 0.0, None)
+    assert np.all(at >= target[finite])
+    assert np.all((below < target[finite]) | (wind[finite] == 0.0))
+
+
+def test_indices_order():
+    """Test that taller canopies torch at higher winds and sparse canopies never crown."""
+    solver = CrownFireIndexSolver()
+    result = solver.calculate_indices(
+        fuel_moisture=14.0,
+        canopy_base_height=np.array([2.0, 8.0, 8.0]),
+        foliar_moisture=100.0,
+        canopy_bulk_density=np.array([0.15, 0.15, 0.0]),
+    )
+    ti = result["torching_index_m_s"]
+    assert ti[0] <= ti[1]
+    assert np.isinf(result["crowning_index_m_s"][2])
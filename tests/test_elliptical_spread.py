@@ -0,0 +1,73 @@
+"""Tests for elliptical directional rate of spread"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from sylva_fire.core.elliptical_spread import EllipticalSpread
+from sylva_fire.core.rothermel import RothermelModel
+
+
+def test_head_back_and_symmetry():
+    """Test head ROS downwind, back ROS upwind and symmetry about the spread axis."""
+    spread = EllipticalSpread()
+    head = np.array([2.0, 5.0, 12.0])
+    wind = np.array([0.5, 3.0, 8.0])
+    # Wind from the west spreads the fire toward 90°
+    offsets = np.array([0.0, 180.0, 30.0, -30.0, 135.0, -135.0])
+    ros = spread.rate_of_spread(head, wind, 270.0, headings=90.0 + offsets)
+
+    ecc = spread.eccentricity(wind)
+    flank, back = spread.flank_and_backing(head, wind)
+    assert np.allclose(ros[:, 0], head)
+    assert np.allclose(ros[:, 1], head * (1 - ecc) / (1 + ecc))
+    assert np.allclose(ros[:, 1], back)
+    assert np.allclose(ros[:, 2], ros[:, 3]) and np.allclose(ros[:, 4], ros[:, 5])
+    assert np.all(ros[:, 0] > ros[:, 2]) and np.all(ros[:, 4] > ros[:, 1])
+    assert np.allclose(spread.rate_of_spread(head, wind, 270.0, headings=[180.0]), flank[:, None])
+
+    # wind_from=False takes wind_direction as the spread direction itself
+    toward = spread.rate_of_spread(head, wind, 90.0, headings=90.0 + offsets, wind_from=False)
+    assert np.allclose(toward, ros)
+
+
+def test_length_to_breadth_limits():
+    """Test a circular fire at zero wind and the cap on the length-to-breadth ratio."""
+    spread = EllipticalSpread()
+    assert np.isclose(spread.length_to_breadth(0.0), 1.0)
+    assert spread.eccentricity(0.0) == 0.0
+    calm = spread.rate_of_spread(4.0, 0.0, 123.0, headings=np.arange(0, 360, 15))
+    assert np.allclose(calm, 4.0)
+
+    lb = spread.length_to_breadth(np.array([-1.0, 0.0, 2.0, 5.0, 10.0, 40.0]))
+    assert lb[0] == 1.0 and np.all(np.diff(lb) >= 0)
+    assert lb[-1] == EllipticalSpread.MAX_LENGTH_TO_BREADTH
+
+
+def test_neighbour_headings():
+    """Test the compass headings of the raster neighbour offsets (rows increase southward)."""
+    headings = EllipticalSpread.neighbour_headings(EllipticalSpread.NEIGHBOURS_8)
+    assert np.allclose(headings, np.arange(0, 360, 45))
+    headings_16 = EllipticalSpread.neighbour_headings(EllipticalSpread.NEIGHBOURS_16)
+    assert np.all(np.diff(headings_16) > 0) and np.allclose(headings_16[::2], np.arange(0, 360, 45))
+
+
+def test_consistent_with_scalar_rate_of_spread():
+    """Test that head ROS from the scalar model comes back unchanged toward the wind."""
+    model = RothermelModel("pinus_halepensis", engine="physical")
+    spread = EllipticalSpread()
+    rng = np.random.default_rng(21)
+    moisture = rng.uniform(4.0, 20.0, 30)
+    wind = rng.uniform(0.0, 10.0, 30)
+    direction = rng.uniform(0.0, 360.0, 30)
+
+    head = model.calculate_rate_of_spread_array(moisture, wind)
+    ros = spread.rate_of_spread(head, wind, direction)
+    for i in range(30):
+        scalar = model.calculate_rate_of_spread(moisture[i], wind[i])
+        downwind = spread.rate_of_spread(scalar, wind[i], direction[i], headings=[(direction[i] + 180.0) % 360.0])
+        assert np.isclose(downwind[0], scalar)
+        # No neighbour direction spreads faster than the head fire
+        assert np.all(ros[i] <= scalar * (1 + 1e-6))
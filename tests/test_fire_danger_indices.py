@@ -0,0 +1,73 @@
+"""Tests for the KBDI, Fosberg, Nesterov and Angström indices"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from sylva_fire.parameters.fire_danger_indices import FireDangerIndexCalculator
+from sylva_fire.parameters.fuel_moisture import saturation_vapour_pressure
+
+
+def test_reference_values():
+    """Test Angström, Nesterov and Fosberg against hand-worked reference values."""
+    calculator = FireDangerIndexCalculator(shape=(2,))
+    # RH giving a dew point of exactly 10 °C at 25 °C
+    humidity = 100.0 * saturation_vapour_pressure(10.0) / saturation_vapour_pressure(25.0)
+    result = calculator.step([25.0, 27.0], [humidity, 20.0], [0.0, 30.0 / 2.23694], 0.0)
+
+    # Angström: RH/20 + (27 - T)/10
+    assert np.isclose(result["angstrom"][1], 1.0)
+    # Nesterov: T·(T - Td) = 25 · 15, accumulated until more than 3 mm of rain
+    assert np.isclose(result["nesterov"][0], 375.0)
+    assert np.isclose(calculator.step(25.0, humidity, 0.0, 1.0)["nesterov"][0], 750.0)
+    assert np.all(calculator.step(25.0, humidity, 0.0, 5.0)["nesterov"] == 0.0)
+
+    # FFWI is scaled to 100 for bone-dry fuel in a 30 mi/h wind
+    dry = FireDangerIndexCalculator().step(27.0, 0.0, 30.0 / 2.23694, 0.0)
+    assert np.isclose(dry["ffwi"], 100.0, rtol=3e-3)
+
+
+def test_kbdi_matches_imperial_formula():
+    """Test one metric KBDI drying step against the Keetch & Byram (1968) imperial equation."""
+    kbdi_mm, t_max, annual_rain = 60.0, 33.0, 850.0
+    calculator = FireDangerIndexCalculator(mean_annual_rain=annual_rain, kbdi=kbdi_mm)
+    result = calculator.step(t_max, 30.0, 2.0, 0.0)
+
+    q = kbdi_mm / 0.254                 # hundredths of an inch
+    t_f = t_max * 1.8 + 32.0
+    rain_in = annual_rain / 25.4
+    dq = (800.0 - q) * (0.968 * np.exp(0.0486 * t_f) - 8.30) * 1e-3 / (1.0 + 10.88 * np.exp(-0.0441 * rain_in))
+    assert np.isclose(result["kbdi"], (q + dq) * 0.254, rtol=1e-4)
+
+
+def test_kbdi_wet_spell_interception():
+    """Test that the first 5.08 mm are intercepted once per wet spell, not once per day."""
+    def run(rains):
+        calculator = FireDangerIndexCalculator(kbdi=100.0)
+        for rain in rains:
+            # Too cold for any drying
+            result = calculator.step(-20.0, 80.0, 1.0, rain)
+        return float(result["kbdi"])
+
+    assert np.isclose(run([6.0]), 100.0 - (6.0 - 5.08))
+    assert np.isclose(run([3.0, 3.0]), run([6.0]))
+    assert run([3.0, 0.0, 3.0]) == 100.0
+
+
+def test_state_round_trip(tmp_path):
+    """Test that a saved calculator resumes identically."""
+    rng = np.random.default_rng(4)
+    calculator = FireDangerIndexCalculator(shape=(3, 3), mean_annual_rain=rng.uniform(300, 900, (3, 3)))
+    for _ in range(5):
+        calculator.step(rng.uniform(15, 38, (3, 3)), rng.uniform(10, 70, (3, 3)), 3.0,
+                        rng.exponential(2, (3, 3)))
+    path = str(tmp_path / "indices.npz")
+    calculator.save(path)
+    loaded = FireDangerIndexCalculator.load(path)
+
+    weather = (30.0, 25.0, 5.0, np.full((3, 3), 2.0))
+    expected, actual = calculator.step(*weather), loaded.step(*weather)
+    for key in ("kbdi", "nesterov", "ffwi"):
+        assert np.array_equal(actual[key], expected[key])
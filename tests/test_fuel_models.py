@@ -0,0 +1,79 @@
+"""Tests for the compiled fuel-model cache"""
+
+import sys
+import os
+import shutil
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from sylva_fire.data import fuel_models
+from sylva_fire.data.fuel_models import DEFAULT_FUEL_MODEL_DIR, load_fuel_models
+from sylva_fire.utils.state import created_file_mode
+
+
+def _copy_models(tmp_path):
+    source_dir = tmp_path / "fuel_models"
+    source_dir.mkdir()
+    for name in os.listdir(DEFAULT_FUEL_MODEL_DIR):
+        if name.endswith(".json"):
+            shutil.copy(os.path.join(DEFAULT_FUEL_MODEL_DIR, name), source_dir / name)
+    return str(source_dir)
+
+
+def test_cache_reuse_and_invalidation(tmp_path, monkeypatch):
+    """Test that the cache is shared-readable, reused, refreshed on touch and rebuilt on edits."""
+    source_dir = _copy_models(tmp_path)
+    cache_path = os.path.join(source_dir, "__pycache__", "fuel_models.npz")
+    compiled = []
+    compile_fuel_models = fuel_models.compile_fuel_models
+    monkeypatch.setattr(fuel_models, "compile_fuel_models",
+                        lambda path: compiled.append(path) or compile_fuel_models(path))
+
+    registry = load_fuel_models(source_dir)
+    assert len(compiled) == 1
+    assert os.stat(cache_path).st_mode & 0o777 == created_file_mode()
+
+    # Unchanged sources: tables come from the cache
+    cached = load_fuel_models(source_dir)
+    assert len(compiled) == 1
+    assert np.array_equal(cached.rsi_weights, registry.rsi_weights)
+
+    # New mtime, same content: the hash matches, only the manifest is refreshed
+    path = os.path.join(source_dir, "quercus_ilex.json")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    load_fuel_models(source_dir)
+    load_fuel_models(source_dir)
+    assert len(compiled) == 1
+
+    # Same size, different content and mtime: the hash mismatch forces a rebuild
+    with open(path, "r", encoding="utf-8") as fh:
+        text = fh.read()
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(text.replace('"lfm": 0.18', '"lfm": 0.19'))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    assert os.stat(path).st_size == stat.st_size
+    rebuilt = load_fuel_models(source_dir)
+    assert len(compiled) == 2
+    assert rebuilt.rsi_weight_dict("quercus_ilex")["lfm"] == 0.19
+
+    # Size change: rebuilt again
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write("\n")
+    load_fuel_models(source_dir)
+    assert len(compiled) == 3
+
+    # Edited built-in tables (fuels the JSON files do not define): rebuilt
+    pinaster = fuel_models.BUILTIN_FUEL_DEFINITIONS["pinus_pinaster"]["rsi_weights"]
+    monkeypatch.setitem(pinaster, "dc", 0.07)
+    updated = load_fuel_models(source_dir)
+    assert len(compiled) == 4
+    assert updated.rsi_weight_dict("pinus_pinaster")["dc"] == 0.07
+
+
+def test_created_file_mode_matches_process_umask(tmp_path):
+    """Test that the cached umask gives the mode a plain open() creates."""
+    path = tmp_path / "plain.txt"
+    path.write_text("x")
+    assert os.stat(path).st_mode & 0o777 == created_file_mode()
@@ -0,0 +1,104 @@
+"""Tests for land-cover fuel mapping and the LFM raster pipeline"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+
+from sylva_fire.data.raster import create_raster, open_raster
+from sylva_fire.parameters.fuel_moisture import FuelMoistureCalculator
+from sylva_fire.parameters.fuel_structure import FuelStructureCalculator
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY
+
+
+def test_non_fuel_pixels_get_mask_nodata(tmp_path):
+    """Test that FUEL_NODATA pixels from the land-cover mapping are nodata in the LFM mask."""
+    rng = np.random.default_rng(3)
+    shape = (37, 53)
+    landcover_path = str(tmp_path / "landcover.npy")
+    landcover = create_raster(landcover_path, shape, np.uint8)
+    landcover[...] = rng.integers(0, 5, shape)
+    landcover.flush()
+    ndwi_path = str(tmp_path / "ndwi.npy")
+    ndwi = create_raster(ndwi_path, shape, np.float32)
+    ndwi[...] = rng.uniform(-0.2, 0.6, shape)
+    ndwi[0, 0] = np.nan
+    ndwi.flush()
+
+    # Code 0 is water (no fuel), code 4 is not in the mapping
+    mapping = {0: None, 1: "pinus_halepensis", 2: "quercus_ilex", 3: "dry_grassland"}
+    layers = FuelStructureCalculator().map_landcover_raster(
+        landcover_path, mapping, str(tmp_path / "fuel"), tile_shape=(16, 16))
+    fuel_ids = np.asarray(layers["fuel_id"])
+    non_fuel = fuel_ids == FuelStructureCalculator.FUEL_NODATA
+    assert np.array_equal(non_fuel, np.isin(np.asarray(landcover), [0, 4]))
+
+    calculator = FuelMoistureCalculator()
+    calculator.estimate_lfm_raster(ndwi_path, str(tmp_path / "lfm.npy"), str(tmp_path / "mask.npy"),
+                                   fuel_id_path=str(tmp_path / "fuel" / "fuel_id.npy"),
+                                   tile_shape=(16, 16))
+    mask = open_raster(str(tmp_path / "mask.npy"))
+    lfm = open_raster(str(tmp_path / "lfm.npy"))
+
+    nodata = non_fuel | np.isnan(lfm)
+    assert np.all(mask[nodata] == FuelMoistureCalculator.MASK_NODATA)
+    assert np.all(np.isin(mask[~nodata], [0, 1]))
+    critical = calculator._LFM_CRITICAL_TABLE[fuel_ids[~nodata]]
+    assert np.array_equal(mask[~nodata], (lfm[~nodata] < critical).astype(np.uint8))
+
+
+def test_landcover_lookup():
+    """Test lookup tables for mapped, unknown, non-fuel, unmapped and negative codes."""
+    calculator = FuelStructureCalculator()
+    lut = calculator.landcover_lookup({1: "quercus_ilex", 3: None, 4: "unknown_fuel", 6: "dry_grassland"})
+    nodata = FuelStructureCalculator.FUEL_NODATA
+    assert lut.dtype == np.uint8 and len(lut) == 7
+    assert lut.tolist() == [nodata, FUEL_REGISTRY.fuel_id("quercus_ilex"), nodata, nodata,
+                            FUEL_REGISTRY.resolve_id("unknown_fuel"), nodata,
+                            FUEL_REGISTRY.fuel_id("dry_grassland")]
+    assert len(calculator.landcover_lookup({})) == 0
+    with pytest.raises(ValueError):
+        calculator.landcover_lookup({-1: "quercus_ilex"})
+
+
+def test_float_and_nodata_landcover():
+    """Test that NaN, non-integer, out-of-range and nodata codes map to FUEL_NODATA."""
+    calculator = FuelStructureCalculator()
+    lut = calculator.landcover_lookup({0: "pinus_halepensis", 1: "quercus_ilex", 2: "dry_grassland"})
+    nodata = FuelStructureCalculator.FUEL_NODATA
+    landcover = np.array([0.0, 1.0, 2.0, np.nan, 1.5, -1.0, 3.0, np.inf, -9999.0])
+    expected = list(lut) + [nodata] * 6
+    assert calculator.map_fuel_ids(landcover, lut, nodata=-9999).tolist() == expected
+    assert calculator.map_fuel_ids(landcover.astype(np.float32), lut).tolist() == expected
+    assert calculator.map_fuel_ids(np.array([[0, 2], [1, 7]], dtype=np.int16), lut, nodata=2).tolist() \
+        == [[lut[0], nodata], [lut[1], nodata]]
+
+
+def test_landcover_raster_header_nodata(tmp_path):
+    """Test that the land-cover header nodata is honoured even when the code is mapped."""
+    path = str(tmp_path / "landcover.bin")
+    landcover = create_raster(path, (3, 4), np.int16, nodata=2)
+    landcover[...] = [[0, 1, 2, 2], [1, 1, 0, 2], [0, 0, 1, -5]]
+    landcover.flush()
+
+    mapping = {0: "pinus_halepensis", 1: "quercus_ilex", 2: "dry_grassland"}
+    layers = FuelStructureCalculator().map_landcover_raster(path, mapping, str(tmp_path / "fuel"))
+    non_fuel = np.isin(np.asarray(landcover), [2, -5])
+    assert np.all(layers["fuel_id"][non_fuel] == FuelStructureCalculator.FUEL_NODATA)
+    assert np.all(np.isnan(layers["cbd"][non_fuel]))
+
+
+def test_structure_arrays():
+    """Test that structure defaults follow the registry and nodata ids are NaN."""
+    calculator = FuelStructureCalculator()
+    fuel_ids = np.array([[0, 1], [len(FUEL_REGISTRY) - 1, FuelStructureCalculator.FUEL_NODATA]], dtype=np.uint8)
+    arrays = calculator.structure_arrays(fuel_ids)
+    assert list(arrays) == list(FuelStructureCalculator.STRUCTURE_LAYERS)
+    for i, layer in enumerate(FuelStructureCalculator.STRUCTURE_LAYERS):
+        values = arrays[layer]
+        assert values.dtype == np.float32 and values.shape == fuel_ids.shape
+        assert np.array_equal(values[[0, 0, 1], [0, 1, 0]],
+                              FUEL_REGISTRY.structure[fuel_ids[[0, 0, 1], [0, 1, 0]], i].astype(np.float32))
+        assert np.isnan(values[1, 1])
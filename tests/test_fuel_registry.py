@@ -0,0 +1,130 @@
+"""Tests for the fuel-type coefficient registry"""
+
+import sys
+import os
+import dataclasses
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+
+from sylva_fire.data.fuel_models import DEFAULT_FUEL_MODEL_DIR, load_fuel_models
+from sylva_fire.parameters.fuel_moisture import FuelMoistureCalculator
+from sylva_fire.utils import fuel_registry
+from sylva_fire.utils.constants import FuelConstants
+from sylva_fire.utils.fuel_coefficients import FuelCoefficients
+from sylva_fire.utils.fuel_registry import BUILTIN_FUEL_DEFINITIONS, FUEL_REGISTRY, FuelRegistry
+
+
+def test_ids_and_lookups():
+    """Test fuel ids, the default-fuel fallback and clipping of out-of-range ids."""
+    registry = FuelRegistry.from_definitions(BUILTIN_FUEL_DEFINITIONS)
+    names = list(BUILTIN_FUEL_DEFINITIONS)
+    assert registry.fuel_types == tuple(names) and len(registry) == len(names)
+    assert all(registry.fuel_id(name) == i for i, name in enumerate(names))
+    assert "quercus_ilex" in registry and "unknown" not in registry
+
+    default = registry.fuel_id(FuelRegistry.DEFAULT_FUEL)
+    assert registry.fuel_id("unknown") == -1
+    assert registry.resolve_id("unknown") == default and registry.resolve_id(None) == default
+    assert registry.resolve_id(names[-1]) == len(names) - 1
+
+    ids = registry.fuel_ids([[names[2], "unknown"], [names[0], names[2]]])
+    assert ids.dtype == np.int16 and ids.tolist() == [[2, -1], [0, 2]]
+    clipped = registry.clip_ids(np.array([-1, 0, len(names) - 1, len(names), 255]))
+    assert clipped.tolist() == [default, 0, len(names) - 1, default, default]
+
+
+def test_dict_views_match_tables():
+    """Test that the per-fuel dict views equal the table rows and fall back to the default fuel."""
+    registry = FUEL_REGISTRY
+    for i, name in enumerate(registry.fuel_types):
+        weights = registry.rsi_weight_dict(name)
+        assert list(weights) == list(FuelRegistry.RSI_PARAMETERS)
+        assert np.array_equal(list(weights.values()), registry.rsi_weights[i])
+        assert np.array_equal(list(registry.calibration_dict(name).values()), registry.calibration[i])
+        assert np.array_equal(list(registry.rothermel_params(name).values()), registry.rothermel[i])
+        assert np.array_equal(list(registry.structure_dict(name).values()), registry.structure[i])
+        assert registry.ros_coefficients(name) == tuple(registry.ros_linear[i])
+        assert registry.crown_threshold_dict("cbd")[name] == registry.crown_thresholds[i, 0]
+        assert FuelMoistureCalculator.LFM_CRITICAL[name] == registry.lfm_critical[i]
+
+    assert registry.rsi_weight_dict("unknown") is registry.rsi_weight_dict(FuelRegistry.DEFAULT_FUEL)
+    assert registry.ros_coefficients("unknown") == tuple(registry.ros_fallback)
+
+
+def test_views_are_read_only():
+    """Test that tables, dict views and the calculator's critical LFM cannot be modified."""
+    registry = FUEL_REGISTRY
+    with pytest.raises(ValueError):
+        registry.rsi_weights[0, 0] = 1.0
+    with pytest.raises(TypeError):
+        registry.calibration_dict("quercus_ilex")["beta_0"] = 0.0
+    with pytest.raises(TypeError):
+        FuelMoistureCalculator.LFM_CRITICAL["quercus_ilex"] = 0.0
+
+
+def test_array_round_trip_and_shape_check():
+    """Test that as_arrays/from_arrays round-trips and malformed tables are rejected."""
+    arrays = FUEL_REGISTRY.as_arrays()
+    copy = FuelRegistry.from_arrays(arrays)
+    assert copy.fuel_types == FUEL_REGISTRY.fuel_types
+    for name in FuelRegistry.TABLES:
+        assert np.array_equal(getattr(copy, name), getattr(FUEL_REGISTRY, name))
+
+    arrays["rsi_weights"] = arrays["rsi_weights"][:, :-1]
+    with pytest.raises(ValueError):
+        FuelRegistry.from_arrays(arrays)
+
+
+def test_rsi_weights_sum_to_one():
+    """Test that every fuel's RSI weights, built-in and shipped, sum to one."""
+    for registry in (FuelRegistry.from_definitions(BUILTIN_FUEL_DEFINITIONS),
+                     load_fuel_models(DEFAULT_FUEL_MODEL_DIR, use_cache=False)):
+        assert np.allclose(registry.rsi_weights.sum(axis=1), 1.0), registry.fuel_types
+        assert np.all(registry.rsi_weights >= 0)
+
+
+def test_process_registry_loads_once_across_threads(monkeypatch):
+    """Test that concurrent first calls to get_fuel_registry share one load."""
+    calls = []
+
+    def slow_load():
+        calls.append(1)
+        time.sleep(0.05)
+        return FuelRegistry.from_definitions(BUILTIN_FUEL_DEFINITIONS)
+
+    monkeypatch.setattr(fuel_registry, "_process_registry", None)
+    monkeypatch.setattr(fuel_registry, "_load_process_registry", slow_load)
+    barrier = threading.Barrier(8)
+
+    def first_call(_):
+        barrier.wait()
+        return fuel_registry.get_fuel_registry()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        registries = list(pool.map(first_call, range(8)))
+    assert len(calls) == 1
+    assert all(registry is registries[0] for registry in registries)
+
+
+def test_fuel_coefficients_and_constants_follow_registry():
+    """Test FuelCoefficients and FuelConstants.CRITICAL_LFM against the registry tables."""
+    coefficients = FuelCoefficients()
+    assert coefficients.list_fuel_types() == list(FUEL_REGISTRY.fuel_types)
+    assert coefficients.get_coefficients("unknown") is None
+    for name in FUEL_REGISTRY.fuel_types:
+        coefficient_set = coefficients.get_coefficients(name)
+        assert coefficient_set is coefficients.get_coefficients(name)
+        for param, weight in FUEL_REGISTRY.rsi_weight_dict(name).items():
+            assert getattr(coefficient_set, f"weight_{param}") == weight
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        coefficients.get_coefficients("quercus_ilex").weight_lfm = 0.5
+
+    # The old constants table had 90 for quercus_ilex; the calculators used 75
+    critical = FuelConstants().CRITICAL_LFM
+    assert critical == dict(FuelMoistureCalculator.LFM_CRITICAL)
+    assert critical["quercus_ilex"] == 75.0
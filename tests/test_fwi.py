@@ -0,0 +1,29 @@
+"""Tests for the Canadian Fire Weather Index System"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from sylva_fire.parameters.fwi import FireWeatherIndexSystem
+
+
+# Van Wagner & Pickett (1985) check table, April, standard start-up values:
+# (temperature °C, RH %, wind km/h, rain mm) -> FFMC, DMC, DC, ISI, BUI, FWI
+CHECK_TABLE = [
+    ((17.0, 42, 25, 0.0), (87.7, 8.5, 19.0, 10.9, 8.5, 10.1)),
+    ((20.0, 21, 25, 2.4), (86.2, 10.4, 23.6, 8.8, 10.4, 9.3)),
+    ((8.5, 40, 17, 0.0), (87.0, 11.8, 26.1, 6.5, 11.7, 7.6)),
+    ((6.5, 25, 6, 0.0), (88.8, 13.2, 28.2, 4.9, 13.1, 6.2)),
+    ((13.0, 34, 24, 0.0), (89.1, 15.4, 31.5, 12.6, 15.3, 14.8)),
+]
+
+
+def test_published_check_table():
+    """Test the daily sequence against the published FWI check values."""
+    system = FireWeatherIndexSystem(shape=(3,))
+    for (temperature, humidity, wind_kmh, rain), expected in CHECK_TABLE:
+        result = system.step(temperature, humidity, wind_kmh / 3.6, rain, month=4)
+        for key, value in zip(("ffmc", "dmc", "dc", "isi", "bui", "fwi"), expected):
+            assert np.all(np.round(result[key], 1) == value), key
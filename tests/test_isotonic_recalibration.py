@@ -0,0 +1,75 @@
+"""Tests for isotonic recalibration"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+
+from sylva_fire.integration.isotonic_recalibration import IsotonicRecalibrator
+
+
+def _naive_pav(x, y, w):
+    """Textbook PAV over tie-pooled values: merge the first violating pair, step back, repeat."""
+    values = np.unique(x)
+    blocks = [[np.sum((y * w)[x == v]), np.sum(w[x == v]), [k]] for k, v in enumerate(values)]
+    i = 0
+    while i < len(blocks) - 1:
+        if blocks[i][0] / blocks[i][1] > blocks[i + 1][0] / blocks[i + 1][1]:
+            total, weight, members = blocks.pop(i + 1)
+            blocks[i][0] += total
+            blocks[i][1] += weight
+            blocks[i][2] += members
+            i = max(i - 1, 0)
+        else:
+            i += 1
+    fitted = np.empty(len(values))
+    for total, weight, members in blocks:
+        fitted[members] = total / weight
+    return values, fitted
+
+
+def test_fit_is_monotone_and_matches_naive_pav():
+    """Test the fitted map against a naive PAV, including ties and sample weights."""
+    rng = np.random.default_rng(12)
+    for _ in range(20):
+        n = rng.integers(2, 400)
+        probability = rng.integers(0, 80, n) / 80.0
+        outcome = (rng.random(n) < probability ** 2).astype(float)
+        weight = rng.uniform(0.5, 2.0, n)
+
+        recalibrator = IsotonicRecalibrator().fit(probability, outcome, weight)
+        values, expected = _naive_pav(probability, outcome, weight)
+
+        assert np.allclose(recalibrator.transform(values), expected)
+        assert np.all(np.diff(recalibrator.breakpoints) >= 0.0)
+        assert np.all(np.diff(recalibrator.values) >= 0.0)
+        grid = np.linspace(-0.1, 1.1, 500)
+        assert np.all(np.diff(recalibrator.transform(grid)) >= 0.0)
+
+
+def test_save_load_round_trip(tmp_path):
+    """Test that saved breakpoints reload unchanged."""
+    rng = np.random.default_rng(1)
+    probability = rng.random(1000)
+    recalibrator = IsotonicRecalibrator().fit(probability, rng.random(1000) < probability)
+    path = str(tmp_path / "isotonic.npz")
+    recalibrator.save(path)
+
+    loaded = IsotonicRecalibrator.load(path)
+    assert np.array_equal(loaded.breakpoints, recalibrator.breakpoints)
+    assert np.array_equal(loaded.values, recalibrator.values)
+
+
+def test_invalid_input_is_rejected():
+    """Test that empty or mismatched samples raise and leave the calibrator unfitted."""
+    calibrator = IsotonicRecalibrator()
+    with pytest.raises(ValueError):
+        calibrator.fit([], [])
+    with pytest.raises(ValueError):
+        calibrator.fit([0.2, 0.4], [1.0])
+    assert not calibrator.is_fitted
+
+    single = IsotonicRecalibrator().fit([0.3], [1.0])
+    assert np.allclose(single.transform([0.0, 0.3, 1.0]), 1.0)
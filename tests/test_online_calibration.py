@@ -0,0 +1,76 @@
+"""Tests for online probability recalibration"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+
+from sylva_fire.integration.calibration_fitting import fit_logistic_irls
+from sylva_fire.integration.online_calibration import OnlineCalibrationUpdater
+from sylva_fire.integration.probability_calibration import ProbabilityCalibrator
+from sylva_fire.utils.state import created_file_mode
+
+
+TRUE_BETAS = np.array([-3.0, 6.0, -2.0, 1.0])
+
+
+def _batch(rng, n):
+    rsi = rng.beta(2, 2, n)
+    confidence = rng.uniform(0.5, 1.0, n)
+    logit = TRUE_BETAS @ np.vstack([np.ones(n), rsi, rsi * rsi, confidence])
+    return rsi, confidence, (rng.random(n) < 1.0 / (1.0 + np.exp(-logit))).astype(float)
+
+
+def test_sequential_updates_match_batch_fit():
+    """Test that batch-by-batch updates under a flat prior approach the full-archive IRLS fit."""
+    rng = np.random.default_rng(23)
+    batches = [_batch(rng, 4000) for _ in range(12)]
+    updater = OnlineCalibrationUpdater("quercus_ilex", prior_precision=1e-8)
+    for batch in batches:
+        updater.update(*batch)
+
+    archive = [np.concatenate(column) for column in zip(*batches)]
+    full = fit_logistic_irls(*archive, ridge=0.0)
+    online = updater.coefficients
+    for term in full:
+        assert np.isclose(online[term], full[term], atol=0.02), term
+    assert updater.version == 12 and updater.n_records == 48000
+
+    # A single batch is one exact MAP fit
+    single = OnlineCalibrationUpdater("quercus_ilex", prior_precision=1e-8)
+    single.update(*batches[0])
+    reference = fit_logistic_irls(*batches[0], ridge=0.0)
+    for term in reference:
+        assert np.isclose(single.coefficients[term], reference[term], atol=1e-5), term
+
+
+def test_state_round_trip_and_hot_swap(tmp_path):
+    """Test that saved state resumes exactly and a calibrator swaps in newer versions only."""
+    rng = np.random.default_rng(5)
+    updater = OnlineCalibrationUpdater("quercus_ilex", forgetting=0.9)
+    updater.update(*_batch(rng, 2000))
+    path = str(tmp_path / "online.npz")
+    updater.save(path)
+
+    loaded = OnlineCalibrationUpdater.load(path)
+    assert os.stat(path).st_mode & 0o777 == created_file_mode()
+    assert loaded.fuel_type == "quercus_ilex" and loaded.forgetting == 0.9
+    assert loaded.version == updater.version and loaded.n_records == updater.n_records
+    assert np.array_equal(loaded.precision, updater.precision)
+    batch = _batch(rng, 2000)
+    assert loaded.update(*batch) == updater.update(*batch)
+
+    calibrator = ProbabilityCalibrator("quercus_ilex")
+    assert calibrator.reload_coefficients(path)
+    assert calibrator.coefficients_version == 1
+    assert not calibrator.reload_coefficients(path)
+
+    updater.save(path)
+    assert calibrator.reload_coefficients(path)
+    assert calibrator.coefficients_version == 2
+    assert calibrator.coefficients == updater.coefficients
+
+    with pytest.raises(ValueError):
+        ProbabilityCalibrator("dry_grassland").reload_coefficients(path)
@@ -0,0 +1,50 @@
+"""Tests for the Rothermel surface spread model"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from sylva_fire.core.rothermel import RothermelModel
+
+
+def test_array_matches_scalar():
+    """Test that the array path reproduces the scalar path cell by cell."""
+    model = RothermelModel('pinus_halepensis')
+    rng = np.random.default_rng(42)
+    n = 500
+    moisture = rng.uniform(0, 80, n)
+    wind = rng.uniform(0, 20, n)
+    slope = rng.uniform(0, 40, n)
+    fuel_ids = rng.integers(-1, len(RothermelModel.FUEL_TYPES) + 1, n)
+
+    ros = model.calculate_rate_of_spread_array(moisture, wind, slope, fuel_ids)
+
+    for i in range(n):
+        if 0 <= fuel_ids[i] < len(RothermelModel.FUEL_TYPES):
+            fuel_type = RothermelModel.FUEL_TYPES[fuel_ids[i]]
+        else:
+            fuel_type = "unknown"
+        expected = model.calculate_rate_of_spread(moisture[i], wind[i], slope[i], fuel_type)
+        assert ros[i] == expected
+
+    assert ros.min() >= 1.0
+
+
+def test_physical_engine():
+    """Test the physical engine responds to moisture and wind as expected."""
+    model = RothermelModel('pinus_halepensis', engine='physical')
+
+    calm = model.calculate_rate_of_spread(6.0, 0.0)
+    windy = model.calculate_rate_of_spread(6.0, 4.0)
+    wet = model.calculate_rate_of_spread(15.0, 4.0)
+    extinct = model.calculate_rate_of_spread(30.0, 4.0)
+
+    assert 0 < calm < windy
+    assert wet < windy
+    assert extinct == 0.0
+
+    moisture = np.array([6.0, 15.0, 30.0])
+    ros = model.calculate_rate_of_spread_array(moisture, 4.0, 0.0)
+    assert np.allclose(ros, [windy, wet, extinct])
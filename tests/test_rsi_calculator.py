@@ -0,0 +1,126 @@
+"""Tests for the Rapid Spread Index calculator"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from sylva_fire.forecasting.rapid_spread_forecast import RapidSpreadForecaster
+from sylva_fire.integration.rsi_calculator import RSICalculator
+from sylva_fire.integration.weight_fitting import fit_rsi_weights
+from sylva_fire.utils.fuel_registry import FUEL_REGISTRY
+
+
+def test_batch_matches_dict_path():
+    """Test that the batch API reproduces the dict path, including missing values."""
+    calculator = RSICalculator('quercus_ilex')
+    rng = np.random.default_rng(7)
+    n = 300
+    values = np.column_stack([
+        rng.uniform(40, 220, n), rng.uniform(2, 35, n), rng.uniform(0, 0.3, n),
+        rng.uniform(0, 60, n), rng.uniform(0, 1, n), rng.uniform(0, 20, n),
+        rng.uniform(0, 50, n), rng.uniform(0, 360, n), rng.uniform(0, 700, n),
+    ])
+    values[rng.random(values.shape) < 0.3] = np.nan
+    values[0] = np.nan
+
+    rsi = calculator.calculate_rsi_array(values)
+
+    for i in range(n):
+        params = {
+            name: values[i, j]
+            for j, name in enumerate(RSICalculator.INPUT_FIELDS)
+            if not np.isnan(values[i, j])
+        }
+        expected = calculator.calculate_rsi(calculator.normalize_parameters(params))
+        assert rsi[i] == expected
+
+    assert rsi[0] == 0.5
+
+
+def test_weight_fit_recovers_simulated_weights():
+    """Test that fitted weights stay on the simplex and recover the generating weights."""
+    rng = np.random.default_rng(11)
+    n = 20000
+    normalized = rng.random((n, 9))
+    confidence = rng.uniform(0.5, 1.0, n)
+    true_weights = np.array([0.3, 0.05, 0.0, 0.1, 0.0, 0.35, 0.1, 0.0, 0.1])
+
+    calibration = FUEL_REGISTRY.calibration_dict('pinus_halepensis')
+    rsi = normalized @ true_weights
+    logit = (calibration['beta_0'] + calibration['beta_1'] * rsi
+             + calibration['beta_2'] * rsi ** 2 + calibration['beta_3'] * confidence)
+    outcome = (rng.random(n) < 1.0 / (1.0 + np.exp(-logit))).astype(float)
+
+    weights = fit_rsi_weights(normalized, confidence, outcome, normalized=True)
+    fitted = np.array([weights[param] for param in RSICalculator.PARAMETERS])
+
+    assert np.all(fitted >= 0.0)
+    assert abs(fitted.sum() - 1.0) < 1e-9
+    assert np.max(np.abs(fitted - true_weights)) < 0.05
+
+
+def test_sensitivity_gradients_match_finite_differences():
+    """Test the analytic probability and RSI gradients against central differences."""
+    forecaster = RapidSpreadForecaster('pinus_halepensis')
+    rng = np.random.default_rng(5)
+    n = 500
+    values = np.column_stack([
+        rng.uniform(40, 220, n), rng.uniform(2, 35, n), rng.uniform(0, 0.3, n),
+        rng.uniform(0, 60, n), rng.uniform(0, 1, n), rng.uniform(0, 20, n),
+        rng.uniform(0, 50, n), rng.uniform(0, 360, n), rng.uniform(0, 700, n),
+    ])
+    values[rng.random(values.shape) < 0.2] = np.nan
+
+    result = forecaster.predict_sensitivity(values)
+    h = 1e-5
+    for j in range(9):
+        plus, minus = values.copy(), values.copy()
+        plus[:, j] += h
+        minus[:, j] -= h
+        upper, lower = forecaster.predict_sensitivity(plus), forecaster.predict_sensitivity(minus)
+        present = ~np.isnan(values[:, j])
+        for key, gradient in (("probability", "probability_gradient"), ("rsi", "rsi_gradient")):
+            numeric = (upper[key] - lower[key]) / (2 * h)
+            assert np.allclose(numeric[present], result[gradient][present, j], atol=1e-7)
+        assert np.all(result["probability_gradient"][~present, j] == 0.0)
+
+
+def test_rsi_gradient_of_structured_input():
+    """Test ∂RSI/∂parameter for structured input with absent fields against central differences."""
+    calculator = RSICalculator('mediterranean_maquis')
+    rng = np.random.default_rng(9)
+    n = 400
+    fields = ("lfm", "dfm", "wind_speed", "vpd", "aspect", "drought_code")
+    values = np.zeros(n, dtype=[(name, float) for name in fields])
+    for name, (low, high) in zip(fields, [(40, 220), (2, 35), (0, 20), (0, 50), (0, 360), (0, 700)]):
+        values[name] = rng.uniform(low, high, n)
+
+    rsi, gradient = calculator.rsi_gradient_array(values)
+    assert np.array_equal(rsi, calculator.calculate_rsi_array(values))
+
+    h = 1e-5
+    for j, field in enumerate(RSICalculator.INPUT_FIELDS):
+        if field not in fields:
+            assert np.all(gradient[:, j] == 0.0)
+            continue
+        plus, minus = values.copy(), values.copy()
+        plus[field] += h
+        minus[field] -= h
+        numeric = (calculator.calculate_rsi_array(plus) - calculator.calculate_rsi_array(minus)) / (2 * h)
+        assert np.allclose(numeric, gradient[:, j], atol=1e-8)
+
+
+def test_normalization_table_drives_both_paths():
+    """Test that the dict and array normalizations both follow NORMALIZATION."""
+    class WetterLitter(RSICalculator):
+        NORMALIZATION = (("negative", 50.0, 150.0),) + RSICalculator.NORMALIZATION[1:4] \
+            + (("positive", 1.0, 0.2),) + RSICalculator.NORMALIZATION[5:]
+
+    calculator = WetterLitter()
+    row = np.array([100.0, 12.0, 0.1, 20.0, 0.6, 5.0, 15.0, 180.0, 200.0])
+    normalized = calculator.normalize_parameters(dict(zip(RSICalculator.INPUT_FIELDS, row)))
+    assert list(normalized) == list(RSICalculator.PARAMETERS)
+    assert np.isclose(normalized["lfm"], 0.5) and np.isclose(normalized["fbd"], 0.5)
+    assert np.array_equal(calculator.normalize_array(row)[0], list(normalized.values()))
@@ -0,0 +1,72 @@
+"""Tests for terrain insolation"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from sylva_fire.parameters.fuel_moisture import FuelMoistureCalculator
+from sylva_fire.parameters.solar import SolarRadiationCalculator
+from sylva_fire.parameters.terrain import TerrainCalculator
+
+
+def test_tiled_insolation_matches_whole_grid(tmp_path):
+    """Test that the tiled, cached insolation raster equals a whole-grid computation."""
+    rows, cols = np.mgrid[0:70, 0:90]
+    dem = (300 * np.sin(cols / 20) * np.cos(rows / 25) + 500).astype(np.float32)
+    dem_path = str(tmp_path / "dem.npy")
+    np.save(dem_path, dem)
+
+    calculator = SolarRadiationCalculator()
+    tiled = calculator.insolation_raster(dem_path, 30.0, 38.0, 200, max_distance=600,
+                                         tile_shape=(32, 40), workers=2)
+
+    terrain = TerrainCalculator().calculate_slope_aspect(dem, 30.0)
+    horizon = calculator.horizon_angles(dem, 30.0, max_distance=600)
+    whole = calculator.hourly_insolation(terrain["slope_degrees"], terrain["aspect"], 38.0, 200,
+                                         horizon.astype(np.float16))
+    assert tiled.shape == (24,) + dem.shape
+    assert np.array_equal(np.asarray(tiled), whole.astype(np.float16))
+
+
+def test_cache_dir_rebuilt_for_new_settings(tmp_path):
+    """Test that horizon and insolation caches in one cache_dir follow the sector count and distance."""
+    rows, cols = np.mgrid[0:30, 0:36]
+    dem = (150 * np.sin(cols / 8) * np.cos(rows / 9) + 400).astype(np.float32)
+    dem_path = str(tmp_path / "dem.npy")
+    np.save(dem_path, dem)
+    cache_dir = str(tmp_path / "solar")
+
+    calculator = SolarRadiationCalculator()
+    for n_sectors, max_distance in [(8, 300.0), (16, 300.0), (16, 150.0)]:
+        horizon = calculator.horizon_raster(dem_path, 30.0, n_sectors, max_distance, cache_dir)
+        expected = calculator.horizon_angles(dem, 30.0, n_sectors, max_distance).astype(np.float16)
+        assert np.array_equal(np.asarray(horizon), expected, equal_nan=True)
+
+        insolation = calculator.insolation_raster(dem_path, 30.0, 40.0, 180, cache_dir,
+                                                  n_sectors, max_distance)
+        terrain = TerrainCalculator().calculate_slope_aspect(dem, 30.0)
+        whole = calculator.hourly_insolation(terrain["slope_degrees"], terrain["aspect"], 40.0, 180, expected)
+        assert np.array_equal(np.asarray(insolation), whole.astype(np.float16))
+
+
+def test_insolation_norm():
+    """Test that insolation is scaled by the grid maximum or a given reference and clipped to 0-1."""
+    calculator = TerrainCalculator()
+    insolation = np.array([[0.0, 250.0], [500.0, np.nan]])
+    norm = calculator.calculate_insolation_norm(insolation)
+    assert np.allclose(norm[0], [0.0, 0.5]) and norm[1, 0] == 1.0 and np.isnan(norm[1, 1])
+    assert np.allclose(calculator.calculate_insolation_norm(insolation, reference=400.0)[:, 0], [0.0, 1.0])
+
+
+def test_solar_correction_of_dead_fuel_moisture():
+    """Test that shading adds a linear share of the correction and night cells are unchanged."""
+    calculator = FuelMoistureCalculator()
+    dfm = np.full(5, 8.0)
+    insolation = np.array([800.0, 1000.0, 400.0, 0.0, 0.0])
+    reference = np.array([800.0, 800.0, 800.0, 800.0, 0.0])
+    corrected = calculator.apply_solar_correction(dfm, insolation, reference)
+    full = FuelMoistureCalculator.SHADING_MOISTURE_CORRECTION
+    assert np.allclose(corrected, [8.0, 8.0, 8.0 + full / 2, 8.0 + full, 8.0])
+    assert np.allclose(calculator.apply_solar_correction(dfm, insolation, reference, 5.0)[3], 13.0)
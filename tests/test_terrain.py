@@ -0,0 +1,71 @@
+"""Tests for slope and aspect grids"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from sylva_fire.parameters.terrain import TerrainCalculator
+
+
+def test_plane_slope_and_aspect():
+    """Test slope and aspect of tilted planes (rows run north to south)."""
+    rows, cols = np.mgrid[0:12, 0:15].astype(float)
+    calculator = TerrainCalculator()
+    for method in TerrainCalculator.SLOPE_METHODS:
+        # Rising 2 m per 10 m cell to the east: 20 % slope facing west
+        east = calculator.calculate_slope_aspect(2.0 * cols, 10.0, method)
+        assert np.allclose(east["slope_percent"][1:-1, 1:-1], 20.0)
+        assert np.allclose(east["slope_degrees"][1:-1, 1:-1], np.degrees(np.arctan(0.2)))
+        assert np.allclose(east["aspect"][1:-1, 1:-1], 270.0)
+
+        # Rising 3 m per cell to the south: 30 % slope facing north
+        south = calculator.calculate_slope_aspect(3.0 * rows, 10.0, method)
+        assert np.allclose(south["slope_percent"][1:-1, 1:-1], 30.0)
+        assert np.allclose(south["aspect"][1:-1, 1:-1] % 360.0, 0.0)
+
+        flat = calculator.calculate_slope_aspect(np.full((5, 5), 120.0), 10.0, method)
+        assert np.all(flat["slope_degrees"] == 0.0) and np.all(np.isnan(flat["aspect"]))
+
+
+def test_tiled_raster_matches_whole_grid(tmp_path):
+    """Test that the tiled, threaded, cached terrain rasters equal the whole-grid result."""
+    rows, cols = np.mgrid[0:83, 0:97]
+    rng = np.random.default_rng(10)
+    dem = (200 * np.sin(cols / 15) * np.cos(rows / 11) + rng.normal(0, 2, rows.shape)).astype(np.float32)
+    dem_path = str(tmp_path / "dem.npy")
+    np.save(dem_path, dem)
+
+    calculator = TerrainCalculator()
+    for method in TerrainCalculator.SLOPE_METHODS:
+        cache_dir = str(tmp_path / f"cache_{method}")
+        tiled = calculator.calculate_terrain_raster(dem_path, 25.0, method, cache_dir,
+                                                    tile_shape=(20, 32), workers=3)
+        whole = calculator.calculate_slope_aspect(dem, 25.0, method)
+        for layer in TerrainCalculator.TERRAIN_LAYERS:
+            assert np.array_equal(tiled[layer], whole[layer], equal_nan=True), (method, layer)
+
+        assert os.path.exists(os.path.join(cache_dir, "manifest.json"))
+        cached = calculator.calculate_terrain_raster(dem_path, 25.0, method, cache_dir)
+        assert np.array_equal(cached["slope_degrees"], whole["slope_degrees"])
+
+
+def test_cache_recomputed_when_settings_or_dem_change(tmp_path):
+    """Test that a shared cache_dir is rebuilt for a new cell size, method or DEM."""
+    rows, cols = np.mgrid[0:20, 0:24].astype(np.float32)
+    dem_path = str(tmp_path / "dem.npy")
+    np.save(dem_path, 3.0 * cols)
+    cache_dir = str(tmp_path / "cache")
+    calculator = TerrainCalculator()
+
+    coarse = calculator.calculate_terrain_raster(dem_path, 30.0, cache_dir=cache_dir)
+    assert np.allclose(coarse["slope_percent"][1:-1, 1:-1], 10.0)
+    fine = calculator.calculate_terrain_raster(dem_path, 1.0, cache_dir=cache_dir)
+    assert np.allclose(fine["slope_percent"][1:-1, 1:-1], 300.0)
+    other = calculator.calculate_terrain_raster(dem_path, 1.0, "zevenbergen_thorne", cache_dir)
+    assert np.allclose(other["slope_percent"][1:-1, 1:-1], 300.0)
+
+    np.save(dem_path, 3.0 * rows)
+    north = calculator.calculate_terrain_raster(dem_path, 1.0, "zevenbergen_thorne", cache_dir)
+    assert np.allclose(north["aspect"][1:-1, 1:-1] % 360.0, 0.0)
@@ -0,0 +1,54 @@
+"""Tests for the energy balance series"""
+
+import sys
+import os
+import warnings
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+
+from sylva_fire.core.thermodynamics import ThermodynamicContinuum
+
+
+def test_series_matches_scalar_energy_balance():
+    """Test that the series ratio and sink equal the scalar energy balance step by step."""
+    model = ThermodynamicContinuum()
+    rng = np.random.default_rng(12)
+    heat = rng.uniform(0.0, 8000.0, (24, 3, 4))
+    moisture = rng.uniform(2.0, 40.0, (24, 3, 4))
+    series = model.calculate_energy_balance_series(heat, moisture, threshold=1.5, timestep_hours=0.5)
+
+    for index in np.ndindex(heat.shape):
+        scalar = model.calculate_energy_balance(heat[index], moisture[index])
+        assert np.isclose(series["energy_balance_ratio"][index], scalar["energy_balance_ratio"])
+        assert np.isclose(series["total_heat_sink_kJ_kg"][index], scalar["total_heat_sink_kJ_kg"])
+
+    ratio = series["energy_balance_ratio"]
+    exceeded = ratio > 1.5
+    assert np.allclose(series["exceedance_hours"], exceeded.sum(axis=0) * 0.5)
+    assert np.allclose(series["cumulative_exceedance_hours"][-1], series["exceedance_hours"])
+    assert np.allclose(series["max_energy_balance_ratio"], ratio.max(axis=0))
+    for cell in np.ndindex(ratio.shape[1:]):
+        hits = np.flatnonzero(exceeded[(slice(None),) + cell])
+        first = series["first_exceedance_hour"][cell]
+        assert (np.isnan(first) and len(hits) == 0) or first == hits[0] * 0.5
+
+
+def test_empty_and_missing_series():
+    """Test that an empty time axis and all-NaN cells give NaN maxima without warnings."""
+    model = ThermodynamicContinuum()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        empty = model.calculate_energy_balance_series(np.empty((0, 5)), 10.0)
+        assert np.all(empty["exceedance_hours"] == 0) and empty["exceedance_hours"].shape == (5,)
+        assert np.all(np.isnan(empty["first_exceedance_hour"]))
+        assert np.all(np.isnan(empty["max_energy_balance_ratio"]))
+
+        heat = np.array([[np.nan, 3000.0], [np.nan, np.nan]])
+        missing = model.calculate_energy_balance_series(heat, 10.0)
+        assert np.isnan(missing["max_energy_balance_ratio"][0])
+        assert missing["max_energy_balance_ratio"][1] > 0
+
+    with pytest.raises(ValueError):
+        model.calculate_energy_balance_series(3000.0, 10.0)
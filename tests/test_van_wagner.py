@@ -0,0 +1,53 @@
+"""Tests for the gridded Van Wagner crown fire assessment"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from sylva_fire.core.van_wagner import VanWagnerCrownFire
+
+
+def test_array_matches_scalar_assessment():
+    """Test that the raster mode agrees with assess_crown_fire_potential over a CBD/CBH/ROS grid."""
+    model = VanWagnerCrownFire()
+    cbd, cbh, ros = np.meshgrid([0.0, 0.05, 0.1, 0.2, 0.35], [0.5, 2.0, 6.0, 12.0],
+                                [0.5, 5.0, 15.0, 40.0], indexing="ij")
+    fmc = 100.0
+    # Surface intensity grows with spread rate as in Byram's I = H·w·R
+    intensity = 150.0 * ros
+    crown_ros = 2.0 * ros
+
+    grid = model.assess_crown_fire_array(intensity, ros, cbh, fmc, cbd, crown_ros)
+    fire_type = grid["crown_fire_type"]
+    assert set(np.unique(fire_type)) == {model.SURFACE_FIRE, model.PASSIVE_CROWN_FIRE, model.ACTIVE_CROWN_FIRE}
+
+    for index in np.ndindex(cbd.shape):
+        scalar = model.assess_crown_fire_potential(intensity[index], cbh[index], fmc, cbd[index])
+        assert np.isclose(grid["critical_intensity_kW_m"][index], scalar["critical_intensity_kW_m"])
+        if not scalar["initiation_possible"]:
+            assert fire_type[index] == model.SURFACE_FIRE
+            assert model.CROWN_FIRE_TYPES[fire_type[index]] == scalar["crown_fire_status"]
+            assert grid["crown_fraction_burned"][index] == 0.0
+            continue
+        active = cbd[index] > 0 and crown_ros[index] >= model.CRITICAL_MASS_FLOW_RATE / cbd[index]
+        assert fire_type[index] == (model.ACTIVE_CROWN_FIRE if active else model.PASSIVE_CROWN_FIRE)
+        assert 0.0 <= grid["crown_fraction_burned"][index] < 1.0
+
+
+def test_crown_fraction_burned():
+    """Test CFB at the initiation threshold and its growth with spread rate."""
+    model = VanWagnerCrownFire()
+    critical = model.calculate_critical_intensity(4.0, 100.0)
+    ros = np.array([2.0, 4.0, 8.0, 16.0])
+    # Intensity proportional to ROS with initiation exactly at R = 2
+    grid = model.assess_crown_fire_array(critical * ros / 2.0, ros, 4.0, 100.0, 0.15)
+    expected = 1.0 - np.exp(-model.CFB_RATE_COEFFICIENT * (ros - 2.0))
+    assert np.allclose(grid["crown_fraction_burned"], expected)
+    assert np.isclose(grid["critical_active_ros_m_min"][0], 3.0 / 0.15)
+
+    single = model.assess_crown_fire_array(np.float32(5000.0), 10.0, 2.0, 100.0, 0.0)
+    assert single["crown_fraction_burned"].dtype == np.float32
+    assert np.isinf(single["critical_active_ros_m_min"])
+    assert single["crown_fire_type"] == model.PASSIVE_CROWN_FIRE